@@ -35,12 +35,19 @@ def create_app(config_name=None):
     # Initialize configuration
     config_class.init_app(app)
 
-    # Setup logging
+    # Setup logging (request summaries and sampled traces pass a stricter root level)
+    logger_levels = {'requests': app.config.get('REQUEST_LOG_LEVEL', 'INFO')}
+    if app.config.get('RIOT_TRACE_ENABLED', False):
+        logger_levels['riot.trace'] = 'INFO'
     setup_logging(
         app=app,
         log_level=app.config.get('LOG_LEVEL', 'INFO'),
         enable_console=True,
-        enable_file=True
+        enable_file=True,
+        use_queue=app.config.get('LOG_QUEUE_ENABLED', False),
+        queue_size=app.config.get('LOG_QUEUE_SIZE', 10000),
+        json_format=app.config.get('LOG_JSON', False),
+        logger_levels=logger_levels
     )
 
     logger.info(f"Starting Clash Finder | Environment: {config_name or 'default'}")
@@ -79,15 +86,48 @@ def initialize_extensions(app):
         app: Flask application instance
     """
     from app.services import cache, rate_limiter, auto_updater, init_updater
+    from app.services.api.session_pool import session_pool
+    from app.services.api.rate_governor import rate_governor
+    from app.services.api.request_scheduler import request_scheduler
+    from app.services.api.request_trace import request_tracer
+    from app.services.match_store import match_store
+    from app.services.metrics import metrics
+    from app.services.riot_api import init_fetch_slots
 
     # Initialize CSRF protection
     csrf.init_app(app)
     logger.info("CSRF protection initialized")
 
+    # Initialize Prometheus metrics (/metrics, aggregated across workers)
+    metrics.init_app(app)
+
     # Initialize cache
     cache.init_app(app)
     logger.info("Cache initialized")
 
+    # Initialize persistent match store
+    match_store.init_app(app)
+    logger.info("Match store initialized")
+
+    # Initialize Riot HTTP session pool
+    session_pool.init_app(app)
+    logger.info("HTTP session pool initialized")
+
+    # Size the process-wide cap on concurrent match fetches
+    init_fetch_slots(app.config.get('RIOT_API_MAX_CONCURRENCY', 8))
+
+    # Initialize outbound Riot rate governor
+    rate_governor.init_app(app)
+    logger.info("Riot rate governor initialized")
+
+    # Initialize Riot request priority scheduler
+    request_scheduler.init_app(app)
+    logger.info("Riot request scheduler initialized")
+
+    # Initialize sampled Riot request tracing (off unless RIOT_TRACE_ENABLED)
+    request_tracer.init_app(app)
+    logger.info("Riot request tracer initialized")
+
     # Initialize rate limiter
     rate_limiter.init_app(app)
     logger.info("Rate limiter initialized")
@@ -160,7 +200,8 @@ def register_context_processors(app):
     """Register template context processors."""
     from config import DDRAGON_VERSION
     from config.game_constants import get_queue_name, get_game_mode_name
-    from config.champion_mapping import get_champion_icon_url  # DODAJ
+    from config.champion_mapping import get_champion_icon_url, get_champion_image_name  # DODAJ
+    from app.services.asset_mirror import asset_mirror
     from app.utils.formatters import (
         format_game_duration,
         format_kda,
@@ -179,6 +220,9 @@ def register_context_processors(app):
             'get_queue_name': get_queue_name,
             'get_game_mode_name': get_game_mode_name,
             'get_champion_icon_url': get_champion_icon_url,  # DODAJ
+            'get_champion_image_name': get_champion_image_name,
+            'game_icon': asset_mirror.icon,
+            'game_icon_stylesheet': asset_mirror.stylesheet_url,
             'format_game_duration': format_game_duration,
             'format_kda': format_kda,
             'calculate_kda_ratio': calculate_kda_ratio,
@@ -208,9 +252,15 @@ def register_request_handlers(app):
     Args:
         app: Flask application instance
     """
-    from flask import request
+    from flask import request, before_render_template, template_rendered
     from app.utils.helpers import time_ago
+    from app.utils.request_stats import begin_request, end_request, current_request_stats
+    from app.services.metrics import observe_request
+    from app.services.resource_manager import resource_manager
     from datetime import datetime
+    import time
+
+    request_logger = get_logger('requests')
 
     @app.before_request
     def before_request():
@@ -218,6 +268,27 @@ def register_request_handlers(app):
         # Store request start time for timing
         request.start_time = datetime.now()
 
+        # Count Riot calls, cache lookups and waits made for this request
+        begin_request(app.config.get('RIOT_CALLS_PER_REQUEST_MAX') or None)
+
+        # Serve the whole request from one game data patch, even if an update lands meanwhile
+        if request.endpoint != 'static':
+            resource_manager.pin()
+
+    # Time spent rendering templates (render_template brackets each top-level render)
+    @before_render_template.connect_via(app, weak=False)
+    def template_started(sender, template, context, **extra):
+        stats = current_request_stats()
+        if stats is not None:
+            stats.render_started = time.perf_counter()
+
+    @template_rendered.connect_via(app, weak=False)
+    def template_finished(sender, template, context, **extra):
+        stats = current_request_stats()
+        if stats is not None and stats.render_started is not None:
+            stats.add_time('render', time.perf_counter() - stats.render_started)
+            stats.render_started = None
+
     @app.after_request
     def after_request(response):
         """After request handler."""
@@ -235,8 +306,38 @@ def register_request_handlers(app):
             duration = (datetime.now() - request.start_time).total_seconds()
             response.headers['X-Request-Duration'] = f"{duration:.3f}"
 
+        # One summary line per request (fields become JSON keys with LOG_JSON)
+        stats = current_request_stats()
+        if stats is not None and request.endpoint != 'static':
+            counts = stats.as_dict()
+            duration_ms = round(stats.elapsed_ms, 2)
+            observe_request(request.endpoint, request.method, response.status_code, duration_ms / 1000)
+            if app.config.get('SERVER_TIMING_ENABLED', True):
+                # Streamed bodies are generated later; their header covers setup only
+                response.headers['Server-Timing'] = stats.server_timing()
+            request_logger.info(
+                f"Request complete | {request.method} {request.path} | Endpoint: {request.endpoint} | "
+                f"Status: {response.status_code} | Time: {duration_ms / 1000:.3f}s | "
+                f"Riot calls: {counts['riot_calls']} | Cache hits: {counts['cache_hits']} | "
+                f"Riot wait: {counts['riot_ms']:.0f}ms | Render: {counts['render_ms']:.0f}ms",
+                extra={
+                    'endpoint': request.endpoint,
+                    'method': request.method,
+                    'path': request.path,
+                    'status': response.status_code,
+                    'duration_ms': duration_ms,
+                    **counts
+                }
+            )
+
         return response
 
+    @app.teardown_request
+    def teardown_request(error=None):
+        """Stop per-request accounting and release the game data snapshot."""
+        end_request()
+        resource_manager.unpin()
+
     @app.teardown_appcontext
     def teardown_appcontext(error=None):
         """Teardown app context handler."""
@@ -274,7 +375,9 @@ def register_cli_commands(app):
             click.echo(f"{status} {resource}")
 
         if all(results.values()):
-            click.echo("All resources downloaded successfully!")
+            from app.services.resource_manager import resource_manager
+            compiled = resource_manager.compile_game_data(resource_downloader.version)
+            click.echo(f"All resources downloaded successfully! Compiled: {compiled}")
         else:
             click.echo("Some resources failed to download.")
 
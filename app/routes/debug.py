@@ -106,6 +106,76 @@ def rate_limit_status():
         }), 500
 
 
+@debug_bp.route('/http-pool')
+@conditional_rate_limit(per_minute=60, per_hour=300)
+def http_pool_stats():
+    """
+    Get Riot API connection pool statistics.
+
+    Returns:
+        JSON with per-host connection hit/miss counters
+    """
+    from app.services.api.session_pool import session_pool
+
+    return jsonify(session_pool.get_stats())
+
+
+@debug_bp.route('/rate-governor')
+@conditional_rate_limit(per_minute=60, per_hour=300)
+def rate_governor_stats():
+    """
+    Get outbound Riot rate governor statistics.
+
+    Returns:
+        JSON with learned limits and current bucket usage
+    """
+    from app.services.api.rate_governor import rate_governor
+
+    return jsonify(rate_governor.get_stats())
+
+
+@debug_bp.route('/scheduler')
+@conditional_rate_limit(per_minute=60, per_hour=300)
+def scheduler_stats():
+    """
+    Get Riot request scheduler statistics.
+
+    Returns:
+        JSON with queue depth and wait times per priority class
+    """
+    from app.services.api.request_scheduler import request_scheduler
+
+    return jsonify(request_scheduler.get_stats())
+
+
+@debug_bp.route('/log-queue')
+@conditional_rate_limit(per_minute=60, per_hour=300)
+def log_queue_stats():
+    """
+    Get queued logging pipeline statistics.
+
+    Returns:
+        JSON with queue depth and dropped record count
+    """
+    from config.logging_config import get_log_queue_stats
+
+    return jsonify(get_log_queue_stats())
+
+
+@debug_bp.route('/game-data')
+@conditional_rate_limit(per_minute=60, per_hour=300)
+def game_data_stats():
+    """
+    Get game data snapshot statistics.
+
+    Returns:
+        JSON with the published version and how many snapshots are alive
+    """
+    from app.services.resource_manager import resource_manager
+
+    return jsonify(resource_manager.get_stats())
+
+
 @debug_bp.route('/health')
 def health_check():
     """
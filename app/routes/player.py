@@ -4,8 +4,12 @@ Player routes for Clash Finder - MINIMAL ASYNC MODIFICATION.
 Keeps original structure but loads first matches asynchronously.
 """
 
+import json
 import time
-from flask import Blueprint, render_template, request, jsonify, current_app
+from flask import (
+    Blueprint, render_template, request, jsonify, current_app,
+    Response, stream_with_context
+)
 
 
 def _safe_int(value, default=0):
@@ -18,9 +22,14 @@ from config import DDRAGON_VERSION
 from config.logging_config import get_logger, log_player_search, log_error_with_context
 from app.utils.decorators import conditional_rate_limit, log_request_time
 from app.utils.formatters import unslugify_server, decode_riot_id
+from app.services.api.request_scheduler import Priority, riot_priority
 from app.services.riot_api import (
     display_matches,
+    display_matches_batch,
     display_matches_by_value,
+    iter_match_details,
+    process_match_for_player,
+    get_match_ids,
     servers_to_region,
     get_account_info  # Just to verify player exists
 )
@@ -157,6 +166,7 @@ def load_initial_matches():
     per_minute=20,
     per_hour=200
 )
+@riot_priority(Priority.NORMAL)
 def load_more_matches(DDRAGON_VERSION='14.1.1'):
     """
     Load additional match entries.
@@ -241,18 +251,18 @@ def load_batch():
         return jsonify({'error': 'Missing parameters'}), 400
 
     try:
-        # Używamy tej samej funkcji co load_initial - display_matches()
-        # Cache sprawi że będzie szybko
-        all_matches = display_matches(game_name, tag_line, server)
+        # Only this batch's slice is fetched and processed; match IDs for the
+        # whole window come from the same cache entry load_initial uses
+        end_offset = offset + batch_size
+        batch_matches, total_matches = display_matches_batch(
+            game_name, tag_line, server, offset, batch_size,
+            limit=current_app.config.get('INITIAL_MATCH_LOAD', 10)
+        )
 
-        if not all_matches:
+        if not total_matches:
             logger.warning(f"No matches found for player")
             return jsonify({'matches': [], 'has_more': False, 'offset': offset})
 
-        # Wytnij tylko potrzebny fragment (slice)
-        end_offset = offset + batch_size
-        batch_matches = all_matches[offset:end_offset]
-
         if not batch_matches:
             logger.warning(f"No matches in range {offset}:{end_offset}")
             return jsonify({'matches': [], 'has_more': False, 'offset': offset})
@@ -268,21 +278,123 @@ def load_batch():
             match_cards_html.append(match_html)
 
         logger.info(
-            f"Batch loaded | Matches: {len(match_cards_html)}/{len(all_matches)} | "
+            f"Batch loaded | Matches: {len(match_cards_html)}/{total_matches} | "
             f"Offset: {offset} | Time: {time.time() - start_time:.2f}s"
         )
 
         return jsonify({
             'matches': match_cards_html,
             'total_loaded': len(match_cards_html),
-            'offset': offset + len(match_cards_html),
-            'has_more': (offset + len(match_cards_html)) < len(all_matches)
+            'offset': end_offset,
+            'has_more': end_offset < total_matches
         })
 
     except Exception as e:
         logger.error(f"Error loading batch: {e}", exc_info=True)
         return jsonify({'error': 'Internal server error'}), 500
 
+
+def _format_stream_event(event: dict, sse: bool) -> str:
+    """Serialize one stream event as an NDJSON line or an SSE message."""
+    payload = json.dumps(event, separators=(',', ':'))
+    if sse:
+        return f"event: {event['type']}\ndata: {payload}\n\n"
+    return payload + '\n'
+
+
+@player_bp.route('/stream', methods=['GET'])
+@conditional_rate_limit(
+    per_minute=30,
+    per_hour=300
+)
+def stream_matches():
+    """
+    Stream rendered match cards as each match's details arrive.
+
+    Query params: name, tag, server, offset (default 0), count (default
+    INITIAL_MATCH_LOAD), format ('ndjson' or 'sse'; SSE is also chosen
+    for ``Accept: text/event-stream``).
+
+    Events:
+        {"type": "match", "index": i, "html": "..."}   - one per card, in arrival order
+        {"type": "done", "loaded": n, "offset": o, "has_more": bool}
+        {"type": "error", "message": "..."}
+    """
+    game_name = request.args.get('name', '')
+    tag_line = request.args.get('tag', '')
+    server = request.args.get('server', '')
+    offset = max(_safe_int(request.args.get('offset'), 0), 0)
+    count = _safe_int(request.args.get('count'), current_app.config.get('INITIAL_MATCH_LOAD', 10))
+    count = min(max(count, 1), current_app.config.get('MAX_MATCHES', 100))
+
+    sse = (
+        request.args.get('format') == 'sse'
+        or request.accept_mimetypes.best == 'text/event-stream'
+    )
+
+    if not all([server, game_name]):
+        return jsonify({'error': 'Missing required parameters'}), 400
+
+    logger.info(
+        f"Streaming matches | Player: {game_name}#{tag_line} | Offset: {offset} | Count: {count}"
+    )
+
+    def generate():
+        start_time = time.time()
+        loaded = 0
+
+        try:
+            account_info = get_account_info(game_name, tag_line, server)
+            if not account_info:
+                yield _format_stream_event({'type': 'error', 'message': 'Player not found'}, sse)
+                return
+
+            puuid = account_info['puuid']
+            match_ids = get_match_ids(puuid, server, start=offset, count=count)
+
+            for index, match_data in iter_match_details(match_ids or [], server):
+                if not match_data:
+                    continue
+
+                match = process_match_for_player(match_data, puuid, game_name, tag_line, server)
+                if not match:
+                    continue
+
+                html = render_template(
+                    'components/match_card.html',
+                    match=match,
+                    ddragon_version=DDRAGON_VERSION
+                )
+                loaded += 1
+
+                if loaded == 1:
+                    logger.debug(f"First card streamed | Time: {time.time() - start_time:.2f}s")
+
+                yield _format_stream_event({'type': 'match', 'index': offset + index, 'html': html}, sse)
+
+            yield _format_stream_event({
+                'type': 'done',
+                'loaded': loaded,
+                'offset': offset + len(match_ids or []),
+                'has_more': len(match_ids or []) == count
+            }, sse)
+
+            logger.info(f"Stream complete | Matches: {loaded} | Time: {time.time() - start_time:.2f}s")
+
+        except Exception as e:
+            logger.error(f"Error streaming matches: {e}", exc_info=True)
+            yield _format_stream_event({'type': 'error', 'message': 'Internal server error'}, sse)
+
+    response = Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream' if sse else 'application/x-ndjson'
+    )
+    # Flush each event through proxies (nginx buffers responses by default)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
 # Alternative route for backwards compatibility
 @player_bp.route('/', methods=['POST'])
 def load_more_matches_alt():
@@ -291,6 +403,7 @@ def load_more_matches_alt():
 
 
 @player_bp.route('/load_more_simple', methods=['GET'])
+@riot_priority(Priority.NORMAL)
 def load_more_simple():
     try:
         from app.services.riot_api import process_raw_matches_for_player
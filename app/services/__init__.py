@@ -20,7 +20,8 @@ from app.services.riot_api import (
     server_codes,
     RiotAPIError,
     RateLimitError,
-    NotFoundError
+    NotFoundError,
+    CallBudgetExceeded
 )
 
 from app.services.cache import (
@@ -30,6 +31,38 @@ from app.services.cache import (
     get_cache_stats
 )
 
+from app.services.api.session_pool import (
+    session_pool,
+    SessionPool
+)
+
+from app.services.api.rate_governor import (
+    rate_governor,
+    RateGovernor
+)
+
+from app.services.api.request_scheduler import (
+    request_scheduler,
+    RequestScheduler,
+    Priority,
+    request_priority
+)
+
+from app.services.api.request_trace import (
+    request_tracer,
+    RequestTracer
+)
+
+from app.services.metrics import (
+    metrics,
+    Metrics
+)
+
+from app.services.match_store import (
+    match_store,
+    MatchStore
+)
+
 from app.services.rate_limiter import (
     rate_limiter,
     rate_limit,
@@ -39,7 +72,8 @@ from app.services.rate_limiter import (
 
 from app.services.resource_manager import (
     resource_manager,
-    ResourceManager
+    ResourceManager,
+    GameDataSnapshot
 )
 
 from app.services.resource_downloader import (
@@ -47,6 +81,11 @@ from app.services.resource_downloader import (
     ResourceDownloader
 )
 
+from app.services.asset_mirror import (
+    asset_mirror,
+    AssetMirror
+)
+
 from app.services.auto_updater import (
     auto_updater,
     init_updater,
@@ -71,6 +110,7 @@ __all__ = [
     'RiotAPIError',
     'RateLimitError',
     'NotFoundError',
+    'CallBudgetExceeded',
 
     # Cache
     'cache',
@@ -78,6 +118,32 @@ __all__ = [
     'invalidate_cache',
     'get_cache_stats',
 
+    # HTTP Session Pool
+    'session_pool',
+    'SessionPool',
+
+    # Outbound Riot Rate Governor
+    'rate_governor',
+    'RateGovernor',
+
+    # Riot Request Scheduler
+    'request_scheduler',
+    'RequestScheduler',
+    'Priority',
+    'request_priority',
+
+    # Riot Request Tracing
+    'request_tracer',
+    'RequestTracer',
+
+    # Prometheus Metrics
+    'metrics',
+    'Metrics',
+
+    # Match Store
+    'match_store',
+    'MatchStore',
+
     # Rate Limiter
     'rate_limiter',
     'rate_limit',
@@ -87,11 +153,16 @@ __all__ = [
     # Resource Manager
     'resource_manager',
     'ResourceManager',
+    'GameDataSnapshot',
 
     # Resource Downloader
     'resource_downloader',
     'ResourceDownloader',
 
+    # Icon Mirror
+    'asset_mirror',
+    'AssetMirror',
+
     # Auto Updater
     'auto_updater',
     'init_updater',
@@ -0,0 +1,402 @@
+# app/services/api/rate_governor.py
+"""
+Outbound Riot API rate governor.
+Schedules calls against Riot's application and method rate limits so
+requests wait for budget locally instead of being answered with 429.
+
+Limits are learned from the X-App-Rate-Limit / X-Method-Rate-Limit
+response headers and the matching *-Count headers keep local counters
+in step with Riot's. Each "limit:window" pair is a bucket of ``limit``
+tokens that refills completely ``window`` seconds after its first token
+is spent - the same fixed-window accounting Riot applies.
+"""
+
+import asyncio
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from config.logging_config import get_logger
+
+logger = get_logger('services.api.rate_governor')
+
+# Path suffix -> method key; method limits are tracked per endpoint, not per URL
+METHOD_PATTERNS = [
+    (re.compile(r'/riot/account/v1/accounts/by-riot-id/[^/]+/[^/]+$'), 'account-v1.by-riot-id'),
+    (re.compile(r'/riot/account/v1/accounts/by-puuid/[^/]+$'), 'account-v1.by-puuid'),
+    (re.compile(r'/lol/summoner/v4/summoners/by-puuid/[^/]+$'), 'summoner-v4.by-puuid'),
+    (re.compile(r'/lol/summoner/v4/summoners/[^/]+$'), 'summoner-v4.by-id'),
+    (re.compile(r'/lol/match/v5/matches/by-puuid/[^/]+/ids$'), 'match-v5.ids-by-puuid'),
+    (re.compile(r'/lol/match/v5/matches/[^/]+/timeline$'), 'match-v5.timeline'),
+    (re.compile(r'/lol/match/v5/matches/[^/]+$'), 'match-v5.match'),
+    (re.compile(r'/lol/league/v4/entries/by-summoner/[^/]+$'), 'league-v4.entries-by-summoner'),
+    (re.compile(r'/lol/champion-mastery/v4/champion-masteries/by-puuid/[^/]+$'), 'champion-mastery-v4.by-puuid'),
+    (re.compile(r'/lol/spectator/v5/active-games/by-summoner/[^/]+$'), 'spectator-v5.active-game'),
+    (re.compile(r'/lol/clash/v1/players/by-summoner/[^/]+$'), 'clash-v1.players-by-summoner'),
+    (re.compile(r'/lol/clash/v1/teams/[^/]+$'), 'clash-v1.team'),
+]
+
+
+def parse_rate_limit(value: Optional[str]) -> List[Tuple[int, int]]:
+    """
+    Parse a Riot rate limit header ('20:1,100:120') into (count, window) pairs.
+
+    Works for both limit headers and *-Count headers.
+    """
+    pairs = []
+    for part in (value or '').split(','):
+        count, _, window = part.strip().partition(':')
+        try:
+            pairs.append((int(count), int(window)))
+        except ValueError:
+            continue
+    return pairs
+
+
+class _Bucket:
+    """Fixed-window token bucket for one "limit:window" pair."""
+
+    __slots__ = ('limit', 'window', 'used', 'reset_at')
+
+    def __init__(self, limit: int, window: int):
+        self.limit = limit
+        self.window = window
+        self.used = 0
+        self.reset_at = 0.0
+
+    def wait_time(self, now: float, headroom: float = 0.0) -> float:
+        """
+        Seconds until a token is available (0 = available now).
+
+        ``headroom`` is the fraction of the window kept free for other callers.
+        """
+        if now >= self.reset_at:
+            return 0.0
+        usable = self.limit - min(int(self.limit * headroom), self.limit - 1)
+        if self.used < usable:
+            return 0.0
+        return self.reset_at - now
+
+    def consume(self, now: float, margin: float):
+        if now >= self.reset_at:
+            self.used = 0
+            self.reset_at = now + self.window + margin
+        self.used += 1
+
+    def sync(self, used: int, now: float, margin: float):
+        """Adopt Riot's count for this window if it is ahead of ours."""
+        if now >= self.reset_at:
+            self.used = 0
+            self.reset_at = now + self.window + margin
+        self.used = max(self.used, used)
+
+    def block(self, until: float):
+        """Spend the bucket until ``until`` (after a 429)."""
+        self.used = self.limit
+        self.reset_at = max(self.reset_at, until)
+
+
+class _Scope:
+    """Buckets for one application (host) or method (host + endpoint) scope."""
+
+    __slots__ = ('buckets', 'spec')
+
+    def __init__(self, limits: List[Tuple[int, int]]):
+        self.spec: List[Tuple[int, int]] = []
+        self.buckets: List[_Bucket] = []
+        self.set_limits(limits)
+
+    def set_limits(self, limits: List[Tuple[int, int]]):
+        """Replace limits, keeping counters of windows that still exist."""
+        if limits == self.spec:
+            return
+
+        existing = {(b.limit, b.window): b for b in self.buckets}
+        by_window = {b.window: b for b in self.buckets}
+        buckets = []
+        for limit, window in limits:
+            bucket = existing.get((limit, window))
+            if bucket is None:
+                bucket = _Bucket(limit, window)
+                previous = by_window.get(window)
+                if previous is not None:
+                    bucket.used, bucket.reset_at = previous.used, previous.reset_at
+            buckets.append(bucket)
+
+        self.spec = list(limits)
+        self.buckets = buckets
+
+    def wait_time(self, now: float, headroom: float = 0.0) -> float:
+        return max((b.wait_time(now, headroom) for b in self.buckets), default=0.0)
+
+
+class RateGovernor:
+    """Thread-safe outbound limiter keyed by routing host and API method."""
+
+    def __init__(
+            self,
+            app_limits: str = '20:1,100:120',
+            margin: float = 0.1,
+            max_wait: float = 10.0,
+            enabled: bool = True
+    ):
+        """
+        Initialize rate governor.
+
+        Args:
+            app_limits: Application limits assumed until Riot reports them
+            margin: Seconds added to every window (network latency / clock skew)
+            max_wait: Longest a call may wait for budget
+            enabled: Whether calls are governed at all
+        """
+        self._lock = threading.Lock()
+        self._app_scopes: Dict[str, _Scope] = {}
+        self._method_scopes: Dict[Tuple[str, str], _Scope] = {}
+        self.default_app_limits = parse_rate_limit(app_limits)
+        self.margin = margin
+        self.max_wait = max_wait
+        self.enabled = enabled
+
+        self._granted = 0
+        self._delayed = 0
+        self._rejected = 0
+        self._throttled = 0
+
+    def init_app(self, app):
+        """Configure governor from Flask app config."""
+        with self._lock:
+            self._app_scopes.clear()
+            self._method_scopes.clear()
+            self.enabled = app.config.get('RIOT_RATE_GOVERNOR_ENABLED', True)
+            self.default_app_limits = parse_rate_limit(app.config.get('RIOT_APP_RATE_LIMIT', '20:1,100:120'))
+            self.margin = app.config.get('RIOT_RATE_LIMIT_MARGIN', 0.1)
+            self.max_wait = app.config.get('RIOT_RATE_LIMIT_MAX_WAIT', 10.0)
+
+        logger.info(
+            f"Riot rate governor initialized | Enabled: {self.enabled} | "
+            f"App limits: {self.default_app_limits} | Max wait: {self.max_wait}s"
+        )
+
+    @staticmethod
+    def classify(url: str) -> Tuple[str, str]:
+        """
+        Get the (host, method) scope of a Riot API URL.
+
+        Args:
+            url: Full request URL
+
+        Returns:
+            Tuple of (network location, method key)
+        """
+        parsed = urlparse(url)
+        for pattern, method in METHOD_PATTERNS:
+            if pattern.search(parsed.path):
+                return parsed.netloc, method
+
+        # Unknown endpoint - group by its first four path segments
+        return parsed.netloc, '/'.join(parsed.path.split('/')[:5])
+
+    def _scopes(self, host: str, method: str) -> Tuple[_Scope, Optional[_Scope]]:
+        app_scope = self._app_scopes.get(host)
+        if app_scope is None:
+            app_scope = self._app_scopes[host] = _Scope(self.default_app_limits)
+        # Method limits are unknown until the first response for the endpoint
+        return app_scope, self._method_scopes.get((host, method))
+
+    def reserve(self, host: str, method: str, headroom: float = 0.0) -> float:
+        """
+        Take a token for a call if one is available.
+
+        Non-blocking; usable from sync and async code alike.
+
+        Args:
+            host: Network location
+            method: Method key (see classify)
+            headroom: Fraction of every window that must stay unused (for low priority work)
+
+        Returns:
+            0 if the call may go ahead now, otherwise seconds to wait before retrying
+        """
+        if not self.enabled:
+            return 0.0
+
+        now = time.monotonic()
+        with self._lock:
+            app_scope, method_scope = self._scopes(host, method)
+            wait = app_scope.wait_time(now, headroom)
+            if method_scope is not None:
+                wait = max(wait, method_scope.wait_time(now, headroom))
+
+            if wait > 0:
+                return wait
+
+            for bucket in app_scope.buckets:
+                bucket.consume(now, self.margin)
+            if method_scope is not None:
+                for bucket in method_scope.buckets:
+                    bucket.consume(now, self.margin)
+
+            self._granted += 1
+            return 0.0
+
+    def acquire(self, host: str, method: str, max_wait: Optional[float] = None) -> bool:
+        """
+        Block until a call may be made.
+
+        Args:
+            host: Network location
+            method: Method key (see classify)
+            max_wait: Longest to wait (default: configured max_wait)
+
+        Returns:
+            True if a token was taken, False if budget did not free up in time
+        """
+        deadline = time.monotonic() + (self.max_wait if max_wait is None else max_wait)
+        delayed = False
+
+        while True:
+            wait = self.reserve(host, method)
+            if wait == 0:
+                self._record_grant(delayed)
+                return True
+            if not self._can_wait(wait, deadline, host, method):
+                return False
+            delayed = True
+            time.sleep(wait)
+
+    async def acquire_async(self, host: str, method: str, max_wait: Optional[float] = None) -> bool:
+        """Async variant of acquire; waits with asyncio.sleep instead of blocking."""
+        deadline = time.monotonic() + (self.max_wait if max_wait is None else max_wait)
+        delayed = False
+
+        while True:
+            wait = self.reserve(host, method)
+            if wait == 0:
+                self._record_grant(delayed)
+                return True
+            if not self._can_wait(wait, deadline, host, method):
+                return False
+            delayed = True
+            await asyncio.sleep(wait)
+
+    def _record_grant(self, delayed: bool):
+        if delayed:
+            with self._lock:
+                self._delayed += 1
+
+    def _can_wait(self, wait: float, deadline: float, host: str, method: str) -> bool:
+        if time.monotonic() + wait > deadline:
+            with self._lock:
+                self._rejected += 1
+            logger.warning(f"Riot API budget exhausted | Host: {host} | Method: {method} | Wait: {wait:.2f}s")
+            return False
+        return True
+
+    def update(self, host: str, method: str, headers: Any):
+        """
+        Learn limits and counts from a Riot response.
+
+        Args:
+            host: Network location
+            method: Method key
+            headers: Response headers (case-insensitive mapping)
+        """
+        if not self.enabled:
+            return
+
+        app_limits = parse_rate_limit(headers.get('X-App-Rate-Limit'))
+        method_limits = parse_rate_limit(headers.get('X-Method-Rate-Limit'))
+        if not app_limits and not method_limits:
+            return
+
+        app_counts = dict((w, c) for c, w in parse_rate_limit(headers.get('X-App-Rate-Limit-Count')))
+        method_counts = dict((w, c) for c, w in parse_rate_limit(headers.get('X-Method-Rate-Limit-Count')))
+        now = time.monotonic()
+
+        with self._lock:
+            app_scope, method_scope = self._scopes(host, method)
+
+            if app_limits:
+                if app_limits != app_scope.spec:
+                    logger.info(f"Riot app rate limit learned | Host: {host} | Limits: {app_limits}")
+                app_scope.set_limits(app_limits)
+                for bucket in app_scope.buckets:
+                    if bucket.window in app_counts:
+                        bucket.sync(app_counts[bucket.window], now, self.margin)
+
+            if method_limits:
+                if method_scope is None:
+                    method_scope = self._method_scopes[(host, method)] = _Scope(method_limits)
+                    logger.debug(f"Riot method rate limit learned | {method} | Limits: {method_limits}")
+                method_scope.set_limits(method_limits)
+                for bucket in method_scope.buckets:
+                    if bucket.window in method_counts:
+                        bucket.sync(method_counts[bucket.window], now, self.margin)
+
+    def throttle(self, host: str, method: str, retry_after: float, limit_type: Optional[str] = None):
+        """
+        Hold back a scope after a 429.
+
+        Args:
+            host: Network location
+            method: Method key
+            retry_after: Seconds from the Retry-After header
+            limit_type: X-Rate-Limit-Type ('application', 'method' or 'service')
+        """
+        if not self.enabled:
+            return
+
+        until = time.monotonic() + retry_after
+        with self._lock:
+            self._throttled += 1
+            app_scope, method_scope = self._scopes(host, method)
+
+            if limit_type == 'application':
+                scope = app_scope
+            else:
+                # Method and service limits only affect this endpoint
+                if method_scope is None:
+                    method_scope = self._method_scopes[(host, method)] = _Scope([(1, 1)])
+                scope = method_scope
+
+            for bucket in scope.buckets:
+                bucket.block(until)
+
+        logger.warning(
+            f"Riot 429 | Host: {host} | Method: {method} | Type: {limit_type or 'unknown'} | "
+            f"Retry after: {retry_after}s"
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get governor statistics and current bucket usage."""
+        now = time.monotonic()
+
+        def describe(scope: _Scope) -> List[Dict[str, Any]]:
+            return [
+                {
+                    'limit': f"{b.limit}:{b.window}",
+                    'used': b.used if now < b.reset_at else 0,
+                    'resets_in': round(max(b.reset_at - now, 0.0), 2)
+                }
+                for b in scope.buckets
+            ]
+
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'granted': self._granted,
+                'delayed': self._delayed,
+                'rejected': self._rejected,
+                'throttled_429': self._throttled,
+                'app': {host: describe(scope) for host, scope in self._app_scopes.items()},
+                'methods': {
+                    f"{host} {method}": describe(scope)
+                    for (host, method), scope in self._method_scopes.items()
+                }
+            }
+
+
+# Global rate governor instance
+rate_governor = RateGovernor()
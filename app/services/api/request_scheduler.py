@@ -0,0 +1,222 @@
+# app/services/api/request_scheduler.py
+"""
+Priority scheduling of outbound Riot API calls.
+Sits in front of the rate governor: when calls have to wait for budget,
+interactive page loads are admitted before load-more and background
+work, and background work leaves part of every window unused.
+
+Priority comes from a context variable. Code inside a Flask request
+defaults to INTERACTIVE, anything else (background threads, stale cache
+refreshes, scripts) to BACKGROUND. Use ``request_priority`` or the
+``riot_priority`` route decorator to override it.
+"""
+
+import functools
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from flask import has_request_context
+
+from app.services.api.rate_governor import RateGovernor, rate_governor
+from config.logging_config import get_logger
+
+logger = get_logger('services.api.request_scheduler')
+
+
+class Priority(IntEnum):
+    """Scheduling classes, most urgent first."""
+    INTERACTIVE = 0  # Page-critical calls (account lookup, first page of matches)
+    NORMAL = 1  # User-triggered follow-ups (load more)
+    BACKGROUND = 2  # Refreshes, prefetch, maintenance
+
+
+_priority: ContextVar[Optional[Priority]] = ContextVar('riot_request_priority', default=None)
+
+
+def current_priority() -> Priority:
+    """Priority of Riot calls made from the current context."""
+    priority = _priority.get()
+    if priority is not None:
+        return priority
+    return Priority.INTERACTIVE if has_request_context() else Priority.BACKGROUND
+
+
+@contextmanager
+def request_priority(priority: Priority):
+    """Run a block with the given Riot call priority."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def riot_priority(priority: Priority) -> Callable:
+    """
+    Decorator setting the Riot call priority for a route.
+
+    Usage:
+        @player_bp.route('/load_more', methods=['POST'])
+        @riot_priority(Priority.NORMAL)
+        def load_more_matches():
+            ...
+    """
+    def decorator(f: Callable) -> Callable:
+        @functools.wraps(f)
+        def decorated_function(*args, **kwargs):
+            with request_priority(priority):
+                return f(*args, **kwargs)
+
+        return decorated_function
+
+    return decorator
+
+
+class _ClassStats:
+    """Counters for one priority class."""
+
+    __slots__ = ('waiting', 'max_waiting', 'granted', 'rejected', 'delayed', 'wait_total', 'wait_max')
+
+    def __init__(self):
+        self.waiting = 0
+        self.max_waiting = 0
+        self.granted = 0
+        self.rejected = 0
+        self.delayed = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'queue_depth': self.waiting,
+            'max_queue_depth': self.max_waiting,
+            'granted': self.granted,
+            'rejected': self.rejected,
+            'delayed': self.delayed,
+            'avg_wait_ms': round(self.wait_total / self.granted * 1000, 2) if self.granted else 0.0,
+            'max_wait_ms': round(self.wait_max * 1000, 2)
+        }
+
+
+class RequestScheduler:
+    """Admits Riot calls through the rate governor in priority order."""
+
+    # Longest a waiter sleeps before re-checking its place in the queue
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, governor: RateGovernor, background_headroom: float = 0.25):
+        """
+        Initialize request scheduler.
+
+        Args:
+            governor: Rate governor holding the Riot budget
+            background_headroom: Fraction of every window background work may not use
+        """
+        self.governor = governor
+        self.background_headroom = background_headroom
+        self._cond = threading.Condition()
+        self._queues: Dict[str, List[Tuple[int, int]]] = {}
+        self._seq = itertools.count()
+        self._stats = {priority: _ClassStats() for priority in Priority}
+
+    def init_app(self, app):
+        """Configure scheduler from Flask app config."""
+        self.background_headroom = app.config.get('RIOT_BACKGROUND_HEADROOM', 0.25)
+
+        with self._cond:
+            self._stats = {priority: _ClassStats() for priority in Priority}
+
+        logger.info(f"Riot request scheduler initialized | Background headroom: {self.background_headroom:.0%}")
+
+    def acquire(
+            self,
+            host: str,
+            method: str,
+            priority: Optional[Priority] = None,
+            max_wait: Optional[float] = None
+    ) -> bool:
+        """
+        Block until a call may be made, respecting priority.
+
+        A caller only competes for budget when no higher-priority caller is
+        waiting for the same host.
+
+        Args:
+            host: Network location
+            method: Method key (see RateGovernor.classify)
+            priority: Priority class (default: from context)
+            max_wait: Longest to wait (default: the governor's max_wait)
+
+        Returns:
+            True if the call may proceed, False if budget did not free up in time
+        """
+        if priority is None:
+            priority = current_priority()
+
+        stats = self._stats[priority]
+        headroom = self.background_headroom if priority == Priority.BACKGROUND else 0.0
+
+        # Fast path: nobody queued for this host and budget is available
+        with self._cond:
+            if not self._queues.get(host) and self.governor.reserve(host, method, headroom) == 0:
+                stats.granted += 1
+                return True
+
+        start = time.monotonic()
+        deadline = start + (self.governor.max_wait if max_wait is None else max_wait)
+        ticket = (int(priority), next(self._seq))
+
+        with self._cond:
+            queue = self._queues.setdefault(host, [])
+            heapq.heappush(queue, ticket)
+            stats.waiting += 1
+            stats.max_waiting = max(stats.max_waiting, stats.waiting)
+
+            try:
+                while True:
+                    if queue[0][0] == ticket[0]:
+                        wait = self.governor.reserve(host, method, headroom)
+                        if wait == 0:
+                            waited = time.monotonic() - start
+                            stats.granted += 1
+                            stats.delayed += 1
+                            stats.wait_total += waited
+                            stats.wait_max = max(stats.wait_max, waited)
+                            return True
+                    else:
+                        # A more urgent class is waiting for this host
+                        wait = self.POLL_INTERVAL
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        stats.rejected += 1
+                        logger.warning(
+                            f"Riot call not scheduled in time | Host: {host} | Method: {method} | "
+                            f"Priority: {priority.name}"
+                        )
+                        return False
+
+                    self._cond.wait(min(wait, remaining, self.POLL_INTERVAL * 4))
+            finally:
+                queue.remove(ticket)
+                heapq.heapify(queue)
+                stats.waiting -= 1
+                self._cond.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-class queue depth and wait time."""
+        with self._cond:
+            return {
+                'background_headroom': self.background_headroom,
+                'classes': {priority.name.lower(): self._stats[priority].as_dict() for priority in Priority}
+            }
+
+
+# Global request scheduler instance
+request_scheduler = RequestScheduler(rate_governor)
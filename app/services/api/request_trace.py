@@ -0,0 +1,156 @@
+# app/services/api/request_trace.py
+"""
+Sampled tracing of outbound Riot API calls.
+
+Off by default. When enabled, a sampled fraction of calls produces one
+structured record (endpoint, status, timing, rate limit headers) that is
+logged as a single JSON line on the ``riot.trace`` logger and passed to
+any registered hooks. Credentials never reach a record: only the URL
+path is kept and secret-looking headers are masked.
+"""
+
+import json
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from config.logging_config import get_logger
+
+logger = get_logger('services.api.request_trace')
+trace_logger = get_logger('riot.trace')
+
+# Response headers worth keeping (rate limit accounting and 429 handling)
+TRACED_RESPONSE_HEADERS = (
+    'X-App-Rate-Limit',
+    'X-App-Rate-Limit-Count',
+    'X-Method-Rate-Limit',
+    'X-Method-Rate-Limit-Count',
+    'X-Rate-Limit-Type',
+    'Retry-After',
+)
+
+# Request header names containing any of these are masked
+SECRET_HEADER_MARKERS = ('token', 'key', 'authorization', 'cookie', 'secret')
+
+REDACTED = '[redacted]'
+
+TraceHook = Callable[[Dict[str, Any]], None]
+
+
+def redact_headers(headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """Copy headers with secret values masked."""
+    if not headers:
+        return {}
+    return {
+        name: REDACTED if any(marker in name.lower() for marker in SECRET_HEADER_MARKERS) else value
+        for name, value in headers.items()
+    }
+
+
+class RequestTracer:
+    """Samples outbound calls and emits trace records."""
+
+    def __init__(self, enabled: bool = False, sample_rate: float = 0.01):
+        """
+        Initialize request tracer.
+
+        Args:
+            enabled: Master switch (nothing is recorded when False)
+            sample_rate: Fraction of calls traced (0.0 - 1.0)
+        """
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.log_records = True
+        self._hooks: List[TraceHook] = []
+        self._random = random.Random()
+
+    def init_app(self, app):
+        """Configure tracer from Flask app config."""
+        self.enabled = app.config.get('RIOT_TRACE_ENABLED', False)
+        self.sample_rate = app.config.get('RIOT_TRACE_SAMPLE_RATE', 0.01)
+        self.log_records = app.config.get('RIOT_TRACE_LOG', True)
+
+        logger.info(
+            f"Riot request tracing initialized | Enabled: {self.enabled} | "
+            f"Sample rate: {self.sample_rate:.2%}"
+        )
+
+    def add_hook(self, hook: TraceHook):
+        """Register a callable receiving every trace record."""
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: TraceHook):
+        """Unregister a trace hook."""
+        if hook in self._hooks:
+            self._hooks.remove(hook)
+
+    def begin(
+            self,
+            url: str,
+            method: str,
+            headers: Optional[Dict[str, str]] = None,
+            params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Decide whether to trace a call and start its record.
+
+        Args:
+            url: Request URL
+            method: Method key (see RateGovernor.classify)
+            headers: Request headers (masked before they are kept)
+            params: Query parameters
+
+        Returns:
+            Open trace record, or None when the call is not sampled
+        """
+        if not self.enabled or self._random.random() >= self.sample_rate:
+            return None
+
+        parts = urlsplit(url)
+        return {
+            'host': parts.netloc,
+            'path': parts.path,
+            'method': method,
+            'params': sorted(params) if params else [],
+            'request_headers': redact_headers(headers),
+            '_start': time.perf_counter()
+        }
+
+    def end(self, trace: Optional[Dict[str, Any]], response: Any = None, error: Optional[str] = None):
+        """
+        Complete a trace record and emit it.
+
+        Args:
+            trace: Record returned by begin (None = not sampled, no-op)
+            response: requests.Response, if one was received
+            error: Short error description for failed calls
+        """
+        if trace is None or '_start' not in trace:
+            # Not sampled, or already emitted (e.g. error raised after the response)
+            return
+
+        trace['duration_ms'] = round((time.perf_counter() - trace.pop('_start')) * 1000, 2)
+        trace['ts'] = time.time()
+
+        if response is not None:
+            trace['status'] = response.status_code
+            trace['bytes'] = len(response.content or b'')
+            trace['rate_limit'] = {
+                name: response.headers[name] for name in TRACED_RESPONSE_HEADERS if name in response.headers
+            }
+        if error is not None:
+            trace['error'] = error
+
+        if self.log_records:
+            trace_logger.info(json.dumps(trace, separators=(',', ':')))
+
+        for hook in list(self._hooks):
+            try:
+                hook(trace)
+            except Exception as e:
+                logger.warning(f"Trace hook failed: {e}")
+
+
+# Global request tracer instance
+request_tracer = RequestTracer()
@@ -7,6 +7,11 @@ Handles authentication, rate limiting, and raw API requests.
 import time
 import requests
 from typing import Optional, Dict, Any, List
+from app.services.api.rate_governor import rate_governor
+from app.services.api.request_scheduler import request_scheduler
+from app.services.api.request_trace import request_tracer
+from app.services.metrics import riot_fetch
+from app.utils.request_stats import charge_riot_call, timed
 from config.logging_config import get_logger
 
 logger = get_logger('services.api.riot_api_client')
@@ -71,19 +76,45 @@ class RiotAPIClient:
         Returns:
             Response JSON or None if failed
         """
+        host, method = rate_governor.classify(url)
+
         for attempt in range(retry_count):
+            # Retries count against the request's Riot call cap too
+            if not charge_riot_call():
+                logger.warning(f"Riot call cap for this request reached | URL: {url}")
+                return None
+
+            # Wait for Riot app/method budget (bounded, in priority order) rather than risk a 429
+            with timed('riot_queue'):
+                acquired = request_scheduler.acquire(host, method)
+            if not acquired:
+                return None
+
+            trace = request_tracer.begin(url, method, self.session.headers, params)
+
             try:
-                response = self.session.get(url, params=params, timeout=10)
+                with riot_fetch(host, method) as call, timed('riot'):
+                    response = self.session.get(url, params=params, timeout=10)
+                    call.status = response.status_code
+                rate_governor.update(host, method, response.headers)
+                request_tracer.end(trace, response)
 
                 # Success
                 if response.status_code == 200:
                     return response.json()
 
-                # Rate limit
+                # Rate limit - the governor holds the scope back; next acquire waits
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get('Retry-After', retry_delay))
-                    logger.warning(f"Rate limited. Waiting {retry_after}s")
-                    time.sleep(retry_after)
+                    retry_after = float(response.headers.get('Retry-After', retry_delay))
+                    if rate_governor.enabled:
+                        rate_governor.throttle(
+                            host, method, retry_after, response.headers.get('X-Rate-Limit-Type')
+                        )
+                    else:
+                        # Nothing holds the next attempt back - wait here
+                        logger.warning(f"Rate limited. Waiting {retry_after}s")
+                        with timed('sleep'):
+                            time.sleep(retry_after)
                     continue
 
                 # Not found
@@ -95,11 +126,13 @@ class RiotAPIClient:
                 logger.error(f"API error {response.status_code}: {response.text}")
 
             except requests.exceptions.RequestException as e:
+                request_tracer.end(trace, error=type(e).__name__)
                 logger.error(f"Request failed: {e}")
 
             # Retry delay
             if attempt < retry_count - 1:
-                time.sleep(retry_delay * (attempt + 1))
+                with timed('sleep'):
+                    time.sleep(retry_delay * (attempt + 1))
 
         return None
 
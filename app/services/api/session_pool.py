@@ -0,0 +1,170 @@
+# app/services/api/session_pool.py
+"""
+Pooled HTTP sessions for Riot API calls.
+Keeps one keep-alive requests.Session per host so TCP/TLS handshakes
+are paid once per connection instead of once per request.
+"""
+
+import threading
+import weakref
+from typing import Dict, Any
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config.logging_config import get_logger
+
+logger = get_logger('services.api.session_pool')
+
+
+class CountingAdapter(HTTPAdapter):
+    """HTTPAdapter that remembers the connection pools it hands out, for stats."""
+
+    def __init__(self, *args, **kwargs):
+        self._pools = weakref.WeakSet()
+        self._pools_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def get_connection_with_tls_context(self, *args, **kwargs):
+        pool = super().get_connection_with_tls_context(*args, **kwargs)
+        with self._pools_lock:
+            self._pools.add(pool)
+        return pool
+
+    @property
+    def connection_pools(self) -> list:
+        """urllib3 pools used so far (dropped once the pool manager discards them)."""
+        with self._pools_lock:
+            return list(self._pools)
+
+
+class SessionPool:
+    """Thread-safe registry of pooled sessions, one per routing/platform host."""
+
+    def __init__(self, pool_maxsize: int = 10, pool_block: bool = False, keep_alive: bool = True):
+        """
+        Initialize session pool.
+
+        Args:
+            pool_maxsize: Maximum connections kept open per host
+            pool_block: Block when all connections to a host are busy
+            keep_alive: Reuse connections between requests
+        """
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+        self._session_hits = 0
+        self._session_misses = 0
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+
+    def init_app(self, app):
+        """Configure pool from Flask app config."""
+        self.close_all()
+
+        self.pool_maxsize = app.config.get('RIOT_HTTP_POOL_MAXSIZE', 10)
+        self.pool_block = app.config.get('RIOT_HTTP_POOL_BLOCK', False)
+        self.keep_alive = app.config.get('RIOT_HTTP_KEEP_ALIVE', True)
+
+        logger.info(
+            f"HTTP session pool initialized | Max size: {self.pool_maxsize} | "
+            f"Keep-alive: {self.keep_alive}"
+        )
+
+    def _create_session(self) -> requests.Session:
+        """Create a session with a sized connection pool."""
+        session = requests.Session()
+        adapter = CountingAdapter(
+            pool_connections=1,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+
+        return session
+
+    def get_session(self, host: str) -> requests.Session:
+        """
+        Get the shared session for a host, creating it on first use.
+
+        Args:
+            host: Network location (e.g. 'europe.api.riotgames.com')
+
+        Returns:
+            Pooled session
+        """
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = self._create_session()
+                self._sessions[host] = session
+                self._session_misses += 1
+                logger.debug(f"Created pooled session for {host}")
+            else:
+                self._session_hits += 1
+
+        return session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Perform a GET through the session for the URL's host."""
+        return self.get_session(urlparse(url).netloc).get(url, **kwargs)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Connection hits are requests served on an already open connection;
+        misses are requests that had to open a new one.
+        """
+        hosts = {}
+        total_requests = 0
+        total_connections = 0
+
+        with self._lock:
+            sessions = list(self._sessions.items())
+
+        for host, session in sessions:
+            requests_made = 0
+            connections_opened = 0
+
+            for adapter in set(session.adapters.values()):
+                for pool in adapter.connection_pools:
+                    requests_made += pool.num_requests
+                    connections_opened += pool.num_connections
+
+            hosts[host] = {
+                'requests': requests_made,
+                'connection_hits': max(requests_made - connections_opened, 0),
+                'connection_misses': connections_opened
+            }
+            total_requests += requests_made
+            total_connections += connections_opened
+
+        return {
+            'hosts': hosts,
+            'session_hits': self._session_hits,
+            'session_misses': self._session_misses,
+            'requests': total_requests,
+            'connection_hits': max(total_requests - total_connections, 0),
+            'connection_misses': total_connections,
+            'pool_maxsize': self.pool_maxsize,
+            'keep_alive': self.keep_alive
+        }
+
+    def close_all(self):
+        """Close all pooled sessions."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self._session_hits = 0
+            self._session_misses = 0
+
+
+# Global session pool instance
+session_pool = SessionPool()
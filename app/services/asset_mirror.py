@@ -0,0 +1,176 @@
+# app/services/asset_mirror.py
+"""
+Game icons served from the local mirror.
+
+ResourceDownloader.download_assets mirrors a version's icons and Data
+Dragon sprite sheets and writes an index of them. This module renders
+icons from that index: an icon no larger than its sprite cell becomes a
+slice of the shared sheet, a larger one the mirrored image, and anything
+not mirrored falls back to the CDN URL used before. A page of match
+cards then loads a handful of sheets instead of one image per icon.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+from markupsafe import Markup
+
+from config.logging_config import get_logger
+from config.cdn_config import (
+    ASSET_MIRROR_DIR,
+    ASSET_MIRROR_URL,
+    CDN_BASE_URL,
+    DDRAGON_VERSION
+)
+
+logger = get_logger('services.asset_mirror')
+
+# Icon category -> Data Dragon image group (rune icons are unversioned)
+CDN_GROUPS = {
+    'champion': 'champion',
+    'item': 'item',
+    'spell': 'spell',
+}
+
+# Seconds before looking again for an index that was not there
+MISSING_INDEX_TTL = 60
+
+SPRITE_TEMPLATE = Markup(
+    '<span class="dd-sprite dd-sprite-{sheet} {css_class}" role="img" aria-label="{alt}" '
+    'style="width:{size}px;height:{size}px;background-position:{x:g}px {y:g}px;'
+    'background-size:{width:g}px {height:g}px"></span>'
+)
+IMAGE_TEMPLATE = Markup(
+    '<img src="{url}" alt="{alt}" class="{css_class}" loading="lazy" onerror="this.style.opacity=\'0.3\'">'
+)
+
+
+class AssetMirror:
+    """Looks up mirrored icons and renders them for templates."""
+
+    def __init__(self, mirror_dir: str = ASSET_MIRROR_DIR, mirror_url: str = ASSET_MIRROR_URL):
+        """
+        Initialize asset mirror.
+
+        Args:
+            mirror_dir: Directory holding one mirror per version
+            mirror_url: URL the directory is served under
+        """
+        self.mirror_dir = Path(mirror_dir)
+        self.mirror_url = mirror_url.rstrip('/')
+        # Version -> (index or None, monotonic time it was read)
+        self._indexes: Dict[str, Tuple[Optional[Dict[str, Any]], float]] = {}
+
+    def _load_index(self, version: str) -> Optional[Dict[str, Any]]:
+        """Read a version's index (None if that version is not mirrored)."""
+        filepath = self.mirror_dir / version / 'index.json'
+
+        if not filepath.exists():
+            logger.debug(f"No icon mirror for version {version}")
+            return None
+
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            index['files'] = {category: set(names) for category, names in index.get('files', {}).items()}
+            index.setdefault('sheets', {})
+            index.setdefault('sprites', {})
+            logger.info(f"Icon mirror loaded | Version: {version} | Sheets: {len(index['sheets'])}")
+            return index
+        except (OSError, ValueError, AttributeError) as e:
+            logger.error(f"Error loading icon mirror index {filepath}: {e}")
+            return None
+
+    def get_index(self, version: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Mirror index of a version, cached after the first read."""
+        version = version or DDRAGON_VERSION
+        cached = self._indexes.get(version)
+
+        if cached is not None and (cached[0] is not None or time.monotonic() - cached[1] < MISSING_INDEX_TTL):
+            return cached[0]
+
+        index = self._load_index(version)
+        self._indexes[version] = (index, time.monotonic())
+        return index
+
+    def reload(self):
+        """Forget cached indexes (after the mirror was updated)."""
+        self._indexes.clear()
+
+    def cdn_url(self, category: str, image: str, version: Optional[str] = None) -> str:
+        """Data Dragon URL of an icon."""
+        if category == 'rune':
+            return f"{CDN_BASE_URL}/img/{image}"
+        return f"{CDN_BASE_URL}/{version or DDRAGON_VERSION}/img/{CDN_GROUPS[category]}/{image}"
+
+    def icon_url(self, category: str, image: str, version: Optional[str] = None) -> str:
+        """
+        URL of an icon: the mirrored file if there is one, else the CDN.
+
+        Args:
+            category: 'champion', 'item', 'spell' or 'rune'
+            image: Data Dragon image name (e.g. 'Aatrox.png'), or icon path for runes
+            version: Data Dragon version (default: DDRAGON_VERSION)
+        """
+        version = version or DDRAGON_VERSION
+        index = self.get_index(version)
+
+        if index and image in index['files'].get(category, ()):
+            return f"{self.mirror_url}/{version}/{category}/{image}"
+
+        return self.cdn_url(category, image, version)
+
+    def stylesheet_url(self, version: Optional[str] = None) -> Optional[str]:
+        """URL of the version's sprite stylesheet, or None if it is not mirrored."""
+        version = version or DDRAGON_VERSION
+        return f"{self.mirror_url}/{version}/sprites.css" if self.get_index(version) else None
+
+    def icon(
+        self,
+        category: str,
+        image: str,
+        size: int,
+        alt: str = '',
+        css_class: str = '',
+        version: Optional[str] = None
+    ) -> Markup:
+        """
+        Markup for an icon displayed at size x size pixels.
+
+        Uses the sprite sheet when the icon is in one and its cell is at
+        least that large (sheets hold downscaled icons), else an <img>.
+
+        Args:
+            category: 'champion', 'item', 'spell' or 'rune'
+            image: Data Dragon image name (e.g. 'Aatrox.png'), or icon path for runes
+            size: Displayed width and height in pixels
+            alt: Alternative text
+            css_class: Extra CSS classes
+            version: Data Dragon version (default: DDRAGON_VERSION)
+        """
+        version = version or DDRAGON_VERSION
+        index = self.get_index(version)
+        entry = index['sprites'].get(category, {}).get(image) if index else None
+
+        if entry and entry[3] >= size:
+            sheet, x, y, w, _ = entry
+            sheet_width, sheet_height = index['sheets'][sheet]
+            scale = size / w
+            return SPRITE_TEMPLATE.format(
+                sheet=Path(sheet).stem,
+                css_class=css_class,
+                alt=alt,
+                size=size,
+                x=round(-x * scale, 2) or 0,
+                y=round(-y * scale, 2) or 0,
+                width=round(sheet_width * scale, 2),
+                height=round(sheet_height * scale, 2)
+            )
+
+        return IMAGE_TEMPLATE.format(url=self.icon_url(category, image, version), alt=alt, css_class=css_class)
+
+
+# Global asset mirror instance
+asset_mirror = AssetMirror()
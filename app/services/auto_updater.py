@@ -99,8 +99,10 @@ class AutoUpdater:
                 verification = resource_downloader.verify_downloads()
 
                 if all(verification.values()):
-                    # Reload resources in manager
-                    resource_manager.reload_all()
+                    # Compile for the workers to map, then publish the new files as one
+                    # snapshot; requests in flight keep the old one
+                    resource_manager.compile_game_data(new_version)
+                    resource_manager.reload_all(new_version)
 
                     logger.info(f"Successfully updated to version {new_version}")
 
@@ -1,23 +1,47 @@
 # app/services/cache.py
 """
 Caching service for Clash Finder.
-Provides in-memory caching without Redis dependency.
+Provides in-memory caching, with an optional Redis backend shared by all workers.
 """
 
 import time
 import json
+import heapq
 import pickle
-from typing import Any, Optional, Callable
+import threading
+import uuid
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Callable, Union
 from functools import wraps
 from datetime import timedelta
 
+from flask import current_app, has_app_context
+
+from app.services.metrics import count_cache_lookup
+from app.utils.request_stats import record as record_request_stat, timed
 from config.logging_config import get_logger
 
+try:
+    import redis
+except ImportError:  # pragma: no cover - redis is optional
+    redis = None
+
 logger = get_logger('services.cache')
 
 
 class InMemoryCache:
-    """Simple in-memory cache implementation."""
+    """
+    In-memory LRU cache with TTL.
+
+    Entries live in an OrderedDict kept in recency order, so get/set/evict
+    are O(1). A min-heap of expiry times lets writes drop expired entries
+    proactively instead of waiting for them to be read.
+    """
+
+    # Local to one process; single-flight needs no cross-worker locks
+    distributed = False
 
     def __init__(self, max_size: int = 1000, default_ttl: int = 300):
         """
@@ -27,135 +51,541 @@ class InMemoryCache:
             max_size: Maximum number of items to store
             default_ttl: Default time-to-live in seconds
         """
-        self._cache: dict[str, dict[str, Any]] = {}
+        # key -> (value, expires_at), least recently used first
+        self._cache: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._lock = threading.Lock()
         self._max_size = max_size
         self._default_ttl = default_ttl
         self._hits = 0
         self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
         self._initialized = True
 
         logger.info(f"In-memory cache initialized | Max size: {max_size} | Default TTL: {default_ttl}s")
 
-    def get(self, key: str) -> Optional[Any]:
-        """Get value from cache."""
-        if key not in self._cache:
-            self._misses += 1
-            logger.debug(f"Cache miss: {key}")
-            return None
-
-        entry = self._cache[key]
-        if entry['expires_at'] < time.time():
-            del self._cache[key]
-            self._misses += 1
-            logger.debug(f"Cache expired: {key}")
-            return None
+    def get(self, key: str, count_miss: bool = True) -> Optional[Any]:
+        """Get value from cache (see Cache.get)."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                if count_miss:
+                    self._misses += 1
+                logger.debug(f"Cache miss: {key}")
+                return None
+
+            if entry[1] < time.time():
+                del self._cache[key]
+                self._expirations += 1
+                if count_miss:
+                    self._misses += 1
+                logger.debug(f"Cache expired: {key}")
+                return None
+
+            self._cache.move_to_end(key)
+            self._hits += 1
 
-        self._hits += 1
         logger.debug(f"Cache hit: {key}")
-        return entry['value']
+        return entry[0]
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """Set value in cache."""
         if ttl is None:
             ttl = self._default_ttl
 
-        # Evict oldest if at max size
-        if len(self._cache) >= self._max_size and key not in self._cache:
-            self._evict_oldest()
+        now = time.time()
+        expires_at = now + ttl
 
-        self._cache[key] = {
-            'value': value,
-            'expires_at': time.time() + ttl,
-            'created_at': time.time()
-        }
+        with self._lock:
+            self._purge_expired(now)
+
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            elif len(self._cache) >= self._max_size:
+                self._evict_oldest()
+
+            self._cache[key] = (value, expires_at)
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+
+            # Overwrites leave stale heap entries behind; rebuild when they dominate
+            if len(self._expiry_heap) > 2 * self._max_size:
+                self._rebuild_heap()
 
         logger.debug(f"Cache set: {key} | TTL: {ttl}s")
         return True
 
     def delete(self, key: str) -> bool:
         """Delete key from cache."""
-        if key in self._cache:
-            del self._cache[key]
-            logger.debug(f"Cache deleted: {key}")
-            return True
-        return False
+        with self._lock:
+            if self._cache.pop(key, None) is None:
+                return False
+
+        logger.debug(f"Cache deleted: {key}")
+        return True
 
     def clear(self) -> bool:
         """Clear all cache entries."""
-        count = len(self._cache)
-        self._cache.clear()
-        self._hits = 0
-        self._misses = 0
+        with self._lock:
+            count = len(self._cache)
+            self._cache.clear()
+            self._expiry_heap.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._expirations = 0
+
         logger.info(f"Cache cleared | Removed {count} entries")
         return True
 
     def exists(self, key: str) -> bool:
         """Check if key exists and is not expired."""
-        if key not in self._cache:
-            return False
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return False
 
-        entry = self._cache[key]
-        if entry['expires_at'] < time.time():
-            del self._cache[key]
-            return False
+            if entry[1] < time.time():
+                del self._cache[key]
+                self._expirations += 1
+                return False
 
         return True
 
+    def get_many(self, keys: list[str], count_misses: bool = True) -> list[Optional[Any]]:
+        """Get several values at once, aligned with keys (see Cache.get_many)."""
+        return [self.get(key, count_misses) for key in keys]
+
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
         total_requests = self._hits + self._misses
         hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0
 
         return {
+            'backend': 'memory',
             'hits': self._hits,
             'misses': self._misses,
             'total_requests': total_requests,
             'hit_rate': f"{hit_rate:.2f}%",
             'size': len(self._cache),
-            'max_size': self._max_size
+            'max_size': self._max_size,
+            'evictions': self._evictions,
+            'expirations': self._expirations
         }
 
+    def _purge_expired(self, now: float):
+        """Drop entries whose TTL has passed. Caller must hold the lock."""
+        heap = self._expiry_heap
+
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+
+            # Skip heap records left behind by overwrites or deletes
+            if entry is not None and entry[1] == expires_at:
+                del self._cache[key]
+                self._expirations += 1
+
+    def _rebuild_heap(self):
+        """Rebuild expiry heap from live entries. Caller must hold the lock."""
+        self._expiry_heap = [(entry[1], key) for key, entry in self._cache.items()]
+        heapq.heapify(self._expiry_heap)
+
     def _evict_oldest(self):
-        """Evict oldest cache entry."""
+        """Evict least recently used entry. Caller must hold the lock."""
         if not self._cache:
             return
 
-        oldest_key = min(
-            self._cache.keys(),
-            key=lambda k: self._cache[k]['created_at']
-        )
-        del self._cache[oldest_key]
+        oldest_key, _ = self._cache.popitem(last=False)
+        self._evictions += 1
         logger.debug(f"Evicted oldest entry: {oldest_key}")
 
 
+class RedisCache:
+    """
+    Redis cache backend shared by all worker processes.
+
+    Values are pickled and zlib-compressed above a size threshold; expiry
+    is enforced server-side with per-key TTLs. Connection errors are
+    logged and treated as cache misses so Redis outages never fail requests.
+    """
+
+    # Supports cross-worker locks for single-flight
+    distributed = True
+
+    # Serialized payload markers (first byte)
+    _RAW = b'p'
+    _COMPRESSED = b'z'
+
+    def __init__(
+            self,
+            client: 'redis.Redis',
+            default_ttl: int = 300,
+            key_prefix: str = 'clashfinder:',
+            compress_threshold: int = 1024
+    ):
+        """
+        Initialize Redis cache.
+
+        Args:
+            client: Redis client (redis.Redis or a compatible stand-in like fakeredis)
+            default_ttl: Default time-to-live in seconds
+            key_prefix: Namespace prepended to every key
+            compress_threshold: Compress payloads larger than this many bytes
+        """
+        self._client = client
+        self._default_ttl = default_ttl
+        self._key_prefix = key_prefix
+        self._compress_threshold = compress_threshold
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+        self._initialized = True
+
+        logger.info(f"Redis cache initialized | Prefix: {key_prefix} | Default TTL: {default_ttl}s")
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> 'RedisCache':
+        """Create backend from a redis:// URL and verify the connection."""
+        if redis is None:
+            raise RuntimeError("redis package is not installed")
+
+        client = redis.Redis.from_url(url, socket_timeout=1.0, socket_connect_timeout=1.0)
+        client.ping()
+        return cls(client, **kwargs)
+
+    def _key(self, key: str) -> str:
+        return f"{self._key_prefix}{key}"
+
+    def _serialize(self, value: Any) -> bytes:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self._compress_threshold:
+            return self._COMPRESSED + zlib.compress(data, 1)
+        return self._RAW + data
+
+    def _deserialize(self, data: bytes) -> Any:
+        marker, payload = data[:1], data[1:]
+        if marker == self._COMPRESSED:
+            payload = zlib.decompress(payload)
+        return pickle.loads(payload)
+
+    def _record(self, key: str, data: Optional[bytes], count_miss: bool = True) -> Optional[Any]:
+        """Decode a fetched payload and update hit/miss counters."""
+        if data is None:
+            if count_miss:
+                self._misses += 1
+            logger.debug(f"Cache miss: {key}")
+            return None
+
+        self._hits += 1
+        logger.debug(f"Cache hit: {key}")
+        return self._deserialize(data)
+
+    def get(self, key: str, count_miss: bool = True) -> Optional[Any]:
+        """Get value from cache (see Cache.get)."""
+        try:
+            data = self._client.get(self._key(key))
+        except redis.RedisError as e:
+            self._errors += 1
+            logger.warning(f"Redis get failed: {key} | Error: {e}")
+            return None
+
+        return self._record(key, data, count_miss)
+
+    def get_many(self, keys: list[str], count_misses: bool = True) -> list[Optional[Any]]:
+        """Get several values in one round-trip, aligned with keys (see Cache.get_many)."""
+        if not keys:
+            return []
+
+        try:
+            values = self._client.mget([self._key(key) for key in keys])
+        except redis.RedisError as e:
+            self._errors += 1
+            logger.warning(f"Redis mget failed | Keys: {len(keys)} | Error: {e}")
+            return [None] * len(keys)
+
+        return [self._record(key, data, count_misses) for key, data in zip(keys, values)]
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Set value in cache."""
+        if ttl is None:
+            ttl = self._default_ttl
+
+        try:
+            self._client.set(self._key(key), self._serialize(value), ex=max(int(ttl), 1))
+        except redis.RedisError as e:
+            self._errors += 1
+            logger.warning(f"Redis set failed: {key} | Error: {e}")
+            return False
+
+        logger.debug(f"Cache set: {key} | TTL: {ttl}s")
+        return True
+
+    def delete(self, key: str) -> bool:
+        """Delete key from cache."""
+        try:
+            deleted = self._client.delete(self._key(key))
+        except redis.RedisError as e:
+            self._errors += 1
+            logger.warning(f"Redis delete failed: {key} | Error: {e}")
+            return False
+
+        if deleted:
+            logger.debug(f"Cache deleted: {key}")
+        return bool(deleted)
+
+    def clear(self) -> bool:
+        """Clear all entries under this cache's key prefix."""
+        count = 0
+
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for redis_key in self._client.scan_iter(match=f"{self._key_prefix}*", count=500):
+                pipe.delete(redis_key)
+                count += 1
+                if count % 500 == 0:
+                    pipe.execute()
+            pipe.execute()
+        except redis.RedisError as e:
+            self._errors += 1
+            logger.warning(f"Redis clear failed | Error: {e}")
+            return False
+
+        self._hits = 0
+        self._misses = 0
+        logger.info(f"Cache cleared | Removed {count} entries")
+        return True
+
+    def exists(self, key: str) -> bool:
+        """Check if key exists and is not expired."""
+        try:
+            return bool(self._client.exists(self._key(key)))
+        except redis.RedisError as e:
+            self._errors += 1
+            logger.warning(f"Redis exists failed: {key} | Error: {e}")
+            return False
+
+    def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        """
+        Try to take a short-lived cross-worker lock for a key.
+
+        Returns:
+            Lock token if acquired (or Redis is unreachable), None if held elsewhere
+        """
+        token = uuid.uuid4().hex
+
+        try:
+            acquired = self._client.set(self._key(f"lock:{key}"), token, nx=True, px=int(ttl * 1000))
+        except redis.RedisError as e:
+            self._errors += 1
+            logger.warning(f"Redis lock failed: {key} | Error: {e}")
+            return token
+
+        return token if acquired else None
+
+    def release_lock(self, key: str, token: str):
+        """Release a lock taken with acquire_lock if we still own it."""
+        lock_key = self._key(f"lock:{key}")
+
+        try:
+            if self._client.get(lock_key) == token.encode():
+                self._client.delete(lock_key)
+        except redis.RedisError as e:
+            self._errors += 1
+            logger.warning(f"Redis unlock failed: {key} | Error: {e}")
+
+    def lock_exists(self, key: str) -> bool:
+        """Check whether another worker still holds the lock for a key."""
+        try:
+            return bool(self._client.exists(self._key(f"lock:{key}")))
+        except redis.RedisError:
+            return False
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics (hit counters are per worker).
+
+        There is no 'size': the database may be shared with other users,
+        and counting only this prefix's keys means scanning the keyspace.
+        """
+        total_requests = self._hits + self._misses
+        hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            'backend': 'redis',
+            'hits': self._hits,
+            'misses': self._misses,
+            'total_requests': total_requests,
+            'hit_rate': f"{hit_rate:.2f}%",
+            'errors': self._errors
+        }
+
+
+class SingleFlight:
+    """
+    Collapse concurrent computations of the same key into a single call.
+
+    The first caller for a key (the leader) runs the computation; callers
+    arriving while it is in flight wait and receive the same result or
+    exception. An exception flagged ``per_request`` (a limit of the
+    leader's own request, not a property of the key) is not shared:
+    waiters run the computation again under their own request. Counters
+    record how many upstream calls were saved.
+    """
+
+    class _Call:
+        __slots__ = ('event', 'result', 'error')
+
+        def __init__(self):
+            self.event = threading.Event()
+            self.result = None
+            self.error: Optional[BaseException] = None
+
+    def __init__(self):
+        """Initialize single-flight group."""
+        self._calls: dict[str, 'SingleFlight._Call'] = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.coalesced = 0
+        self.coalesced_remote = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn for key unless an identical call is already in flight.
+
+        Args:
+            key: Cache key identifying the computation
+            fn: Zero-argument callable producing the value
+
+        Returns:
+            Result of fn (possibly computed by another thread)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = self._Call()
+                self.leaders += 1
+                leader = True
+
+        if not leader:
+            logger.debug(f"Single-flight wait: {key}")
+            with timed('sleep'):
+                call.event.wait()
+            if call.error is not None:
+                if getattr(call.error, 'per_request', False):
+                    return self.do(key, fn)
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def count_remote(self):
+        """Count a value another worker computed while this one waited."""
+        with self._lock:
+            self.coalesced_remote += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get single-flight statistics."""
+        return {
+            'leaders': self.leaders,
+            'coalesced': self.coalesced,
+            'coalesced_remote': self.coalesced_remote,
+            'upstream_calls_saved': self.coalesced + self.coalesced_remote,
+            'in_flight': len(self._calls)
+        }
+
+    def reset(self):
+        """Reset counters."""
+        self.leaders = 0
+        self.coalesced = 0
+        self.coalesced_remote = 0
+
+
 class CacheManager:
     """Central cache manager."""
 
     def __init__(self):
         """Initialize cache manager."""
-        self.backend: Optional[InMemoryCache] = None
+        self.backend: Optional[Union[InMemoryCache, RedisCache]] = None
         self._initialized = False
 
     def init_app(self, app):
         """Initialize cache with Flask app."""
         cache_type = app.config.get('CACHE_TYPE', 'simple')
-
-        if cache_type == 'simple':
-            max_size = app.config.get('CACHE_MAX_SIZE', 1000)
-            default_ttl = app.config.get('CACHE_DEFAULT_TIMEOUT', 300)
+        max_size = app.config.get('CACHE_MAX_SIZE', 1000)
+        default_ttl = app.config.get('CACHE_DEFAULT_TIMEOUT', 300)
+
+        if cache_type == 'redis':
+            redis_url = app.config.get('CACHE_REDIS_URL') or app.config.get('REDIS_URL')
+
+            try:
+                if not redis_url:
+                    raise RuntimeError("CACHE_REDIS_URL/REDIS_URL not configured")
+
+                self.backend = RedisCache.from_url(
+                    redis_url,
+                    default_ttl=default_ttl,
+                    key_prefix=app.config.get('CACHE_KEY_PREFIX', 'clashfinder:')
+                )
+                logger.info("Cache initialized with Redis backend")
+            except Exception as e:
+                logger.error(f"Redis cache unavailable ({e}), falling back to in-memory")
+                self.backend = InMemoryCache(max_size, default_ttl)
+
+        elif cache_type == 'simple':
             self.backend = InMemoryCache(max_size, default_ttl)
             logger.info("Cache initialized with in-memory backend")
         else:
             logger.warning(f"Unknown cache type: {cache_type}, using in-memory")
             self.backend = InMemoryCache()
 
+        stale_refresher.configure(app.config.get('CACHE_STALE_REFRESH_WORKERS', 4))
+
         self._initialized = True
 
-    def get(self, key: str) -> Optional[Any]:
-        """Get value from cache."""
+    def get(self, key: str, count_miss: bool = True) -> Optional[Any]:
+        """
+        Get value from cache.
+
+        Args:
+            key: Cache key
+            count_miss: Count a missing key in the miss counter; pass False
+                when re-checking a key whose miss was already counted
+
+        Returns:
+            Cached value or None
+        """
         if not self.backend:
             return None
-        return self.backend.get(key)
+        return self.backend.get(key, count_miss)
+
+    def get_many(self, keys: list[str], count_misses: bool = True) -> list[Optional[Any]]:
+        """
+        Get several values at once (one round-trip on Redis).
+
+        Args:
+            keys: Cache keys
+            count_misses: Count missing keys in the miss counter; pass False
+                when each miss is looked up again with get, which counts it
+
+        Returns:
+            Values aligned with keys (None where missing)
+        """
+        if not self.backend:
+            return [None] * len(keys)
+        return self.backend.get_many(keys, count_misses)
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """Set value in cache."""
@@ -187,50 +617,346 @@ class CacheManager:
             return {}
         return self.backend.get_stats()
 
+    @property
+    def distributed(self) -> bool:
+        """Whether the backend is shared between worker processes."""
+        return bool(getattr(self.backend, 'distributed', False))
+
+    def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        """Take a cross-worker lock for key (always granted on local backends)."""
+        if not self.distributed:
+            return 'local'
+        return self.backend.acquire_lock(key, ttl)
+
+    def release_lock(self, key: str, token: str):
+        """Release a lock taken with acquire_lock."""
+        if self.distributed:
+            self.backend.release_lock(key, token)
+
+    def lock_exists(self, key: str) -> bool:
+        """Check whether a cross-worker lock is held for key."""
+        return self.distributed and self.backend.lock_exists(key)
+
 
 # Global cache instance
 cache = CacheManager()
 
+# Global single-flight group used by @cached
+single_flight_group = SingleFlight()
+
+# Cross-worker single-flight: lock lifetime and follower polling interval
+SINGLE_FLIGHT_LOCK_TTL = 15.0
+SINGLE_FLIGHT_POLL_INTERVAL = 0.05
+
+
+class StaleableValue:
+    """Cached value that stays servable past its freshness deadline (see stale_ttl)."""
+
+    __slots__ = ('value', 'fresh_until')
+
+    def __init__(self, value: Any, fresh_until: float):
+        self.value = value
+        self.fresh_until = fresh_until
+
+    def __getstate__(self):
+        return self.value, self.fresh_until
+
+    def __setstate__(self, state):
+        self.value, self.fresh_until = state
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.fresh_until
+
+
+class StaleRefresher:
+    """Bounded background pool that refreshes stale cache entries."""
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Initialize refresher.
+
+        Args:
+            max_workers: Maximum refreshes running at once; extra requests are skipped
+        """
+        self._max_workers = max_workers
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: set[str] = set()
+        self._lock = threading.Lock()
+        self.scheduled = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def configure(self, max_workers: int):
+        """Resize the pool (takes effect for new refreshes)."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            self._max_workers = max_workers
+            self._slots = threading.BoundedSemaphore(max_workers)
+
+    def schedule(self, key: str, refresh: Callable[[], Any]) -> bool:
+        """
+        Refresh key in the background unless already refreshing or at capacity.
+
+        Returns:
+            True if a refresh was scheduled
+        """
+        with self._lock:
+            if key in self._pending:
+                return False
+
+            if not self._slots.acquire(blocking=False):
+                self.skipped += 1
+                return False
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix='cache-refresh'
+                )
+
+            self._pending.add(key)
+            self.scheduled += 1
+            slots = self._slots
+            self._executor.submit(self._run, key, refresh, slots)
+
+        return True
+
+    def _run(self, key: str, refresh: Callable[[], Any], slots: threading.BoundedSemaphore):
+        try:
+            refresh()
+        except Exception as e:
+            self.failed += 1
+            logger.warning(f"Background refresh failed: {key} | Error: {e}")
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+            slots.release()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get refresher statistics."""
+        return {
+            'max_workers': self._max_workers,
+            'running': len(self._pending),
+            'scheduled': self.scheduled,
+            'skipped': self.skipped,
+            'failed': self.failed
+        }
+
+
+# Global background refresher used by @cached(stale_ttl=...)
+stale_refresher = StaleRefresher()
+
+# Per key-prefix counters: hits, stale hits, misses, background refreshes
+_prefix_stats: dict[str, dict[str, int]] = {}
+_prefix_stats_lock = threading.Lock()
+
+# Prometheus result label for the lookup counters above
+_LOOKUP_RESULTS = {'hits': 'hit', 'stale': 'stale', 'misses': 'miss'}
+
+
+def _count(prefix: str, field: str, amount: int = 1):
+    """Increment a per-prefix counter."""
+    with _prefix_stats_lock:
+        counters = _prefix_stats.get(prefix)
+        if counters is None:
+            counters = _prefix_stats[prefix] = {'hits': 0, 'stale': 0, 'misses': 0, 'refreshes': 0}
+        counters[field] += amount
+
+    if field in _LOOKUP_RESULTS:
+        count_cache_lookup(prefix, _LOOKUP_RESULTS[field], amount)
+
+
+def record_cache_hits(prefix: str, amount: int = 1):
+    """
+    Count cache hits for a @cached key prefix.
+
+    Updates the per-prefix stats, the Prometheus lookup counter and the
+    current request's stats together; for callers that read a decorated
+    function's keys directly (e.g. with get_many).
+
+    Args:
+        prefix: Stats prefix of the decorated function (its ``stats_prefix``)
+        amount: Number of hits
+    """
+    if amount:
+        _count(prefix, 'hits', amount)
+        record_request_stat('cache_hits', amount)
+
+
+def _store(cache_key: str, result: Any, ttl: int, stale_ttl: int):
+    """Store a computed result, keeping it servable for stale_ttl past ttl."""
+    if result is None:
+        return
+
+    if stale_ttl:
+        cache.set(cache_key, StaleableValue(result, time.time() + ttl), ttl + stale_ttl)
+    else:
+        cache.set(cache_key, result, ttl)
+
+
+def _unwrap(value: Any) -> Any:
+    """Return the payload of a cached value."""
+    return value.value if isinstance(value, StaleableValue) else value
+
+
+def _load_with_lock(
+        cache_key: str,
+        ttl: int,
+        stale_ttl: int,
+        f: Callable,
+        args: tuple,
+        kwargs: dict
+) -> Any:
+    """
+    Compute a cache miss once across threads and workers.
+
+    Runs inside the in-process single-flight leader. On a distributed
+    backend it also takes a Redis lock; workers that lose the race poll
+    the cache for the leader's value instead of calling upstream.
+    """
+    # Another caller may have filled the key while we waited for the lead
+    # (re-checks do not count: the decorator already counted this miss)
+    cached_value = cache.get(cache_key, count_miss=False)
+    if cached_value is not None:
+        return _unwrap(cached_value)
+
+    token = cache.acquire_lock(cache_key, SINGLE_FLIGHT_LOCK_TTL)
+
+    if token is None:
+        deadline = time.monotonic() + SINGLE_FLIGHT_LOCK_TTL
+
+        while time.monotonic() < deadline:
+            with timed('sleep'):
+                time.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+
+            cached_value = cache.get(cache_key, count_miss=False)
+            if cached_value is not None:
+                single_flight_group.count_remote()
+                return _unwrap(cached_value)
+
+            if not cache.lock_exists(cache_key):
+                break
+
+        # Leader failed, cached nothing, or timed out - compute ourselves
+        token = cache.acquire_lock(cache_key, SINGLE_FLIGHT_LOCK_TTL)
+
+    try:
+        result = f(*args, **kwargs)
+        _store(cache_key, result, ttl, stale_ttl)
+        return result
+    finally:
+        if token is not None:
+            cache.release_lock(cache_key, token)
+
+
+def _schedule_refresh(
+        cache_key: str,
+        key_prefix: str,
+        ttl: int,
+        stale_ttl: int,
+        f: Callable,
+        args: tuple,
+        kwargs: dict
+):
+    """Refresh a stale entry in the background, once across workers."""
+    app = current_app._get_current_object() if has_app_context() else None
+
+    def refresh():
+        token = cache.acquire_lock(cache_key, SINGLE_FLIGHT_LOCK_TTL)
+        if token is None:
+            # Another worker is already refreshing this key
+            return
+
+        try:
+            if app is not None:
+                with app.app_context():
+                    result = f(*args, **kwargs)
+            else:
+                result = f(*args, **kwargs)
+
+            _store(cache_key, result, ttl, stale_ttl)
+            _count(key_prefix, 'refreshes')
+            logger.debug(f"Cache refreshed in background: {cache_key}")
+        finally:
+            cache.release_lock(cache_key, token)
 
-def cached(ttl: int = 300, key_prefix: str = ''):
+    stale_refresher.schedule(cache_key, refresh)
+
+
+def cached(ttl: int = 300, key_prefix: str = '', single_flight: bool = False, stale_ttl: int = 0):
     """
     Decorator to cache function results.
 
     Args:
         ttl: Time-to-live in seconds
         key_prefix: Prefix for cache key
+        single_flight: On a miss, let only one caller per key compute the
+            value while concurrent callers (threads, and workers when the
+            backend is Redis) wait for its result
+        stale_ttl: Seconds past ttl during which the expired value is still
+            returned immediately while a background worker refreshes it
 
     Example:
         @cached(ttl=600, key_prefix='user')
         def get_user(user_id):
             return fetch_user(user_id)
+
+        get_user.make_cache_key(42)  # -> 'user:get_user:42'
+        get_user.stats_prefix  # -> 'user' (see get_cache_stats)
     """
 
     def decorator(f: Callable) -> Callable:
-        @wraps(f)
-        def decorated_function(*args, **kwargs):
-            # Generate cache key
+        stats_prefix = key_prefix or f.__name__
+
+        def make_cache_key(*args, **kwargs) -> str:
             key_parts = [key_prefix, f.__name__]
             key_parts.extend(str(arg) for arg in args)
             key_parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
-            cache_key = ':'.join(filter(None, key_parts))
+            return ':'.join(filter(None, key_parts))
+
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            # Generate cache key
+            cache_key = make_cache_key(*args, **kwargs)
 
             # Try to get from cache
             cached_value = cache.get(cache_key)
             if cached_value is not None:
+                if isinstance(cached_value, StaleableValue) and not cached_value.is_fresh:
+                    logger.debug(f"Cache stale: {cache_key}")
+                    _count(stats_prefix, 'stale')
+                    record_request_stat('cache_hits')
+                    _schedule_refresh(cache_key, stats_prefix, ttl, stale_ttl, f, args, kwargs)
+                    return cached_value.value
+
                 logger.debug(f"Cache hit: {cache_key}")
-                return cached_value
+                record_cache_hits(stats_prefix)
+                return _unwrap(cached_value)
 
             # Execute function
             logger.debug(f"Cache miss: {cache_key}")
+            _count(stats_prefix, 'misses')
+            record_request_stat('cache_misses')
+
+            if single_flight:
+                return single_flight_group.do(
+                    cache_key,
+                    lambda: _load_with_lock(cache_key, ttl, stale_ttl, f, args, kwargs)
+                )
+
             result = f(*args, **kwargs)
 
             # Store in cache
-            if result is not None:
-                cache.set(cache_key, result, ttl)
+            _store(cache_key, result, ttl, stale_ttl)
 
             return result
 
+        decorated_function.make_cache_key = make_cache_key
+        decorated_function.stats_prefix = stats_prefix
         return decorated_function
 
     return decorator
@@ -254,4 +980,11 @@ def invalidate_cache(pattern: str = None):
 
 def get_cache_stats() -> dict[str, Any]:
     """Get cache statistics."""
-    return cache.get_stats()
\ No newline at end of file
+    stats = cache.get_stats()
+    stats['single_flight'] = single_flight_group.get_stats()
+    stats['stale_refresher'] = stale_refresher.get_stats()
+
+    with _prefix_stats_lock:
+        stats['prefixes'] = {prefix: dict(counters) for prefix, counters in _prefix_stats.items()}
+
+    return stats
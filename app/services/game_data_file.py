@@ -0,0 +1,234 @@
+# app/services/game_data_file.py
+"""
+Compiled game data file, read through mmap.
+
+The Data Dragon JSON documents are compiled once (by the updater) into a
+single read-only file. Each section has a sorted int32 ID column, an
+(offset, length) column and the records as compact JSON, followed by
+the whole document for callers that still want it. Every worker maps
+the same file, so the pages are shared through the page cache; opening
+it costs a header read, and a record is only decoded when it is first
+looked up.
+
+Layout (little-endian, arrays 4-byte aligned):
+
+    preamble  magic, format version, section count, header length
+    header    JSON: data version, source file fingerprints, section offsets
+    ids       int32[count]           sorted record IDs
+    entries   uint32[2 * count]      offset, length of each record
+    records   compact JSON, one per entry
+    document  compact JSON of the whole source document
+"""
+
+import os
+import sys
+import json
+import mmap
+import struct
+import tempfile
+from bisect import bisect_left
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional, Tuple
+
+GAME_DATA_FILE = 'game_data.bin'
+
+MAGIC = b'CFGD'
+FORMAT_VERSION = 1
+PREAMBLE = struct.Struct('<4sHHI')
+
+INT32_MIN, INT32_MAX = -2 ** 31, 2 ** 31 - 1
+
+
+class GameDataFileError(Exception):
+    """Compiled file is missing, corrupt or from another format version."""
+    pass
+
+
+def source_fingerprint(data_dir: Path, filenames) -> Dict[str, list]:
+    """Size and mtime of each source file, to tell when a compiled file is stale."""
+    fingerprint = {}
+    for filename in filenames:
+        try:
+            stat = (data_dir / filename).stat()
+            fingerprint[filename] = [stat.st_size, stat.st_mtime_ns]
+        except OSError:
+            fingerprint[filename] = None
+    return fingerprint
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _align(offset: int) -> int:
+    return (offset + 3) & ~3
+
+
+def write_game_data(
+    filepath: Path,
+    version: str,
+    sections: Dict[str, Tuple[Any, Dict[int, Any]]],
+    sources: Optional[Dict[str, Any]] = None
+) -> int:
+    """
+    Compile documents and their ID indexes into one file.
+
+    Args:
+        filepath: Output file (replaced atomically)
+        version: Data Dragon version of the documents
+        sections: Section name -> (document, records by ID)
+        sources: Fingerprint of the source files (see source_fingerprint)
+
+    Returns:
+        Size of the written file in bytes
+    """
+    # Offsets in the header are relative to the body, which starts after the aligned header
+    body = bytearray()
+    layout = {}
+
+    for name, (document, records) in sections.items():
+        ids = sorted(record_id for record_id in records if INT32_MIN <= record_id <= INT32_MAX)
+
+        ids_offset = len(body)
+        body += struct.pack(f'<{len(ids)}i', *ids)
+        entries_offset = len(body)
+        body += bytes(8 * len(ids))
+
+        entries = []
+        for record_id in ids:
+            encoded = _encode(records[record_id])
+            entries += (len(body), len(encoded))
+            body += encoded
+        struct.pack_into(f'<{len(entries)}I', body, entries_offset, *entries)
+
+        document_offset = len(body)
+        body += _encode(document)
+        layout[name] = [len(ids), ids_offset, entries_offset, document_offset, len(body) - document_offset]
+        body += bytes(_align(len(body)) - len(body))
+
+    header = _encode({'version': version, 'sources': sources or {}, 'sections': layout})
+    preamble = PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(layout), len(header)) + header
+    content = preamble + bytes(_align(len(preamble)) - len(preamble)) + body
+
+    fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, prefix=f'.{filepath.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    return len(content)
+
+
+class RecordIndex(Mapping):
+    """
+    Read-only ID -> record mapping over one section of a mapped file.
+
+    Lookups binary-search the ID column in place; a record is decoded on
+    its first lookup and the same object is returned afterwards, so only
+    records actually used take memory in the process.
+    """
+
+    def __init__(self, buffer: memoryview, count: int, ids_offset: int, entries_offset: int):
+        self._buffer = buffer
+        self._ids = buffer[ids_offset:ids_offset + 4 * count].cast('i')
+        self._entries = buffer[entries_offset:entries_offset + 8 * count].cast('I')
+        if len(self._ids) != count or len(self._entries) != 2 * count:
+            raise ValueError("section extends past the end of the file")
+        self._decoded: Dict[int, Any] = {}
+
+    def _decode(self, position: int) -> Any:
+        offset = self._entries[2 * position]
+        return json.loads(bytes(self._buffer[offset:offset + self._entries[2 * position + 1]]))
+
+    def get(self, key, default=None):
+        record = self._decoded.get(key)
+        if record is not None:
+            return record
+
+        if not isinstance(key, int) or isinstance(key, bool):
+            return default
+
+        position = bisect_left(self._ids, key)
+        if position == len(self._ids) or self._ids[position] != key:
+            return default
+
+        record = self._decoded[key] = self._decode(position)
+        return record
+
+    def __getitem__(self, key):
+        record = self.get(key)
+        if record is None:
+            raise KeyError(key)
+        return record
+
+    def __contains__(self, key) -> bool:
+        return self.get(key) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids.tolist())
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class GameDataFile:
+    """A compiled game data file, mapped read-only."""
+
+    def __init__(self, filepath: Path):
+        """
+        Map a compiled file.
+
+        Raises:
+            GameDataFileError: If the file is missing, corrupt or from another format version
+        """
+        self.filepath = Path(filepath)
+
+        # The columns are read in native byte order
+        if sys.byteorder != 'little':
+            raise GameDataFileError("Compiled game data is only read on little-endian hosts")
+
+        try:
+            with open(self.filepath, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise GameDataFileError(f"Cannot map {self.filepath}: {e}") from e
+
+        buffer = memoryview(self._mmap)
+
+        try:
+            magic, format_version, _, header_length = PREAMBLE.unpack_from(buffer)
+            if magic != MAGIC or format_version != FORMAT_VERSION:
+                raise GameDataFileError(f"{self.filepath} is not a format {FORMAT_VERSION} game data file")
+            header = json.loads(bytes(buffer[PREAMBLE.size:PREAMBLE.size + header_length]))
+
+            self.version: str = header['version']
+            self.sources: Dict[str, Any] = header.get('sources', {})
+            self._sections: Dict[str, list] = header['sections']
+            self._buffer = buffer[_align(PREAMBLE.size + header_length):]
+            self.indexes: Dict[str, RecordIndex] = {
+                name: RecordIndex(self._buffer, count, ids_offset, entries_offset)
+                for name, (count, ids_offset, entries_offset, _, _) in self._sections.items()
+            }
+        except (struct.error, ValueError, TypeError, KeyError) as e:
+            raise GameDataFileError(f"Corrupt game data file {self.filepath}: {e}") from e
+
+        self._documents: Dict[str, Any] = {}
+
+    @property
+    def size(self) -> int:
+        return len(self._mmap)
+
+    def document(self, name: str) -> Any:
+        """Whole source document of a section, decoded on first use."""
+        document = self._documents.get(name)
+        if document is None:
+            _, _, _, offset, length = self._sections[name]
+            document = self._documents[name] = json.loads(bytes(self._buffer[offset:offset + length]))
+        return document
@@ -0,0 +1,255 @@
+# app/services/match_projection.py
+"""
+Compact projection of match-v5 documents.
+
+A raw match-v5 payload is 30-60 KB of JSON, mostly ``challenges``,
+``missions`` and ``perks`` detail that nothing in the app reads. Matches
+are projected down to the fields used by the renderers and aggregations
+(process_match_for_player, MatchProcessor, game_models) and packed into
+nested tuples with a fixed field order. Packed records are what the cache
+and match store hold; ``unpack_match`` rebuilds a slim match-v5 shaped
+dict so consumers keep using ``match['info']['participants']``.
+"""
+
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+# Bump when the field lists change; records with another version are refetched
+RECORD_VERSION = 1
+
+INFO_FIELDS = (
+    'gameId',
+    'gameCreation',
+    'gameDuration',
+    'gameEndTimestamp',
+    'gameMode',
+    'gameType',
+    'queueId',
+)
+
+PARTICIPANT_FIELDS = (
+    'puuid',
+    'riotIdGameName',
+    'riotIdTagline',
+    'summonerName',
+    'profileIconId',
+    'championName',
+    'championId',
+    'champLevel',
+    'teamId',
+    'teamPosition',
+    'individualPosition',
+    'role',
+    'lane',
+    'win',
+
+    # KDA
+    'kills',
+    'deaths',
+    'assists',
+    'doubleKills',
+    'tripleKills',
+    'quadraKills',
+    'pentaKills',
+    'killingSprees',
+    'largestKillingSpree',
+    'largestMultiKill',
+    'firstBloodKill',
+    'firstBloodAssist',
+    'firstTowerKill',
+    'firstTowerAssist',
+
+    # CS and gold
+    'totalMinionsKilled',
+    'neutralMinionsKilled',
+    'goldEarned',
+
+    # Combat
+    'totalDamageDealt',
+    'totalDamageDealtToChampions',
+    'physicalDamageDealtToChampions',
+    'magicDamageDealtToChampions',
+    'trueDamageDealtToChampions',
+    'totalDamageTaken',
+    'damageSelfMitigated',
+    'totalHeal',
+    'totalHealsOnTeammates',
+    'timeCCingOthers',
+
+    # Objectives
+    'turretKills',
+    'inhibitorKills',
+    'baronKills',
+    'dragonKills',
+
+    # Vision
+    'visionScore',
+    'wardsPlaced',
+    'wardsKilled',
+    'detectorWardsPlaced',
+
+    # Build
+    'item0',
+    'item1',
+    'item2',
+    'item3',
+    'item4',
+    'item5',
+    'item6',
+    'summoner1Id',
+    'summoner2Id',
+)
+
+OBJECTIVES = ('baron', 'dragon', 'riftHerald', 'tower', 'inhibitor')
+
+# Packed record layout:
+#   (RECORD_VERSION, matchId, info, participants, teams)
+#   info         - values in INFO_FIELDS order
+#   participants - one tuple per participant: PARTICIPANT_FIELDS values + (perks,)
+#                  perks = ((style, (perk, ...)), ...) or None
+#   teams        - (teamId, win, (objective kills in OBJECTIVES order), (banned championId, ...))
+MatchRecord = Tuple[Any, ...]
+
+
+def _pack_perks(perks: Optional[Dict[str, Any]]) -> Optional[Tuple]:
+    """Keep rune styles and selected perk IDs (drops stat shards and vars)."""
+    if not perks:
+        return None
+
+    return tuple(
+        (style.get('style'), tuple(s.get('perk') for s in style.get('selections', [])))
+        for style in perks.get('styles', [])
+    )
+
+
+def _unpack_perks(perks: Sequence) -> Dict[str, Any]:
+    return {
+        'styles': [
+            {'style': style, 'selections': [{'perk': perk} for perk in selections]}
+            for style, selections in perks
+        ]
+    }
+
+
+def pack_match(match_data: Dict[str, Any]) -> MatchRecord:
+    """
+    Project a raw match-v5 document to a packed record.
+
+    Args:
+        match_data: Raw match-v5 payload
+
+    Returns:
+        Packed match record
+    """
+    info = match_data.get('info', {})
+    metadata = match_data.get('metadata', {})
+
+    participants = tuple(
+        tuple(p.get(name) for name in PARTICIPANT_FIELDS) + (_pack_perks(p.get('perks')),)
+        for p in info.get('participants', [])
+    )
+
+    teams = []
+    for team in info.get('teams', []):
+        objectives = team.get('objectives')
+        teams.append((
+            team.get('teamId'),
+            team.get('win'),
+            tuple(objectives.get(name, {}).get('kills') for name in OBJECTIVES) if objectives else None,
+            tuple(ban.get('championId') for ban in team.get('bans', [])) or None
+        ))
+
+    return (
+        RECORD_VERSION,
+        metadata.get('matchId'),
+        tuple(info.get(name) for name in INFO_FIELDS),
+        participants,
+        tuple(teams)
+    )
+
+
+def unpack_match(record: Optional[MatchRecord]) -> Optional[Dict[str, Any]]:
+    """
+    Rebuild a slim match-v5 shaped dict from a packed record.
+
+    Fields missing from the original payload are omitted, so ``.get()``
+    defaults in consumers behave exactly as with the raw document.
+
+    Args:
+        record: Packed match record (or None)
+
+    Returns:
+        Match data dictionary or None
+    """
+    if record is None:
+        return None
+
+    _, match_id, info_values, participant_rows, team_rows = record
+
+    participants = []
+    for row in participant_rows:
+        participant = {name: value for name, value in zip(PARTICIPANT_FIELDS, row) if value is not None}
+        if row[-1] is not None:
+            participant['perks'] = _unpack_perks(row[-1])
+        participants.append(participant)
+
+    teams = []
+    for team_id, win, objective_kills, bans in team_rows:
+        team = {'teamId': team_id, 'win': win}
+        if objective_kills is not None:
+            team['objectives'] = {
+                name: {'kills': kills}
+                for name, kills in zip(OBJECTIVES, objective_kills) if kills is not None
+            }
+        if bans is not None:
+            team['bans'] = [{'championId': champion_id} for champion_id in bans]
+        teams.append(team)
+
+    info = {name: value for name, value in zip(INFO_FIELDS, info_values) if value is not None}
+    info['participants'] = participants
+    info['teams'] = teams
+
+    return {
+        'metadata': {
+            'matchId': match_id,
+            'participants': [p.get('puuid') for p in participants]
+        },
+        'info': info
+    }
+
+
+def _freeze(value: Any) -> Any:
+    """Turn nested lists (e.g. from JSON) back into tuples."""
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def load_record(value: Any) -> Optional[MatchRecord]:
+    """
+    Normalize a stored value into a current packed record.
+
+    Accepts packed records, their JSON (list) form, and raw match-v5
+    dicts written before projection existed.
+    """
+    if value is None:
+        return None
+
+    if isinstance(value, dict):
+        return pack_match(value)
+
+    record = _freeze(value)
+    if record[0] != RECORD_VERSION:
+        # Older layout - fields cannot be mapped reliably, treat as missing
+        return None
+
+    return record
+
+
+def record_participants(record: MatchRecord) -> list:
+    """Participant PUUIDs of a packed record."""
+    return [row[0] for row in record[3]]
+
+
+def record_game_creation(record: MatchRecord) -> Optional[int]:
+    """Game creation timestamp (ms) of a packed record."""
+    return record[2][INFO_FIELDS.index('gameCreation')]
@@ -0,0 +1,366 @@
+# app/services/match_store.py
+"""
+Persistent on-disk store for match-v5 payloads.
+Finished matches never change, so they are kept in SQLite (WAL mode)
+across restarts and deploys as compressed packed records (see
+match_projection), indexed by participant PUUID.
+"""
+
+import json
+import queue
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.services.match_projection import (
+    MatchRecord,
+    load_record,
+    record_participants,
+    record_game_creation
+)
+from config.logging_config import get_logger
+
+logger = get_logger('services.match_store')
+
+
+class MatchStore:
+    """Read-through SQLite store for immutable match records."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS matches (
+            match_id TEXT PRIMARY KEY,
+            payload BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            game_creation INTEGER,
+            stored_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_matches_accessed ON matches (accessed_at);
+        CREATE TABLE IF NOT EXISTS match_participants (
+            puuid TEXT NOT NULL,
+            match_id TEXT NOT NULL,
+            PRIMARY KEY (puuid, match_id)
+        ) WITHOUT ROWID;
+    """
+
+    # Only rewrite accessed_at when it is older than this (keeps reads cheap)
+    TOUCH_INTERVAL = 3600
+
+    # Idle connections kept for reuse; fetch threads come and go, connections stay bounded
+    POOL_SIZE = 8
+
+    def __init__(self, path: Optional[str] = None, max_bytes: int = 512 * 1024 * 1024):
+        """
+        Initialize match store.
+
+        Args:
+            path: SQLite database file (None = disabled)
+            max_bytes: Compressed payload budget before least recently used matches are evicted
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self._pool: queue.LifoQueue = queue.LifoQueue(maxsize=self.POOL_SIZE)
+        self._write_lock = threading.Lock()
+        self._approx_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        if path:
+            self._open()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the store is configured."""
+        return bool(self.path)
+
+    def init_app(self, app):
+        """Configure store from Flask app config."""
+        self.close()
+
+        if not app.config.get('MATCH_STORE_ENABLED', False):
+            self.path = None
+            logger.info("Match store disabled")
+            return
+
+        self.path = app.config.get('MATCH_STORE_PATH')
+        self.max_bytes = app.config.get('MATCH_STORE_MAX_BYTES', self.max_bytes)
+        self._open()
+
+    def _open(self):
+        """Create the database file and schema."""
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connection() as conn:
+            with self._write_lock:
+                conn.executescript(self.SCHEMA)
+                conn.commit()
+
+            self._approx_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM matches").fetchone()[0]
+        logger.info(
+            f"Match store opened | Path: {self.path} | "
+            f"Size: {self._approx_bytes / 1024 / 1024:.1f}MB / {self.max_bytes / 1024 / 1024:.0f}MB"
+        )
+
+    @staticmethod
+    def _connect(path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled connection for the duration of the block."""
+        path = self.path
+        conn = None
+        while conn is None:
+            try:
+                conn_path, conn = self._pool.get_nowait()
+            except queue.Empty:
+                conn_path, conn = path, self._connect(path)
+            if conn_path != path:
+                # Left over from before a reconfigure
+                conn.close()
+                conn = None
+
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            try:
+                if path != self.path:
+                    raise queue.Full
+                self._pool.put_nowait((path, conn))
+            except queue.Full:
+                conn.close()
+
+    @staticmethod
+    def _encode(record: MatchRecord) -> bytes:
+        return zlib.compress(json.dumps(record, separators=(',', ':')).encode('utf-8'), 6)
+
+    @staticmethod
+    def _decode(payload: bytes) -> Optional[MatchRecord]:
+        return load_record(json.loads(zlib.decompress(payload)))
+
+    def get(self, match_id: str) -> Optional[MatchRecord]:
+        """
+        Get a stored match.
+
+        Args:
+            match_id: Match ID
+
+        Returns:
+            Packed match record or None if not stored
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            with self._connection() as conn:
+                row = conn.execute(
+                    "SELECT payload, accessed_at FROM matches WHERE match_id = ?",
+                    (match_id,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Match store read failed: {match_id} | Error: {e}")
+            return None
+
+        if row is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        payload, accessed_at = row
+
+        now = time.time()
+        if now - accessed_at > self.TOUCH_INTERVAL:
+            self._touch(match_id, now)
+
+        return self._decode(payload)
+
+    def _touch(self, match_id: str, now: float):
+        """Refresh a match's LRU timestamp."""
+        try:
+            with self._write_lock, self._connection() as conn:
+                conn.execute("UPDATE matches SET accessed_at = ? WHERE match_id = ?", (now, match_id))
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Match store touch failed: {match_id} | Error: {e}")
+
+    def put(self, match_id: str, match_data: Any) -> bool:
+        """
+        Store a match and index its participants.
+
+        Args:
+            match_id: Match ID
+            match_data: Packed match record (raw match-v5 payloads are projected)
+
+        Returns:
+            True if stored
+        """
+        if not self.enabled or not match_data:
+            return False
+
+        record = load_record(match_data)
+        payload = self._encode(record)
+        puuids = record_participants(record)
+        game_creation = record_game_creation(record)
+        now = time.time()
+
+        try:
+            with self._write_lock, self._connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO matches "
+                    "(match_id, payload, size, game_creation, stored_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (match_id, payload, len(payload), game_creation, now, now)
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO match_participants (puuid, match_id) VALUES (?, ?)",
+                    [(puuid, match_id) for puuid in puuids]
+                )
+                conn.commit()
+                self._approx_bytes += len(payload)
+
+            if self._approx_bytes > self.max_bytes:
+                self.evict(int(self.max_bytes * 0.9))
+
+            return True
+
+        except sqlite3.Error as e:
+            logger.warning(f"Match store write failed: {match_id} | Error: {e}")
+            return False
+
+    def get_match_ids_for_puuid(self, puuid: str, limit: int = 100) -> List[str]:
+        """Get stored match IDs a player took part in, newest first."""
+        if not self.enabled:
+            return []
+
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT m.match_id FROM match_participants p "
+                "JOIN matches m ON m.match_id = p.match_id "
+                "WHERE p.puuid = ? ORDER BY m.game_creation DESC LIMIT ?",
+                (puuid, limit)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def evict(self, target_bytes: int) -> int:
+        """
+        Evict least recently used matches until payloads fit target_bytes.
+
+        Returns:
+            Number of matches evicted
+        """
+        if not self.enabled:
+            return 0
+
+        evicted = 0
+
+        with self._write_lock, self._connection() as conn:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM matches").fetchone()[0]
+
+            while total > target_bytes:
+                rows = conn.execute(
+                    "SELECT match_id, size FROM matches ORDER BY accessed_at LIMIT 200"
+                ).fetchall()
+                if not rows:
+                    break
+
+                victims = []
+                for match_id, size in rows:
+                    victims.append((match_id,))
+                    total -= size
+                    if total <= target_bytes:
+                        break
+
+                conn.executemany("DELETE FROM matches WHERE match_id = ?", victims)
+                conn.executemany("DELETE FROM match_participants WHERE match_id = ?", victims)
+                evicted += len(victims)
+
+            conn.commit()
+            self._approx_bytes = total
+            self._evictions += evicted
+
+        if evicted:
+            logger.info(f"Match store evicted {evicted} matches | Size: {total / 1024 / 1024:.1f}MB")
+
+        return evicted
+
+    def compact(self) -> Dict[str, int]:
+        """
+        Enforce the size budget, checkpoint the WAL and VACUUM the file.
+
+        Returns:
+            File size in bytes before and after
+        """
+        if not self.enabled:
+            return {'before': 0, 'after': 0}
+
+        before = self._file_size()
+        self.evict(self.max_bytes)
+
+        with self._write_lock, self._connection() as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            conn.execute("VACUUM")
+
+        after = self._file_size()
+        logger.info(f"Match store compacted | {before / 1024 / 1024:.1f}MB -> {after / 1024 / 1024:.1f}MB")
+
+        return {'before': before, 'after': after}
+
+    def _file_size(self) -> int:
+        """Size of the database file plus its WAL."""
+        total = 0
+        for suffix in ('', '-wal'):
+            path = Path(f"{self.path}{suffix}")
+            if path.exists():
+                total += path.stat().st_size
+        return total
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics."""
+        if not self.enabled:
+            return {'enabled': False}
+
+        with self._connection() as conn:
+            count, payload_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM matches"
+            ).fetchone()
+            players = conn.execute("SELECT COUNT(DISTINCT puuid) FROM match_participants").fetchone()[0]
+
+        total_requests = self._hits + self._misses
+        hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            'enabled': True,
+            'path': self.path,
+            'matches': count,
+            'players': players,
+            'payload_bytes': payload_bytes,
+            'file_bytes': self._file_size(),
+            'max_bytes': self.max_bytes,
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_rate': f"{hit_rate:.2f}%",
+            'evictions': self._evictions
+        }
+
+    def close(self):
+        """Close all pooled connections."""
+        while True:
+            try:
+                _, conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+
+
+# Global match store instance
+match_store = MatchStore()
@@ -0,0 +1,173 @@
+# app/services/metrics.py
+"""
+Prometheus metrics for Clash Finder.
+
+Series are created once per process and exposed at ``/metrics``. Under
+gunicorn each worker writes its samples to PROMETHEUS_MULTIPROC_DIR
+(see gunicorn.conf.py) and the endpoint aggregates all workers, so any
+worker can answer a scrape. Without prometheus_client installed, or
+with METRICS_ENABLED off, every recording helper is a no-op.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional, Union
+
+from flask import Response
+
+from config.logging_config import get_logger
+
+try:
+    import prometheus_client
+    from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, multiprocess
+except ImportError:  # pragma: no cover - prometheus_client is optional
+    prometheus_client = None
+
+logger = get_logger('services.metrics')
+
+# Seconds; page loads range from cached (ms) to cold fan-outs over many Riot calls
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+RIOT_BUCKETS = (0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.0, 5.0, 10.0)
+
+if prometheus_client is not None:
+    REQUEST_LATENCY = Histogram(
+        'clashfinder_request_duration_seconds',
+        'Time spent serving HTTP requests',
+        ('endpoint', 'method', 'status'),
+        buckets=REQUEST_BUCKETS
+    )
+    RIOT_CALLS = Counter(
+        'clashfinder_riot_calls_total',
+        'Outbound Riot API calls',
+        ('host', 'method', 'status')
+    )
+    RIOT_LATENCY = Histogram(
+        'clashfinder_riot_call_duration_seconds',
+        'Latency of outbound Riot API calls',
+        ('host', 'method', 'status'),
+        buckets=RIOT_BUCKETS
+    )
+    RIOT_IN_FLIGHT = Gauge(
+        'clashfinder_riot_fetches_in_flight',
+        'Riot API calls currently waiting for a response',
+        ('host',),
+        multiprocess_mode='livesum'
+    )
+    CACHE_LOOKUPS = Counter(
+        'clashfinder_cache_lookups_total',
+        'Cached function lookups by key prefix and result (hit, stale, miss)',
+        ('prefix', 'result')
+    )
+    RATE_LIMITED = Counter(
+        'clashfinder_rate_limited_total',
+        'Requests rejected by the inbound rate limiter',
+        ('endpoint',)
+    )
+
+
+class Metrics:
+    """Switch for recording metrics and the /metrics endpoint."""
+
+    def __init__(self):
+        self.enabled = False
+
+    @property
+    def available(self) -> bool:
+        return prometheus_client is not None
+
+    def init_app(self, app):
+        """Enable recording and register the /metrics endpoint."""
+        self.enabled = app.config.get('METRICS_ENABLED', True) and self.available
+
+        if not self.enabled:
+            logger.info(
+                "Metrics disabled" + ("" if self.available else " (prometheus_client not installed)")
+            )
+            return
+
+        app.add_url_rule(app.config.get('METRICS_PATH', '/metrics'), 'metrics', self.render)
+        logger.info(
+            f"Metrics initialized | Path: {app.config.get('METRICS_PATH', '/metrics')} | "
+            f"Multiprocess: {self.multiprocess}"
+        )
+
+    @property
+    def multiprocess(self) -> bool:
+        return bool(os.environ.get('PROMETHEUS_MULTIPROC_DIR'))
+
+    def render(self) -> Response:
+        """Expose all series in the Prometheus text format."""
+        if self.multiprocess:
+            # Each scrape merges the per-worker files, dead workers included
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        else:
+            registry = prometheus_client.REGISTRY
+
+        return Response(prometheus_client.generate_latest(registry), mimetype=prometheus_client.CONTENT_TYPE_LATEST)
+
+
+# Global metrics instance
+metrics = Metrics()
+
+
+def observe_request(endpoint: Optional[str], method: str, status: int, seconds: float):
+    """Record one served request."""
+    if metrics.enabled:
+        REQUEST_LATENCY.labels(endpoint or 'none', method, str(status)).observe(seconds)
+
+
+def observe_riot_call(host: str, method: str, status: Union[int, str], seconds: float):
+    """Record one outbound Riot call (status is the HTTP code or an error name)."""
+    if metrics.enabled:
+        status = str(status)
+        RIOT_CALLS.labels(host, method, status).inc()
+        RIOT_LATENCY.labels(host, method, status).observe(seconds)
+
+
+def count_cache_lookup(prefix: str, result: str, amount: int = 1):
+    """Record cache hits, stale hits or misses for a key prefix."""
+    if metrics.enabled and amount:
+        CACHE_LOOKUPS.labels(prefix, result).inc(amount)
+
+
+def count_rate_limited(endpoint: Optional[str]):
+    """Record a request rejected by the inbound rate limiter."""
+    if metrics.enabled:
+        RATE_LIMITED.labels(endpoint or 'none').inc()
+
+
+class _RiotFetch:
+    """Outcome of one call timed by riot_fetch."""
+
+    __slots__ = ('status',)
+
+    def __init__(self):
+        self.status: Union[int, str] = 'none'
+
+
+@contextmanager
+def riot_fetch(host: str, method: str) -> Iterator[_RiotFetch]:
+    """
+    Time a Riot call and count it as in flight for the duration of the block.
+
+    Set ``status`` on the yielded object once a response arrives; an
+    exception escaping the block is recorded under its class name.
+    """
+    if not metrics.enabled:
+        yield _RiotFetch()
+        return
+
+    call = _RiotFetch()
+    gauge = RIOT_IN_FLIGHT.labels(host)
+    gauge.inc()
+    start = time.perf_counter()
+    try:
+        yield call
+    except Exception as e:
+        call.status = type(e).__name__
+        raise
+    finally:
+        gauge.dec()
+        observe_riot_call(host, method, call.status, time.perf_counter() - start)
@@ -9,6 +9,8 @@ from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
 from app.services.api.riot_api_client import RiotAPIClient
 from app.services.cache import cache
+from app.services.match_store import match_store
+from app.services.match_projection import pack_match, unpack_match, load_record
 from app.services.match_processor import MatchProcessor
 from config.logging_config import get_logger
 
@@ -245,20 +247,28 @@ class PlayerService:
         Returns:
             Match data or None
         """
-        # Check cache
+        # Check cache (holds packed projection records, not raw payloads)
         cache_key = f"match:{match_id}"
-        cached_match = cache.get(cache_key)
-        if cached_match:
-            return cached_match
+        cached_record = cache.get(cache_key)
+        if cached_record:
+            return unpack_match(load_record(cached_record))
 
-        # Get from API
-        match_data = self.client.get_match_by_id(match_id, region)
+        # Check persistent store (survives restarts)
+        record = match_store.get(match_id)
 
-        if match_data:
+        if not record:
+            # Get from API
+            match_data = self.client.get_match_by_id(match_id, region)
+
+            if match_data:
+                record = pack_match(match_data)
+                match_store.put(match_id, record)
+
+        if record:
             # Cache for 1 day (matches don't change)
-            cache.set(cache_key, match_data, timeout=86400)
+            cache.set(cache_key, record, ttl=86400)
 
-        return match_data
+        return unpack_match(record)
 
     def _get_region_from_server(self, server: str) -> str:
         """
@@ -1,146 +1,444 @@
 # app/services/rate_limiter.py
 """
 Rate limiting service for Clash Finder.
-Provides in-memory rate limiting without Redis dependency.
+Provides in-memory (GCRA, lock-striped) rate limiting, with an optional
+Redis backend so limits are shared by all workers.
 """
 
+import heapq
+import math
 import time
-from typing import Optional, Callable, Any
+import zlib
+from typing import Optional, Callable, Any, Sequence, Tuple, Union
 from functools import wraps
-from collections import defaultdict
 from threading import Lock
 from flask import request, jsonify, current_app
 
+from app.services.metrics import count_rate_limited
 from config.logging_config import get_logger
 
+try:
+    import redis
+except ImportError:  # pragma: no cover - redis is optional
+    redis = None
+
 logger = get_logger('services.rate_limiter')
 
+# (limit, window seconds) pairs checked together for one key
+Limits = Sequence[Tuple[int, int]]
 
-class InMemoryRateLimiter:
-    """Simple in-memory rate limiter."""
+
+class _Stripe:
+    """One lock, the keys hashed to it and a heap of their expiry times."""
+
+    __slots__ = ('lock', 'entries', 'expiry_heap')
 
     def __init__(self):
-        """Initialize in-memory rate limiter."""
-        self.storage: dict[str, dict[str, Any]] = defaultdict(dict)
         self.lock = Lock()
+        # key -> [expires_at, {(limit, window): theoretical arrival time}]
+        self.entries: dict[str, list] = {}
+        # (expires_at, key), including records superseded by later checks
+        self.expiry_heap: list[tuple[float, str]] = []
+
+
+class InMemoryRateLimiter:
+    """
+    In-memory GCRA rate limiter.
+
+    Each (limit, window) pair keeps a single theoretical arrival time
+    (TAT), which spaces requests window/limit apart while allowing a
+    burst of ``limit``. Unlike fixed windows there is no 2x burst at a
+    window edge. Keys are spread over independently locked stripes, and
+    expired keys are dropped a few at a time, soonest deadline first, on
+    the stripe being written.
+    """
+
+    # Expired keys examined per check (keeps expiry O(1) amortized)
+    EXPIRE_PER_CHECK = 2
+
+    def __init__(self, stripes: int = 64):
+        """
+        Initialize in-memory rate limiter.
+
+        Args:
+            stripes: Number of independently locked key partitions
+        """
+        self._stripes = [_Stripe() for _ in range(max(1, stripes))]
         self._initialized = True
 
-        logger.info("In-memory rate limiter initialized")
+        logger.info(f"In-memory rate limiter initialized | Stripes: {len(self._stripes)}")
 
-    def _cleanup_old_entries(self):
-        """Remove expired entries to prevent memory leak."""
-        current_time = time.time()
-        with self.lock:
-            keys_to_delete = []
-            for key, data in self.storage.items():
-                if data.get('reset_time', 0) < current_time:
-                    keys_to_delete.append(key)
+    def _stripe(self, key: str) -> _Stripe:
+        return self._stripes[zlib.crc32(key.encode('utf-8')) % len(self._stripes)]
 
-            for key in keys_to_delete:
-                del self.storage[key]
+    def _expire(self, stripe: _Stripe, now: float):
+        """Pop up to EXPIRE_PER_CHECK due records off a stripe's expiry heap. Caller must hold the lock."""
+        heap = stripe.expiry_heap
+        for _ in range(self.EXPIRE_PER_CHECK):
+            if not heap or heap[0][0] > now:
+                return
+            expires_at, key = heapq.heappop(heap)
+            entry = stripe.entries.get(key)
 
-    def check_rate_limit(self, key: str, limit: int, window: int) -> tuple[bool, dict[str, Any]]:
+            # Skip heap records left behind by later checks or resets
+            if entry is not None and entry[0] == expires_at:
+                del stripe.entries[key]
+
+    def _schedule_expiry(self, stripe: _Stripe, key: str, expires_at: float):
+        """Record a key's new deadline. Caller must hold the lock."""
+        heap = stripe.expiry_heap
+        heapq.heappush(heap, (expires_at, key))
+
+        # Each allowed request supersedes its key's previous record; rebuild when those dominate
+        if len(heap) > 2 * len(stripe.entries) + 64:
+            stripe.expiry_heap = [(entry[0], name) for name, entry in stripe.entries.items()]
+            heapq.heapify(stripe.expiry_heap)
+
+    def check_limits(self, key: str, limits: Limits) -> tuple[bool, dict[str, Any]]:
         """
-        Check if request is within rate limit.
+        Check and count one request against several limits at once.
+
+        The request is only counted when every limit allows it.
 
         Args:
-            key: Unique identifier for rate limit (e.g., IP address)
-            limit: Maximum number of requests allowed
-            window: Time window in seconds
+            key: Unique identifier for rate limit (e.g., IP and endpoint)
+            limits: (limit, window seconds) pairs, e.g. ((15, 60), (150, 3600))
 
         Returns:
-            Tuple of (is_allowed, info_dict)
+            Tuple of (is_allowed, info_dict). ``limit``/``remaining``/``reset``
+            describe the tightest limit (the one exceeded, if any);
+            ``windows`` maps each window to its remaining requests.
         """
-        current_time = time.time()
-
-        # Periodic cleanup
-        if len(self.storage) > 10000:
-            self._cleanup_old_entries()
-
-        with self.lock:
-            if key not in self.storage:
-                self.storage[key] = {
-                    'count': 1,
-                    'reset_time': current_time + window,
-                    'window': window
-                }
-                return True, {
+        now = time.monotonic()
+        wall = time.time()
+        stripe = self._stripe(key)
+
+        with stripe.lock:
+            self._expire(stripe, now)
+
+            entry = stripe.entries.get(key)
+            tats = entry[1] if entry is not None else {}
+
+            new_tats = {}
+            windows = {}
+            tightest = None
+            denied = None
+
+            for limit, window in limits:
+                interval = window / limit
+                tat = max(tats.get((limit, window), now), now)
+                new_tat = tat + interval
+                allow_at = new_tat - window
+
+                if allow_at > now:
+                    retry_after = allow_at - now
+                    if denied is None or retry_after > denied[2]:
+                        denied = (limit, window, retry_after, tat)
+                    windows[window] = 0
+                    continue
+
+                remaining = int((window - (new_tat - now)) / interval + 1e-9)
+                new_tats[(limit, window)] = new_tat
+                windows[window] = remaining
+                if tightest is None or remaining < tightest[2]:
+                    tightest = (limit, window, remaining, new_tat)
+
+            if denied is not None:
+                limit, window, retry_after, tat = denied
+                return False, {
                     'limit': limit,
-                    'remaining': limit - 1,
-                    'reset': int(current_time + window)
+                    'remaining': 0,
+                    'reset': int(wall + (tat - now)),
+                    'retry_after': max(1, math.ceil(retry_after)),
+                    'window': window,
+                    'windows': windows
                 }
 
-            data = self.storage[key]
+            if entry is None:
+                entry = stripe.entries[key] = [0.0, {}]
+            entry[1].update(new_tats)
+            entry[0] = max(entry[1].values())
+            self._schedule_expiry(stripe, key, entry[0])
+
+        limit, window, remaining, new_tat = tightest
+        return True, {
+            'limit': limit,
+            'remaining': remaining,
+            'reset': int(wall + (new_tat - now)),
+            'window': window,
+            'windows': windows
+        }
 
-            # Check if window expired
-            if current_time >= data['reset_time']:
-                self.storage[key] = {
-                    'count': 1,
-                    'reset_time': current_time + window,
-                    'window': window
-                }
-                return True, {
-                    'limit': limit,
-                    'remaining': limit - 1,
-                    'reset': int(current_time + window)
-                }
+    def check_rate_limit(self, key: str, limit: int, window: int) -> tuple[bool, dict[str, Any]]:
+        """
+        Check if request is within a single rate limit.
 
-            # Within window
-            if data['count'] < limit:
-                data['count'] += 1
-                return True, {
-                    'limit': limit,
-                    'remaining': limit - data['count'],
-                    'reset': int(data['reset_time'])
-                }
+        Args:
+            key: Unique identifier for rate limit (e.g., IP address)
+            limit: Maximum number of requests allowed
+            window: Time window in seconds
 
-            # Rate limit exceeded
-            return False, {
-                'limit': limit,
-                'remaining': 0,
-                'reset': int(data['reset_time']),
-                'retry_after': int(data['reset_time'] - current_time)
-            }
+        Returns:
+            Tuple of (is_allowed, info_dict)
+        """
+        return self.check_limits(key, ((limit, window),))
 
     def get_status(self, key: str) -> dict[str, Any]:
         """Get current rate limit status for a key."""
-        current_time = time.time()
+        now = time.monotonic()
+        stripe = self._stripe(key)
 
-        with self.lock:
-            if key not in self.storage:
+        with stripe.lock:
+            entry = stripe.entries.get(key)
+            if entry is None or entry[0] <= now:
                 return {
-                    'count': 0,
-                    'reset_time': None,
-                    'is_active': False
+                    'is_active': False,
+                    'windows': {}
                 }
 
-            data = self.storage[key]
-
-            if current_time >= data['reset_time']:
-                return {
-                    'count': 0,
-                    'reset_time': None,
-                    'is_active': False
+            windows = {}
+            for (limit, window), tat in entry[1].items():
+                interval = window / limit
+                used = max(0.0, tat - now)
+                windows[window] = {
+                    'limit': limit,
+                    'remaining': min(limit, int((window - used) / interval + 1e-9)),
+                    'seconds_until_full': int(used)
                 }
 
             return {
-                'count': data['count'],
-                'reset_time': data['reset_time'],
                 'is_active': True,
-                'seconds_remaining': int(data['reset_time'] - current_time)
+                'windows': windows
             }
 
     def reset(self, key: str):
         """Reset rate limit for key."""
-        with self.lock:
-            if key in self.storage:
-                del self.storage[key]
+        stripe = self._stripe(key)
+        with stripe.lock:
+            stripe.entries.pop(key, None)
         logger.debug(f"Rate limit reset: {key}")
 
     def clear(self):
         """Clear all rate limit data."""
-        with self.lock:
-            self.storage.clear()
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.entries.clear()
+                stripe.expiry_heap.clear()
+        logger.info("Rate limiter cleared")
+
+    def __len__(self) -> int:
+        return sum(len(stripe.entries) for stripe in self._stripes)
+
+
+class RedisRateLimiter:
+    """
+    Redis-backed GCRA rate limiter shared by all worker processes.
+
+    Each key is a hash of theoretical arrival times, one field per
+    (limit, window). All windows are checked and updated by one Lua
+    script, so a check is a single atomic round-trip and uses the Redis
+    server clock. While Redis is unreachable, checks go to an in-memory
+    limiter and Redis is retried after ``retry_interval`` seconds.
+    """
+
+    # KEYS[1] = key; ARGV = limit1, window1, limit2, window2, ...
+    # Returns {allowed, remaining1, full_ms1, retry_ms1, ...}
+    CHECK_SCRIPT = """
+        if redis.replicate_commands then redis.replicate_commands() end
+        local t = redis.call('TIME')
+        local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+        local n = #ARGV / 2
+        local fields = {}
+        for i = 1, n do
+            fields[i] = ARGV[2 * i - 1] .. ':' .. ARGV[2 * i]
+        end
+        local stored = redis.call('HMGET', KEYS[1], unpack(fields))
+
+        local result = {1}
+        local updates = {}
+        local expire_ms = 0
+        for i = 1, n do
+            local limit = tonumber(ARGV[2 * i - 1])
+            local window = tonumber(ARGV[2 * i])
+            local interval = window / limit
+            local tat = math.max(tonumber(stored[i]) or now, now)
+            local new_tat = tat + interval
+            local allow_at = new_tat - window
+
+            if allow_at > now then
+                result[1] = 0
+                table.insert(result, -1)
+                table.insert(result, math.ceil((tat - now) * 1000))
+                table.insert(result, math.ceil((allow_at - now) * 1000))
+            else
+                table.insert(result, math.floor((window - (new_tat - now)) / interval + 1e-9))
+                table.insert(result, math.ceil((new_tat - now) * 1000))
+                table.insert(result, 0)
+                table.insert(updates, fields[i])
+                table.insert(updates, string.format('%.6f', new_tat))
+                expire_ms = math.max(expire_ms, math.ceil((new_tat - now) * 1000))
+            end
+        end
+
+        if result[1] == 1 then
+            redis.call('HSET', KEYS[1], unpack(updates))
+            redis.call('PEXPIRE', KEYS[1], math.max(expire_ms, redis.call('PTTL', KEYS[1])))
+        end
+        return result
+    """
+
+    def __init__(
+            self,
+            client: 'redis.Redis',
+            key_prefix: str = 'clashfinder:ratelimit:',
+            retry_interval: float = 5.0,
+            stripes: int = 64
+    ):
+        """
+        Initialize Redis rate limiter.
+
+        Args:
+            client: Redis client
+            key_prefix: Namespace prepended to every key
+            retry_interval: Seconds to stay on the in-memory fallback after a Redis error
+            stripes: Lock stripes of the in-memory fallback
+        """
+        self._client = client
+        self._key_prefix = key_prefix
+        self._retry_interval = retry_interval
+        self._script = client.register_script(self.CHECK_SCRIPT)
+        self._fallback = InMemoryRateLimiter(stripes=stripes)
+        self._down_until = 0.0
+        self._errors = 0
+        self._initialized = True
+
+        logger.info(f"Redis rate limiter initialized | Prefix: {key_prefix}")
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> 'RedisRateLimiter':
+        """Create backend from a redis:// URL and verify the connection."""
+        if redis is None:
+            raise RuntimeError("redis package is not installed")
+
+        client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+        client.ping()
+        return cls(client, **kwargs)
+
+    def _key(self, key: str) -> str:
+        return f"{self._key_prefix}{key}"
+
+    def _available(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def _mark_down(self, action: str, e: Exception):
+        self._errors += 1
+        self._down_until = time.monotonic() + self._retry_interval
+        logger.warning(
+            f"Redis rate limit {action} failed, using in-memory for {self._retry_interval:.0f}s | Error: {e}"
+        )
+
+    def check_limits(self, key: str, limits: Limits) -> tuple[bool, dict[str, Any]]:
+        """
+        Check and count one request against several limits at once.
+
+        Same contract as InMemoryRateLimiter.check_limits.
+        """
+        if not self._available():
+            return self._fallback.check_limits(key, limits)
+
+        args = [value for pair in limits for value in pair]
+        try:
+            result = self._script(keys=[self._key(key)], args=args)
+        except redis.RedisError as e:
+            self._mark_down('check', e)
+            return self._fallback.check_limits(key, limits)
+
+        wall = time.time()
+        allowed = bool(result[0])
+        windows = {}
+        chosen = None
+
+        for (limit, window), i in zip(limits, range(1, len(result), 3)):
+            remaining, full_ms, retry_ms = result[i], result[i + 1], result[i + 2]
+            windows[window] = max(0, remaining)
+
+            if allowed:
+                if chosen is None or remaining < chosen[2]:
+                    chosen = (limit, window, remaining, full_ms, 0)
+            elif remaining < 0 and (chosen is None or retry_ms > chosen[4]):
+                chosen = (limit, window, 0, full_ms, retry_ms)
+
+        limit, window, remaining, full_ms, retry_ms = chosen
+        info = {
+            'limit': limit,
+            'remaining': remaining,
+            'reset': int(wall + full_ms / 1000),
+            'window': window,
+            'windows': windows
+        }
+        if not allowed:
+            info['retry_after'] = max(1, math.ceil(retry_ms / 1000))
+
+        return allowed, info
+
+    def check_rate_limit(self, key: str, limit: int, window: int) -> tuple[bool, dict[str, Any]]:
+        """Check if request is within a single rate limit."""
+        return self.check_limits(key, ((limit, window),))
+
+    def get_status(self, key: str) -> dict[str, Any]:
+        """Get current rate limit status for a key."""
+        if not self._available():
+            return self._fallback.get_status(key)
+
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            pipe.time()
+            pipe.hgetall(self._key(key))
+            (seconds, micros), fields = pipe.execute()
+        except redis.RedisError as e:
+            self._mark_down('status', e)
+            return self._fallback.get_status(key)
+
+        now = seconds + micros / 1_000_000
+        windows = {}
+        for field, tat in fields.items():
+            limit, window = (int(part) for part in field.decode().split(':'))
+            used = max(0.0, float(tat) - now)
+            if used <= 0:
+                continue
+            windows[window] = {
+                'limit': limit,
+                'remaining': min(limit, int((window - used) / (window / limit) + 1e-9)),
+                'seconds_until_full': int(used)
+            }
+
+        return {
+            'is_active': bool(windows),
+            'windows': windows
+        }
+
+    def reset(self, key: str):
+        """Reset rate limit for key."""
+        self._fallback.reset(key)
+        try:
+            self._client.delete(self._key(key))
+        except redis.RedisError as e:
+            self._mark_down('reset', e)
+        logger.debug(f"Rate limit reset: {key}")
+
+    def clear(self):
+        """Clear all rate limit data under this limiter's key prefix."""
+        self._fallback.clear()
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for count, redis_key in enumerate(self._client.scan_iter(match=f"{self._key_prefix}*", count=500), 1):
+                pipe.delete(redis_key)
+                if count % 500 == 0:
+                    pipe.execute()
+            pipe.execute()
+        except redis.RedisError as e:
+            self._mark_down('clear', e)
+            return
         logger.info("Rate limiter cleared")
 
 
@@ -149,7 +447,7 @@ class RateLimiterManager:
 
     def __init__(self):
         """Initialize rate limiter manager."""
-        self.backend: Optional[InMemoryRateLimiter] = None
+        self.backend: Optional[Union[InMemoryRateLimiter, RedisRateLimiter]] = None
         self._initialized = False
         self.enabled = True
 
@@ -157,11 +455,28 @@ class RateLimiterManager:
         """Initialize rate limiter with Flask app."""
         self.enabled = app.config.get('RATE_LIMIT_ENABLED', True)
 
-        if self.enabled:
-            self.backend = InMemoryRateLimiter()
-            logger.info("Rate limiter initialized with in-memory backend")
-        else:
+        if not self.enabled:
             logger.info("Rate limiting disabled")
+            self._initialized = True
+            return
+
+        stripes = app.config.get('RATE_LIMIT_LOCK_STRIPES', 64)
+        storage_url = app.config.get('RATE_LIMIT_STORAGE_URL')
+
+        if storage_url:
+            try:
+                self.backend = RedisRateLimiter.from_url(
+                    storage_url,
+                    key_prefix=app.config.get('RATE_LIMIT_KEY_PREFIX', 'clashfinder:ratelimit:'),
+                    stripes=stripes
+                )
+                logger.info("Rate limiter initialized with Redis backend")
+            except Exception as e:
+                logger.error(f"Redis rate limiter unavailable ({e}), falling back to in-memory")
+                self.backend = InMemoryRateLimiter(stripes=stripes)
+        else:
+            self.backend = InMemoryRateLimiter(stripes=stripes)
+            logger.info("Rate limiter initialized with in-memory backend")
 
         self._initialized = True
 
@@ -172,6 +487,14 @@ class RateLimiterManager:
 
         return self.backend.check_rate_limit(key, limit, window)
 
+    def check_limits(self, key: str, limits: Limits) -> tuple[bool, dict[str, Any]]:
+        """Check several limits for one request."""
+        if not self.enabled or not self.backend:
+            limit, window = limits[0]
+            return True, {'limit': limit, 'remaining': limit, 'reset': 0, 'window': window, 'windows': {}}
+
+        return self.backend.check_limits(key, limits)
+
     def reset(self, key: str):
         """Reset rate limit."""
         if self.backend:
@@ -227,53 +550,37 @@ def rate_limit(per_minute: int = 60, per_hour: int = 600):
 
             client_ip = get_client_ip()
 
-            # Check minute limit
-            minute_key = f"{client_ip}:{request.endpoint}:minute"
-            allowed, info = rate_limiter.check_rate_limit(minute_key, per_minute, 60)
-
-            if not allowed:
-                logger.warning(
-                    f"Rate limit exceeded (minute) | IP: {client_ip} | "
-                    f"Endpoint: {request.endpoint}"
-                )
-                response = jsonify({
-                    'error': 'Rate limit exceeded',
-                    'retry_after': info.get('retry_after', 60)
-                })
-                response.status_code = 429
-                response.headers['X-RateLimit-Limit'] = str(per_minute)
-                response.headers['X-RateLimit-Remaining'] = '0'
-                response.headers['X-RateLimit-Reset'] = str(info.get('reset', ''))
-                response.headers['Retry-After'] = str(info.get('retry_after', 60))
-                return response
-
-            # Check hour limit
-            hour_key = f"{client_ip}:{request.endpoint}:hour"
-            allowed, info = rate_limiter.check_rate_limit(hour_key, per_hour, 3600)
+            # Minute and hour limits are checked (and counted) together
+            key = f"{client_ip}:{request.endpoint}"
+            allowed, info = rate_limiter.check_limits(key, ((per_minute, 60), (per_hour, 3600)))
 
             if not allowed:
+                count_rate_limited(request.endpoint)
+                window_name = 'minute' if info['window'] == 60 else 'hour'
                 logger.warning(
-                    f"Rate limit exceeded (hour) | IP: {client_ip} | "
+                    f"Rate limit exceeded ({window_name}) | IP: {client_ip} | "
                     f"Endpoint: {request.endpoint}"
                 )
                 response = jsonify({
                     'error': 'Rate limit exceeded',
-                    'retry_after': info.get('retry_after', 3600)
+                    'retry_after': info['retry_after']
                 })
                 response.status_code = 429
-                response.headers['X-RateLimit-Limit'] = str(per_hour)
+                response.headers['X-RateLimit-Limit'] = str(info['limit'])
                 response.headers['X-RateLimit-Remaining'] = '0'
                 response.headers['X-RateLimit-Reset'] = str(info.get('reset', ''))
-                response.headers['Retry-After'] = str(info.get('retry_after', 3600))
+                response.headers['Retry-After'] = str(info['retry_after'])
                 return response
 
             # Add rate limit headers to successful response
             response = f(*args, **kwargs)
 
             if hasattr(response, 'headers'):
+                windows = info.get('windows', {})
                 response.headers['X-RateLimit-Limit-Minute'] = str(per_minute)
-                response.headers['X-RateLimit-Remaining-Minute'] = str(info.get('remaining', per_minute))
+                response.headers['X-RateLimit-Remaining-Minute'] = str(windows.get(60, per_minute))
                 response.headers['X-RateLimit-Limit-Hour'] = str(per_hour)
+                response.headers['X-RateLimit-Remaining-Hour'] = str(windows.get(3600, per_hour))
 
             return response
 
@@ -287,7 +594,9 @@ def get_rate_limit_status() -> dict[str, Any]:
     Get current rate limit status for the requesting client.
 
     Returns:
-        Dictionary with rate limit information
+        Dictionary with rate limit information; each endpoint's 'minute'
+        and 'hour' entries have is_active, limit, remaining and
+        seconds_until_full
     """
     client_ip = get_client_ip()
 
@@ -305,12 +614,23 @@ def get_rate_limit_status() -> dict[str, Any]:
     }
 
     for endpoint in endpoints_to_check:
-        minute_key = f"{client_ip}:{endpoint}:minute"
-        hour_key = f"{client_ip}:{endpoint}:hour"
+        windows = rate_limiter.get_status(f"{client_ip}:{endpoint}").get('windows', {})
 
         status['endpoints'][endpoint] = {
-            'minute': rate_limiter.get_status(minute_key),
-            'hour': rate_limiter.get_status(hour_key)
+            'minute': _window_status(windows.get(60)),
+            'hour': _window_status(windows.get(3600))
         }
 
-    return status
\ No newline at end of file
+    return status
+
+
+def _window_status(window: Optional[dict[str, Any]]) -> dict[str, Any]:
+    """
+    One window of get_rate_limit_status, in the same shape whether used or not.
+
+    ``limit`` and ``remaining`` are None for a window the client has not
+    used recently (its limit is only known to the route's decorator).
+    """
+    if window is None:
+        return {'is_active': False, 'limit': None, 'remaining': None, 'seconds_until_full': 0}
+    return {'is_active': True, **window}
@@ -2,15 +2,38 @@
 """
 Resource downloader for Data Dragon assets.
 Downloads and updates champion, item, spell, and rune data.
+
+Files are fetched concurrently over one pooled session. A manifest next
+to the data files records the version, ETag and Last-Modified of each
+download: a file already fetched for the current version is not
+requested again, and other versions are requested conditionally so
+unchanged content costs a 304 instead of a full download. Every file
+is written to a temporary name and renamed into place, so readers never
+see a partial file.
+
+download_assets mirrors the champion, item, spell and rune icons of the
+current version under the assets directory, together with Data Dragon's
+sprite sheets and an index of where each icon sits in them (see
+app.services.asset_mirror for the reading side).
 """
 
-import requests
+import os
 import json
-from typing import Dict, Any, Optional, List
+import struct
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.services.resource_manager import index_runes
 from config.logging_config import get_logger
 from config.cdn_config import (
+    ASSET_MIRROR_DIR,
     CDN_BASE_URL,
     DDRAGON_VERSION,
     RESOURCE_PATHS
@@ -18,66 +41,207 @@ from config.cdn_config import (
 
 logger = get_logger('services.resource_downloader')
 
+# Resource name -> (Data Dragon file, local file)
+RESOURCE_FILES = {
+    'champions': ('champion.json', 'champions.json'),
+    'items': ('item.json', 'items.json'),
+    'summoner_spells': ('summoner.json', 'summoner_spells.json'),
+    'runes': ('runesReforged.json', 'runes.json'),
+    'profile_icons': ('profileicon.json', 'profile_icons.json'),
+}
+
+MANIFEST_FILE = 'manifest.json'
+
+# Icon category -> (data file, Data Dragon image group)
+ICON_SOURCES = {
+    'champion': ('champions.json', 'champion'),
+    'item': ('items.json', 'item'),
+    'spell': ('summoner_spells.json', 'spell'),
+}
+
+# Written next to the mirrored icons of each version
+ASSET_INDEX_FILE = 'index.json'
+SPRITE_CSS_FILE = 'sprites.css'
+
+# Download outcomes
+DOWNLOADED = 'downloaded'
+NOT_MODIFIED = 'not_modified'
+SKIPPED = 'skipped'
+FAILED = 'failed'
+
+
+def write_atomic(filepath: Path, content: bytes):
+    """Write a file via a temporary sibling and rename it into place."""
+    fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, prefix=f'.{filepath.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def png_size(content: bytes) -> Optional[Tuple[int, int]]:
+    """Width and height from a PNG's IHDR chunk (None if not a PNG)."""
+    if len(content) < 24 or content[:8] != b'\x89PNG\r\n\x1a\n' or content[12:16] != b'IHDR':
+        return None
+    return struct.unpack('>II', content[16:24])
+
 
 class ResourceDownloader:
     """Downloads game resources from Data Dragon CDN."""
 
-    def __init__(self, data_dir: str = 'app/static/data'):
+    def __init__(
+        self,
+        data_dir: str = 'app/static/data',
+        base_url: str = CDN_BASE_URL,
+        max_workers: int = 5,
+        assets_dir: Optional[str] = None
+    ):
+        """
+        Initialize resource downloader.
+
+        Args:
+            data_dir: Directory the data files are written to
+            base_url: Data Dragon CDN base URL
+            max_workers: Files downloaded in parallel
+            assets_dir: Directory icons are mirrored to (default: ASSET_MIRROR_DIR)
+        """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.assets_dir = Path(assets_dir or ASSET_MIRROR_DIR)
         self.version = DDRAGON_VERSION
+        self.base_url = base_url
+        self.max_workers = max_workers
+
+        # Keep-alive connections shared by all download threads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self._manifest_lock = threading.Lock()
+        self.last_results: Dict[str, Dict[str, Any]] = {}
 
         logger.info(f"Resource downloader initialized | Version: {self.version}")
 
-    def _download_json(self, url: str) -> Optional[Dict[str, Any]]:
+    # Manifest
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        """Load the download manifest (empty if missing or unreadable)."""
+        try:
+            with open(self.data_dir / MANIFEST_FILE, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            return manifest if isinstance(manifest, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, manifest: Dict[str, Any]):
+        write_atomic(self.data_dir / MANIFEST_FILE, json.dumps(manifest, indent=2).encode('utf-8'))
+
+    # Downloads
+
+    def _download_resource(self, resource: str, manifest: Dict[str, Any], force: bool = False) -> Dict[str, Any]:
         """
-        Download JSON from URL.
+        Bring one data file up to date for the current version.
 
         Args:
-            url: URL to download from
+            resource: Key of RESOURCE_FILES
+            manifest: Manifest entries by local file name (updated in place)
+            force: Request the file even if the manifest says it is current
 
         Returns:
-            Parsed JSON data or None on error
+            Result with status, bytes received and seconds taken
         """
+        remote_name, filename = RESOURCE_FILES[resource]
+        filepath = self.data_dir / filename
+        url = f"{self.base_url}/{self.version}/data/en_US/{remote_name}"
+        entry = manifest.get(filename, {})
+        start = time.perf_counter()
+
+        def result(status: str, received: int = 0) -> Dict[str, Any]:
+            return {'status': status, 'bytes': received, 'seconds': round(time.perf_counter() - start, 3)}
+
+        # Data Dragon URLs are versioned, so a file fetched for this version cannot have changed
+        if not force and entry.get('version') == self.version and filepath.exists():
+            return result(SKIPPED)
+
+        headers = {}
+        if filepath.exists():
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
         try:
-            logger.debug(f"Downloading: {url}")
-            response = requests.get(url, timeout=30)
+            response = self.session.get(url, headers=headers, timeout=30)
+
+            if response.status_code == 304:
+                with self._manifest_lock:
+                    manifest[filename] = {**entry, 'version': self.version}
+                return result(NOT_MODIFIED)
+
             response.raise_for_status()
+            content = response.content
+            json.loads(content)  # Never replace a good file with a truncated or HTML error body
 
-            data = response.json()
-            logger.debug(f"Successfully downloaded: {url}")
-            return data
+            write_atomic(filepath, content)
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError, OSError) as e:
             logger.error(f"Error downloading {url}: {e}")
-            return None
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing JSON from {url}: {e}")
-            return None
+            return result(FAILED)
+
+        with self._manifest_lock:
+            manifest[filename] = {
+                'version': self.version,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'size': len(content)
+            }
 
-    def _save_json(self, filename: str, data: Dict[str, Any]) -> bool:
+        logger.info(f"Saved: {filepath}")
+        return result(DOWNLOADED, len(content))
+
+    def download_resources(self, resources: Optional[List[str]] = None, force: bool = False) -> Dict[str, Dict[str, Any]]:
         """
-        Save JSON data to file.
+        Download resources concurrently, skipping unchanged files.
 
         Args:
-            filename: Name of file to save
-            data: Data to save
+            resources: Keys of RESOURCE_FILES (default: all)
+            force: Ignore the manifest's record of files already fetched for this version
 
         Returns:
-            True if successful, False otherwise
+            Per-resource results: status, bytes received and seconds taken
         """
-        filepath = self.data_dir / filename
-
-        try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-
-            logger.info(f"Saved: {filepath}")
-            return True
+        resources = list(resources or RESOURCE_FILES)
+        manifest = self._load_manifest()
+        entries = dict(manifest.get('files', {}))
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(resources)), thread_name_prefix='ddragon') as executor:
+            futures = {resource: executor.submit(self._download_resource, resource, entries, force) for resource in resources}
+            results = {resource: future.result() for resource, future in futures.items()}
+
+        if entries != manifest.get('files', {}):
+            self._save_manifest({'files': entries})
+
+        for resource, outcome in results.items():
+            logger.info(
+                f"{resource:<15} | {outcome['status']:<12} | {outcome['bytes'] / 1024:8.1f} KB | "
+                f"{outcome['seconds'] * 1000:7.0f} ms"
+            )
+        logger.info(
+            f"Resource download finished | Version: {self.version} | "
+            f"Received: {sum(r['bytes'] for r in results.values()) / 1024:.1f} KB | "
+            f"Time: {time.perf_counter() - start:.2f}s"
+        )
 
-        except Exception as e:
-            logger.error(f"Error saving {filepath}: {e}")
-            return False
+        self.last_results = results
+        return results
 
     def download_champions(self) -> bool:
         """
@@ -86,15 +250,7 @@ class ResourceDownloader:
         Returns:
             True if successful, False otherwise
         """
-        logger.info("Downloading champion data")
-
-        url = f"{CDN_BASE_URL}/{self.version}/data/en_US/champion.json"
-        data = self._download_json(url)
-
-        if data:
-            return self._save_json('champions.json', data)
-
-        return False
+        return self.download_resources(['champions'])['champions']['status'] != FAILED
 
     def download_items(self) -> bool:
         """
@@ -103,15 +259,7 @@ class ResourceDownloader:
         Returns:
             True if successful, False otherwise
         """
-        logger.info("Downloading item data")
-
-        url = f"{CDN_BASE_URL}/{self.version}/data/en_US/item.json"
-        data = self._download_json(url)
-
-        if data:
-            return self._save_json('items.json', data)
-
-        return False
+        return self.download_resources(['items'])['items']['status'] != FAILED
 
     def download_summoner_spells(self) -> bool:
         """
@@ -120,15 +268,7 @@ class ResourceDownloader:
         Returns:
             True if successful, False otherwise
         """
-        logger.info("Downloading summoner spell data")
-
-        url = f"{CDN_BASE_URL}/{self.version}/data/en_US/summoner.json"
-        data = self._download_json(url)
-
-        if data:
-            return self._save_json('summoner_spells.json', data)
-
-        return False
+        return self.download_resources(['summoner_spells'])['summoner_spells']['status'] != FAILED
 
     def download_runes(self) -> bool:
         """
@@ -137,15 +277,7 @@ class ResourceDownloader:
         Returns:
             True if successful, False otherwise
         """
-        logger.info("Downloading rune data")
-
-        url = f"{CDN_BASE_URL}/{self.version}/data/en_US/runesReforged.json"
-        data = self._download_json(url)
-
-        if data:
-            return self._save_json('runes.json', data)
-
-        return False
+        return self.download_resources(['runes'])['runes']['status'] != FAILED
 
     def download_profile_icons(self) -> bool:
         """
@@ -154,31 +286,23 @@ class ResourceDownloader:
         Returns:
             True if successful, False otherwise
         """
-        logger.info("Downloading profile icon data")
-
-        url = f"{CDN_BASE_URL}/{self.version}/data/en_US/profileicon.json"
-        data = self._download_json(url)
+        return self.download_resources(['profile_icons'])['profile_icons']['status'] != FAILED
 
-        if data:
-            return self._save_json('profile_icons.json', data)
-
-        return False
-
-    def download_all(self) -> Dict[str, bool]:
+    def download_all(self, force: bool = False) -> Dict[str, bool]:
         """
         Download all game resources.
 
+        Args:
+            force: Re-request files already fetched for this version
+
         Returns:
             Dictionary with download status for each resource
         """
         logger.info("Starting download of all resources")
 
         results = {
-            'champions': self.download_champions(),
-            'items': self.download_items(),
-            'summoner_spells': self.download_summoner_spells(),
-            'runes': self.download_runes(),
-            'profile_icons': self.download_profile_icons()
+            resource: outcome['status'] != FAILED
+            for resource, outcome in self.download_resources(force=force).items()
         }
 
         successful = sum(1 for success in results.values() if success)
@@ -191,6 +315,134 @@ class ResourceDownloader:
 
         return results
 
+    # Icons
+
+    def _load_data(self, filename: str) -> Any:
+        """Load a downloaded data file (None if missing or invalid)."""
+        try:
+            with open(self.data_dir / filename, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Cannot read {filename} for icon mirror: {e}")
+            return None
+
+    def _mirror_file(self, filepath: Path, url: str) -> Optional[int]:
+        """Fetch one image into the mirror; returns bytes received or None on failure."""
+        try:
+            response = self.session.get(url, timeout=30)
+            response.raise_for_status()
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(filepath, response.content)
+            return len(response.content)
+        except (requests.exceptions.RequestException, OSError) as e:
+            logger.warning(f"Error mirroring {url}: {e}")
+            return None
+
+    def download_assets(self, categories: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Mirror icons and sprite sheets of the current version locally.
+
+        Icons are listed from the data files, so run download_resources
+        first. Files already mirrored are not fetched again (everything
+        lives under a per-version directory). Afterwards the version's
+        index.json records the mirrored icons and their sprite sheet
+        coordinates, and sprites.css binds each sheet to a CSS class.
+
+        Args:
+            categories: Keys of ICON_SOURCES and/or 'rune' (default: all)
+
+        Returns:
+            Counts of files downloaded, already present and failed, with bytes and seconds
+        """
+        categories = list(categories or [*ICON_SOURCES, 'rune'])
+        version_dir = self.assets_dir / self.version
+        start = time.perf_counter()
+
+        names: Dict[str, set] = {}  # category -> icon names
+        sprites: Dict[str, Dict[str, list]] = {}  # category -> icon -> [sheet, x, y, w, h]
+        urls: Dict[str, str] = {}  # path under version_dir -> source URL
+
+        for category in categories:
+            names[category] = set()
+
+            if category == 'rune':
+                # Rune icons are unversioned and Data Dragon has no sprite sheets for them
+                for record in index_runes(self._load_data('runes.json') or []).values():
+                    icon = record.get('icon')
+                    if icon:
+                        names[category].add(icon)
+                        urls[f'rune/{icon}'] = f"{self.base_url}/img/{icon}"
+                continue
+
+            data_file, group = ICON_SOURCES[category]
+            sprites[category] = {}
+            for record in (self._load_data(data_file) or {}).get('data', {}).values():
+                image = record.get('image') or {}
+                name = image.get('full')
+                if not name:
+                    continue
+
+                names[category].add(name)
+                urls[f'{category}/{name}'] = f"{self.base_url}/{self.version}/img/{group}/{name}"
+
+                sheet = image.get('sprite')
+                if sheet:
+                    sprites[category][name] = [sheet, image.get('x', 0), image.get('y', 0), image.get('w', 0), image.get('h', 0)]
+                    urls[f'sprite/{sheet}'] = f"{self.base_url}/{self.version}/img/sprite/{sheet}"
+
+        missing = {path: url for path, url in urls.items() if not (version_dir / path).exists()}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='ddragon-img') as executor:
+            received = list(executor.map(
+                lambda item: self._mirror_file(version_dir / item[0], item[1]), missing.items()
+            ))
+
+        # Index only what is actually on disk, so a failed file falls back to the CDN
+        sheets = {}
+        for path in urls:
+            if path.startswith('sprite/') and (version_dir / path).exists():
+                with open(version_dir / path, 'rb') as f:
+                    size = png_size(f.read(24))
+                if size:
+                    sheets[path[len('sprite/'):]] = list(size)
+
+        index = {
+            'version': self.version,
+            'files': {
+                category: sorted(name for name in category_names if (version_dir / category / name).exists())
+                for category, category_names in names.items()
+            },
+            'sheets': sheets,
+            'sprites': {
+                category: {name: entry for name, entry in entries.items() if entry[0] in sheets}
+                for category, entries in sprites.items()
+            }
+        }
+
+        css = ['.dd-sprite { display: inline-block; background-repeat: no-repeat; vertical-align: middle; }']
+        for sheet in sorted(sheets):
+            css.append(f'.dd-sprite-{Path(sheet).stem} {{ background-image: url("sprite/{sheet}"); }}')
+
+        version_dir.mkdir(parents=True, exist_ok=True)
+        write_atomic(version_dir / ASSET_INDEX_FILE, json.dumps(index).encode('utf-8'))
+        write_atomic(version_dir / SPRITE_CSS_FILE, ('\n'.join(css) + '\n').encode('utf-8'))
+
+        summary = {
+            'downloaded': sum(1 for size in received if size is not None),
+            'present': len(urls) - len(missing),
+            'failed': sum(1 for size in received if size is None),
+            'bytes': sum(size for size in received if size),
+            'seconds': round(time.perf_counter() - start, 3)
+        }
+
+        logger.info(
+            f"Icon mirror updated | Version: {self.version} | Downloaded: {summary['downloaded']} | "
+            f"Present: {summary['present']} | Failed: {summary['failed']} | "
+            f"Sheets: {len(sheets)} | Time: {summary['seconds']:.2f}s"
+        )
+
+        return summary
+
     def get_latest_version(self) -> Optional[str]:
         """
         Get the latest Data Dragon version.
@@ -199,8 +451,8 @@ class ResourceDownloader:
             Latest version string or None on error
         """
         try:
-            url = "https://ddragon.leagueoflegends.com/api/versions.json"
-            response = requests.get(url, timeout=10)
+            url = f"{self.base_url.rsplit('/cdn', 1)[0]}/api/versions.json"
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
 
             versions = response.json()
@@ -219,6 +471,9 @@ class ResourceDownloader:
         """
         Update to a new Data Dragon version.
 
+        Once the data files are in place the version's icons and sprite
+        sheets are mirrored as well (see download_assets).
+
         Args:
             new_version: Version to update to (or None for latest)
 
@@ -242,6 +497,13 @@ class ResourceDownloader:
 
         if all(results.values()):
             logger.info(f"Successfully updated to version {new_version}")
+
+            # Icons the mirror lacks fall back to the CDN, so this never fails the update
+            try:
+                self.download_assets()
+            except Exception as e:
+                logger.error(f"Icon mirror update failed for version {new_version}: {e}")
+
             return True
         else:
             logger.error(f"Failed to update to version {new_version}, reverting")
@@ -286,4 +548,4 @@ class ResourceDownloader:
 
 
 # Global downloader instance
-resource_downloader = ResourceDownloader()
\ No newline at end of file
+resource_downloader = ResourceDownloader()
@@ -2,13 +2,36 @@
 """
 Resource manager for game assets.
 Handles champion icons, items, summoner spells, and runes.
+
+All game data is held in one immutable GameDataSnapshot. A reload builds
+a complete new snapshot off the request path and publishes it with a
+single reference swap; each request pins the snapshot current when it
+started (see pin), so it never mixes two patches. A replaced snapshot
+is freed as soon as the last request pinning it finishes.
+
+When the updater has compiled the JSON files (compile_game_data), a
+snapshot maps the compiled file instead of parsing JSON: workers share
+its pages and decode only the records they look up. A compiled file
+older than the JSON files is ignored.
 """
 
 import os
 import json
-from typing import Dict, Any, Optional, List
+import itertools
+import threading
+import weakref
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, Iterable, Mapping, Callable
 from pathlib import Path
 
+from app.services.game_data_file import (
+    GAME_DATA_FILE,
+    GameDataFile,
+    GameDataFileError,
+    source_fingerprint,
+    write_game_data
+)
 from config.logging_config import get_logger
 from config.cdn_config import (
     CDN_BASE_URL,
@@ -22,6 +45,80 @@ from config.cdn_config import (
 
 logger = get_logger('services.resource_manager')
 
+# Snapshot section -> (source file, value when the file is missing)
+SOURCE_FILES = {
+    'champions': ('champions.json', {'data': {}}),
+    'items': ('items.json', {'data': {}}),
+    'summoner_spells': ('summoner_spells.json', {'data': {}}),
+    'runes': ('runes.json', []),
+}
+
+
+def index_by_key(data: Dict[str, Any]) -> Dict[int, Dict[str, Any]]:
+    """Index Data Dragon champion/spell records by their numeric ``key``."""
+    index = {}
+    for record in data.get('data', {}).values():
+        try:
+            index.setdefault(int(record.get('key', -1)), record)
+        except (TypeError, ValueError):
+            continue
+    return index
+
+
+def index_by_data_key(data: Dict[str, Any]) -> Dict[int, Dict[str, Any]]:
+    """Index Data Dragon item records by their numeric key in ``data``."""
+    return {int(key): record for key, record in data.get('data', {}).items() if key.isdigit()}
+
+
+def index_runes(trees: Iterable[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+    """Index rune trees and the runes in their slots by ``id``."""
+    index = {}
+    for tree in trees:
+        index.setdefault(tree.get('id'), tree)
+        for slot in tree.get('slots', []):
+            for rune in slot.get('runes', []):
+                index.setdefault(rune.get('id'), rune)
+    return index
+
+
+@dataclass(frozen=True, eq=False)
+class GameDataSnapshot:
+    """
+    One consistent set of game data, loaded together.
+
+    Never modified after it is built; readers may hold on to it without
+    locks. Lookups go through the *_by_id mappings; the whole documents
+    are only loaded on first access. Both are shared, so callers must
+    treat them as read-only too.
+    """
+
+    version: str
+    generation: int
+    champions_by_id: Mapping[int, Dict[str, Any]]
+    items_by_id: Mapping[int, Dict[str, Any]]
+    summoner_spells_by_id: Mapping[int, Dict[str, Any]]
+    runes_by_id: Mapping[int, Dict[str, Any]]
+    # Section name -> whole document
+    load_document: Callable[[str], Any] = field(repr=False)
+    # 'json', or the compiled file it maps
+    source: str = 'json'
+
+    @property
+    def champions(self) -> Dict[str, Any]:
+        return self.load_document('champions')
+
+    @property
+    def items(self) -> Dict[str, Any]:
+        return self.load_document('items')
+
+    @property
+    def summoner_spells(self) -> Dict[str, Any]:
+        return self.load_document('summoner_spells')
+
+    @property
+    def runes(self) -> List[Dict[str, Any]]:
+        return self.load_document('runes')
+
 
 class ResourceManager:
     """Manages game resource data and URLs."""
@@ -30,11 +127,17 @@ class ResourceManager:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
-        # Cache for loaded JSON data
-        self._champions: Optional[Dict[str, Any]] = None
-        self._items: Optional[Dict[str, Any]] = None
-        self._summoner_spells: Optional[Dict[str, Any]] = None
-        self._runes: Optional[Dict[str, Any]] = None
+        # Published snapshot; replaced whole, never mutated
+        self._snapshot: Optional[GameDataSnapshot] = None
+        # Snapshot pinned by the request being served in this context
+        self._pinned: ContextVar[Optional[GameDataSnapshot]] = ContextVar(
+            f'game_data_{id(self)}', default=None
+        )
+        # Serializes builders only; readers never take it
+        self._build_lock = threading.Lock()
+        self._generations = itertools.count(1)
+        # Snapshots still referenced somewhere (published or pinned)
+        self._live: 'weakref.WeakSet[GameDataSnapshot]' = weakref.WeakSet()
 
         logger.info(f"Resource manager initialized | Data dir: {self.data_dir}")
 
@@ -68,25 +171,157 @@ class ResourceManager:
             logger.error(f"Error saving {filename}: {e}")
             return False
 
+    # Snapshots
+
+    def _load_documents(self) -> Dict[str, Any]:
+        """Parse every JSON source file."""
+        return {
+            name: self._load_json(filename) or default
+            for name, (filename, default) in SOURCE_FILES.items()
+        }
+
+    def _open_compiled(self) -> Optional[GameDataFile]:
+        """Map the compiled game data file, unless it is missing, invalid or stale."""
+        filepath = self.data_dir / GAME_DATA_FILE
+        if not filepath.exists():
+            return None
+
+        try:
+            compiled = GameDataFile(filepath)
+        except GameDataFileError as e:
+            logger.warning(f"Ignoring compiled game data: {e}")
+            return None
+
+        if compiled.sources != source_fingerprint(self.data_dir, [f for f, _ in SOURCE_FILES.values()]):
+            logger.warning(f"Ignoring {GAME_DATA_FILE}: JSON files changed since it was compiled")
+            return None
+
+        return compiled
+
+    def _build_snapshot(self, version: str) -> GameDataSnapshot:
+        """Map or read and index every file into a new snapshot (not yet published)."""
+        compiled = self._open_compiled()
+
+        if compiled is not None:
+            snapshot = GameDataSnapshot(
+                version=version,
+                generation=next(self._generations),
+                champions_by_id=compiled.indexes['champions'],
+                items_by_id=compiled.indexes['items'],
+                summoner_spells_by_id=compiled.indexes['summoner_spells'],
+                runes_by_id=compiled.indexes['runes'],
+                load_document=compiled.document,
+                source=GAME_DATA_FILE
+            )
+        else:
+            documents = self._load_documents()
+            snapshot = GameDataSnapshot(
+                version=version,
+                generation=next(self._generations),
+                champions_by_id=index_by_key(documents['champions']),
+                items_by_id=index_by_data_key(documents['items']),
+                summoner_spells_by_id=index_by_key(documents['summoner_spells']),
+                runes_by_id=index_runes(documents['runes']),
+                load_document=documents.__getitem__
+            )
+
+        self._live.add(snapshot)
+        return snapshot
+
+    def compile_game_data(self, version: Optional[str] = None) -> Path:
+        """
+        Compile the JSON files into the file snapshots map (see game_data_file).
+
+        Run after downloading; the next published snapshot uses it.
+
+        Args:
+            version: Data Dragon version of the files (default: current version)
+
+        Returns:
+            Path of the compiled file
+        """
+        filepath = self.data_dir / GAME_DATA_FILE
+        # Fingerprint before reading, so a file replaced meanwhile marks the output stale
+        sources = source_fingerprint(self.data_dir, [f for f, _ in SOURCE_FILES.values()])
+        documents = self._load_documents()
+
+        size = write_game_data(filepath, version or self.get_data_version(), {
+            'champions': (documents['champions'], index_by_key(documents['champions'])),
+            'items': (documents['items'], index_by_data_key(documents['items'])),
+            'summoner_spells': (documents['summoner_spells'], index_by_key(documents['summoner_spells'])),
+            'runes': (documents['runes'], index_runes(documents['runes']))
+        }, sources=sources)
+
+        logger.info(f"Game data compiled | File: {filepath} | Size: {size / 1024:.1f}KB")
+        return filepath
+
+    def _current(self) -> GameDataSnapshot:
+        """The published snapshot, loading the first one if needed."""
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+
+        with self._build_lock:
+            if self._snapshot is None:
+                self._snapshot = self._build_snapshot(DDRAGON_VERSION)
+            return self._snapshot
+
+    @property
+    def snapshot(self) -> GameDataSnapshot:
+        """Snapshot for the caller: the request's pinned one, else the published one."""
+        return self._pinned.get() or self._snapshot or self._current()
+
+    def pin(self) -> GameDataSnapshot:
+        """Pin the published snapshot for the rest of the current request."""
+        snapshot = self._current()
+        self._pinned.set(snapshot)
+        return snapshot
+
+    def unpin(self):
+        """Release the current request's snapshot."""
+        self._pinned.set(None)
+
+    def publish(self, version: Optional[str] = None) -> GameDataSnapshot:
+        """
+        Build a snapshot from the files on disk and make it current.
+
+        The old snapshot stays intact for requests that pinned it.
+
+        Args:
+            version: Data Dragon version of the files (default: current version)
+        """
+        with self._build_lock:
+            if version is None:
+                version = self._snapshot.version if self._snapshot else DDRAGON_VERSION
+            snapshot = self._build_snapshot(version)
+            self._snapshot = snapshot
+
+        logger.info(f"Game data published | Version: {snapshot.version} | Generation: {snapshot.generation}")
+        return snapshot
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Published snapshot and how many snapshots are still alive."""
+        snapshot = self._snapshot
+        return {
+            'version': snapshot.version if snapshot else None,
+            'generation': snapshot.generation if snapshot else None,
+            'source': snapshot.source if snapshot else None,
+            'live_snapshots': len(self._live),
+            'champions': len(snapshot.champions_by_id) if snapshot else 0,
+            'items': len(snapshot.items_by_id) if snapshot else 0
+        }
+
     # Champions
 
     def load_champions(self, force_reload: bool = False) -> Dict[str, Any]:
-        """Load champion data."""
-        if self._champions is not None and not force_reload:
-            return self._champions
-
-        self._champions = self._load_json('champions.json') or {'data': {}}
-        return self._champions
+        """Load champion data (force_reload publishes a new snapshot)."""
+        if force_reload:
+            self.publish()
+        return self.snapshot.champions
 
     def get_champion_by_id(self, champion_id: int) -> Optional[Dict[str, Any]]:
         """Get champion data by ID."""
-        champions = self.load_champions()
-
-        for champ_key, champ_data in champions.get('data', {}).items():
-            if int(champ_data.get('key', -1)) == champion_id:
-                return champ_data
-
-        return None
+        return self.snapshot.champions_by_id.get(champion_id)
 
     def get_champion_name(self, champion_id: int) -> str:
         """Get champion name by ID."""
@@ -107,17 +342,14 @@ class ResourceManager:
     # Items
 
     def load_items(self, force_reload: bool = False) -> Dict[str, Any]:
-        """Load item data."""
-        if self._items is not None and not force_reload:
-            return self._items
-
-        self._items = self._load_json('items.json') or {'data': {}}
-        return self._items
+        """Load item data (force_reload publishes a new snapshot)."""
+        if force_reload:
+            self.publish()
+        return self.snapshot.items
 
     def get_item_by_id(self, item_id: int) -> Optional[Dict[str, Any]]:
         """Get item data by ID."""
-        items = self.load_items()
-        return items.get('data', {}).get(str(item_id))
+        return self.snapshot.items_by_id.get(item_id)
 
     def get_item_name(self, item_id: int) -> str:
         """Get item name by ID."""
@@ -138,22 +370,14 @@ class ResourceManager:
     # Summoner Spells
 
     def load_summoner_spells(self, force_reload: bool = False) -> Dict[str, Any]:
-        """Load summoner spell data."""
-        if self._summoner_spells is not None and not force_reload:
-            return self._summoner_spells
-
-        self._summoner_spells = self._load_json('summoner_spells.json') or {'data': {}}
-        return self._summoner_spells
+        """Load summoner spell data (force_reload publishes a new snapshot)."""
+        if force_reload:
+            self.publish()
+        return self.snapshot.summoner_spells
 
     def get_summoner_spell_by_id(self, spell_id: int) -> Optional[Dict[str, Any]]:
         """Get summoner spell data by ID."""
-        spells = self.load_summoner_spells()
-
-        for spell_key, spell_data in spells.get('data', {}).items():
-            if int(spell_data.get('key', -1)) == spell_id:
-                return spell_data
-
-        return None
+        return self.snapshot.summoner_spells_by_id.get(spell_id)
 
     def get_summoner_spell_name(self, spell_id: int) -> str:
         """Get summoner spell name by ID."""
@@ -174,29 +398,14 @@ class ResourceManager:
     # Runes
 
     def load_runes(self, force_reload: bool = False) -> List[Dict[str, Any]]:
-        """Load rune data."""
-        if self._runes is not None and not force_reload:
-            return self._runes
-
-        self._runes = self._load_json('runes.json') or []
-        return self._runes
+        """Load rune data (force_reload publishes a new snapshot)."""
+        if force_reload:
+            self.publish()
+        return self.snapshot.runes
 
     def get_rune_by_id(self, rune_id: int) -> Optional[Dict[str, Any]]:
-        """Get rune data by ID."""
-        runes = self.load_runes()
-
-        # Search in all rune trees
-        for tree in runes:
-            if tree.get('id') == rune_id:
-                return tree
-
-            # Search in slots
-            for slot in tree.get('slots', []):
-                for rune in slot.get('runes', []):
-                    if rune.get('id') == rune_id:
-                        return rune
-
-        return None
+        """Get rune data (a tree or a rune in one of its slots) by ID."""
+        return self.snapshot.runes_by_id.get(rune_id)
 
     def get_rune_name(self, rune_id: int) -> str:
         """Get rune name by ID."""
@@ -216,17 +425,20 @@ class ResourceManager:
 
     # Utility methods
 
-    def reload_all(self):
-        """Reload all resource data."""
+    def reload_all(self, version: Optional[str] = None) -> GameDataSnapshot:
+        """
+        Reload all resource data as one new snapshot.
+
+        Args:
+            version: Data Dragon version of the files on disk
+        """
         logger.info("Reloading all resource data")
-        self.load_champions(force_reload=True)
-        self.load_items(force_reload=True)
-        self.load_summoner_spells(force_reload=True)
-        self.load_runes(force_reload=True)
+        return self.publish(version)
 
     def get_data_version(self) -> str:
-        """Get current Data Dragon version."""
-        return DDRAGON_VERSION
+        """Get Data Dragon version of the caller's snapshot."""
+        snapshot = self._pinned.get() or self._snapshot
+        return snapshot.version if snapshot else DDRAGON_VERSION
 
     def check_resources_exist(self) -> Dict[str, bool]:
         """Check if all required resource files exist."""
@@ -5,14 +5,25 @@ Handles all interactions with Riot Games API endpoints.
 """
 
 import time
+import threading
 import requests
-from typing import Optional, List, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+from typing import Optional, List, Dict, Any, Tuple, Iterator
 from flask import current_app
 
 from config.logging_config import get_logger
-from app.services.cache import cached, cache
+from app.services.cache import cached, cache, record_cache_hits
+from app.services.api.session_pool import session_pool
+from app.services.api.rate_governor import rate_governor
+from app.services.api.request_scheduler import request_scheduler, request_priority, current_priority
+from app.services.api.request_trace import request_tracer
+from app.services.match_store import match_store
+from app.services.metrics import riot_fetch
+from app.services.match_projection import MatchRecord, pack_match, unpack_match, load_record
 from app.models.game_models import Account, Summoner, Match, ClashTeam
 from app.utils.formatters import slugify_server
+from app.utils.request_stats import charge_riot_call, timed
 logger = get_logger('services.riot_api')
 
 # Server to region mapping
@@ -71,6 +82,17 @@ class NotFoundError(RiotAPIError):
     pass
 
 
+class CallBudgetExceeded(RateLimitError):
+    """
+    Raised when a request has spent its Riot call cap (RIOT_CALLS_PER_REQUEST_MAX).
+
+    Says nothing about the data being fetched, so cached loaders let it
+    propagate instead of caching an empty result for everyone.
+    """
+    # Not shared with single-flight waiters from other requests (see SingleFlight)
+    per_request = True
+
+
 def get_api_key() -> str:
     """Get Riot API key from config."""
     api_key = current_app.config.get('RIOT_API_KEY')
@@ -79,6 +101,20 @@ def get_api_key() -> str:
     return api_key
 
 
+def get_api_base_url(host: str) -> str:
+    """
+    Build base URL for a Riot API routing or platform host.
+
+    Args:
+        host: Routing value (e.g. 'europe') or platform code (e.g. 'euw1')
+
+    Returns:
+        Base URL without trailing slash
+    """
+    template = current_app.config.get('RIOT_API_BASE_URL') or 'https://{host}.api.riotgames.com'
+    return template.format(host=host).rstrip('/')
+
+
 def get_server_code(server: str) -> str:
     """Convert server name to server code."""
     return server_codes.get(server.upper(), server.lower())
@@ -97,30 +133,37 @@ def make_api_request(
 ) -> Optional[Dict[str, Any]]:
     """Make HTTP request to Riot API with error handling."""
 
-    # TEMPORARY DEBUG
-    logger.warning(f" Making request:")
-    logger.warning(f"   URL: {url}")
-    logger.warning(f"   Headers: {headers}")
-    logger.warning(f"   Params: {params}")
+    # Fail fast once this request has made as many calls as it may
+    if not charge_riot_call():
+        raise CallBudgetExceeded("Riot call cap for this request reached")
+
+    # Wait for Riot app/method budget instead of spending a request on a 429
+    host, method = rate_governor.classify(url)
+    with timed('riot_queue'):
+        acquired = request_scheduler.acquire(host, method)
+    if not acquired:
+        raise RateLimitError(f"Riot API budget exhausted for {method}")
+
+    trace = request_tracer.begin(url, method, headers, params)
 
     try:
-        response = requests.get(
-            url,
-            headers=headers,
-            params=params,
-            timeout=timeout
-        )
-
-        # DEBUG response
-        logger.warning(f" Response:")
-        logger.warning(f"   Status: {response.status_code}")
-        logger.warning(f"   Headers: {dict(response.headers)}")
-        if response.status_code == 401:
-            logger.warning(f"   Body: {response.text}")
+        with riot_fetch(host, method) as call, timed('riot'):
+            response = session_pool.get(
+                url,
+                headers=headers,
+                params=params,
+                timeout=timeout
+            )
+            call.status = response.status_code
+        rate_governor.update(host, method, response.headers)
+        request_tracer.end(trace, response)
 
         # Handle rate limiting
         if response.status_code == 429:
             retry_after = response.headers.get('Retry-After', 60)
+            rate_governor.throttle(
+                host, method, float(retry_after), response.headers.get('X-Rate-Limit-Type')
+            )
             logger.warning(f"Rate limit hit | Retry after: {retry_after}s | URL: {url}")
             raise RateLimitError(f"Rate limit exceeded. Retry after {retry_after} seconds")
 
@@ -140,15 +183,17 @@ def make_api_request(
         return response.json()
 
     except requests.exceptions.Timeout:
+        request_tracer.end(trace, error='timeout')
         logger.error(f"Request timeout | URL: {url}")
         raise RiotAPIError("Request timeout")
 
     except requests.exceptions.RequestException as e:
+        request_tracer.end(trace, error=type(e).__name__)
         logger.error(f"Request error | URL: {url} | Error: {e}")
         raise RiotAPIError(f"Request failed: {str(e)}")
 
 
-@cached(ttl=3600, key_prefix='account')
+@cached(ttl=3600, key_prefix='account', single_flight=True)
 def get_account_info(game_name: str, tag_line: str, server: str) -> Optional[Dict[str, Any]]:
     """
     Get account information by Riot ID.
@@ -164,7 +209,7 @@ def get_account_info(game_name: str, tag_line: str, server: str) -> Optional[Dic
     region = get_region(server)
     api_key = get_api_key()
 
-    url = f"https://{region}.api.riotgames.com/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}"
+    url = f"{get_api_base_url(region)}/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}"
     headers = {"X-Riot-Token": api_key}
 
     logger.debug(f"Fetching account info | {game_name}#{tag_line} | Region: {region}")
@@ -173,12 +218,14 @@ def get_account_info(game_name: str, tag_line: str, server: str) -> Optional[Dic
         return make_api_request(url, headers=headers)
     except NotFoundError:
         return None
+    except CallBudgetExceeded:
+        raise
     except RiotAPIError as e:
         logger.error(f"Failed to get account info: {e}")
         return None
 
 
-@cached(ttl=1800, key_prefix='summoner')
+@cached(ttl=1800, key_prefix='summoner', single_flight=True)
 def get_summoner_info_puuid(puuid: str, server: str) -> Optional[Dict[str, Any]]:
     """
     Get summoner information by PUUID.
@@ -193,7 +240,7 @@ def get_summoner_info_puuid(puuid: str, server: str) -> Optional[Dict[str, Any]]
     server_code = get_server_code(server)
     api_key = get_api_key()
 
-    url = f"https://{server_code}.api.riotgames.com/lol/summoner/v4/summoners/by-puuid/{puuid}"
+    url = f"{get_api_base_url(server_code)}/lol/summoner/v4/summoners/by-puuid/{puuid}"
     headers = {"X-Riot-Token": api_key}
 
     logger.debug(f"Fetching summoner info | PUUID: {puuid[:8]}... | Server: {server_code}")
@@ -202,12 +249,14 @@ def get_summoner_info_puuid(puuid: str, server: str) -> Optional[Dict[str, Any]]
         return make_api_request(url, headers=headers)
     except NotFoundError:
         return None
+    except CallBudgetExceeded:
+        raise
     except RiotAPIError as e:
         logger.error(f"Failed to get summoner info: {e}")
         return None
 
 
-@cached(ttl=300, key_prefix='matches')
+@cached(ttl=300, key_prefix='matches', single_flight=True, stale_ttl=900)
 def get_match_ids(
         puuid: str,
         server: str,
@@ -231,7 +280,7 @@ def get_match_ids(
     region = get_region(server)
     api_key = get_api_key()
 
-    url = f"https://{region}.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids"
+    url = f"{get_api_base_url(region)}/lol/match/v5/matches/by-puuid/{puuid}/ids"
     headers = {"X-Riot-Token": api_key}
     params = {
         "start": start,
@@ -246,41 +295,212 @@ def get_match_ids(
     try:
         result = make_api_request(url, headers=headers, params=params)
         return result if result else []
+    except CallBudgetExceeded:
+        raise
     except RiotAPIError as e:
         logger.error(f"Failed to get match IDs: {e}")
         return []
 
 
-@cached(ttl=3600, key_prefix='match')
-def get_match_details(match_id: str, server: str) -> Optional[Dict[str, Any]]:
+@cached(ttl=3600, key_prefix='match', single_flight=True)
+def get_match_record(match_id: str, server: str) -> Optional[MatchRecord]:
     """
-    Get detailed match information.
+    Get a match as a packed projection record (what the cache and store hold).
 
     Args:
         match_id: Match ID
         server: Server name
 
     Returns:
-        Match data dictionary or None
+        Packed match record or None
     """
+    # Finished matches never change - read through the persistent store first
+    stored = match_store.get(match_id)
+    if stored is not None:
+        logger.debug(f"Match store hit | ID: {match_id}")
+        return stored
+
     region = get_region(server)
     api_key = get_api_key()
 
-    url = f"https://{region}.api.riotgames.com/lol/match/v5/matches/{match_id}"
+    url = f"{get_api_base_url(region)}/lol/match/v5/matches/{match_id}"
     headers = {"X-Riot-Token": api_key}
 
     logger.debug(f"Fetching match details | ID: {match_id}")
 
     try:
-        return make_api_request(url, headers=headers)
+        match_data = make_api_request(url, headers=headers)
+        if not match_data:
+            return None
+
+        record = pack_match(match_data)
+        match_store.put(match_id, record)
+        return record
     except NotFoundError:
         return None
+    except CallBudgetExceeded:
+        raise
     except RiotAPIError as e:
         logger.error(f"Failed to get match details: {e}")
         return None
 
 
-@cached(ttl=300, key_prefix='clash_team')
+def get_match_details(match_id: str, server: str) -> Optional[Dict[str, Any]]:
+    """
+    Get detailed match information.
+
+    Only the projected fields (see match_projection) are present.
+
+    Args:
+        match_id: Match ID
+        server: Server name
+
+    Returns:
+        Match data dictionary or None (also once the request's call cap is spent)
+    """
+    try:
+        return unpack_match(load_record(get_match_record(match_id, server)))
+    except CallBudgetExceeded:
+        return None
+
+
+# Process-wide cap on in-flight match detail fetches (sized from RIOT_API_MAX_CONCURRENCY)
+_fetch_slots: Optional[threading.BoundedSemaphore] = None
+_fetch_slots_lock = threading.Lock()
+
+
+def init_fetch_slots(max_concurrency: int):
+    """
+    Size the process-wide cap on concurrent match fetches.
+
+    Called from create_app with RIOT_API_MAX_CONCURRENCY. Fetches already
+    holding a slot finish on the semaphore they acquired.
+
+    Args:
+        max_concurrency: Match fetches in flight across all requests
+    """
+    global _fetch_slots
+
+    with _fetch_slots_lock:
+        _fetch_slots = threading.BoundedSemaphore(max(1, max_concurrency))
+
+
+def _get_fetch_slots() -> threading.BoundedSemaphore:
+    """Get the shared semaphore limiting concurrent Riot fetches."""
+    global _fetch_slots
+
+    if _fetch_slots is None:
+        with _fetch_slots_lock:
+            if _fetch_slots is None:
+                _fetch_slots = threading.BoundedSemaphore(current_app.config.get('RIOT_API_MAX_CONCURRENCY', 8))
+
+    return _fetch_slots
+
+
+def iter_match_details(
+        match_ids: List[str],
+        server: str,
+        max_concurrency: Optional[int] = None
+) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+    """
+    Fetch details for many matches in parallel, yielding each as it arrives.
+
+    Cached matches are yielded first, then misses in completion order.
+    Concurrency is bounded per call and across the whole process (by
+    RIOT_API_MAX_CONCURRENCY, whatever a call asks for) so a burst of
+    page loads cannot exceed the Riot API budget. Works under
+    gevent workers, where the pool threads are monkey-patched greenlets.
+
+    Args:
+        match_ids: Match IDs to fetch
+        server: Server name
+        max_concurrency: Maximum parallel requests for this call (default: RIOT_API_MAX_CONCURRENCY)
+
+    Yields:
+        Tuples of (index into match_ids, match data or None)
+    """
+    if not match_ids:
+        return
+
+    if max_concurrency is None:
+        max_concurrency = current_app.config.get('RIOT_API_MAX_CONCURRENCY', 8)
+
+    # Resolve cached matches in one round-trip; only misses go to Riot
+    # (each miss is counted once, by get_match_record's own cache lookup)
+    cache_keys = [get_match_record.make_cache_key(match_id, server) for match_id in match_ids]
+    missing = []
+    for index, record in enumerate(cache.get_many(cache_keys, count_misses=False)):
+        match_data = unpack_match(load_record(record))
+        if match_data is None:
+            missing.append(index)
+        else:
+            yield index, match_data
+
+    record_cache_hits(get_match_record.stats_prefix, len(match_ids) - len(missing))
+
+    if not missing:
+        return
+
+    workers = max(1, min(max_concurrency, len(missing)))
+    if workers == 1:
+        for index in missing:
+            yield index, get_match_details(match_ids[index], server)
+        return
+
+    app = current_app._get_current_object()
+    slots = _get_fetch_slots()
+    priority = current_priority()  # Pool threads have no request context of their own
+
+    def _fetch(match_id: str) -> Optional[Dict[str, Any]]:
+        with slots, app.app_context(), request_priority(priority):
+            return get_match_details(match_id, server)
+
+    start_time = time.time()
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='riot-fetch')
+
+    try:
+        # Each task runs in a copy of this context so request accounting follows it
+        futures = {executor.submit(copy_context().run, _fetch, match_ids[index]): index for index in missing}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        # Consumer may stop early (e.g. a closed stream) - drop queued fetches
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    logger.debug(
+        f"Fetched {len(missing)}/{len(match_ids)} matches concurrently | Workers: {workers} | "
+        f"Time: {time.time() - start_time:.2f}s"
+    )
+
+
+def fetch_match_details_concurrently(
+        match_ids: List[str],
+        server: str,
+        max_concurrency: Optional[int] = None
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Fetch details for many matches in parallel.
+
+    Results keep the order of ``match_ids``; failed lookups are None.
+    See iter_match_details for concurrency limits.
+
+    Args:
+        match_ids: Match IDs to fetch
+        server: Server name
+        max_concurrency: Maximum parallel requests (default: RIOT_API_MAX_CONCURRENCY)
+
+    Returns:
+        List of match data dictionaries (or None) aligned with match_ids
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(match_ids)
+
+    for index, match_data in iter_match_details(match_ids, server, max_concurrency):
+        results[index] = match_data
+
+    return results
+
+
+@cached(ttl=300, key_prefix='clash_team', single_flight=True, stale_ttl=900)
 def get_team_info_puuid(summoner_id: str, server: str) -> Optional[Dict[str, Any]]:
     """
     Get clash team information for a summoner.
@@ -295,7 +515,7 @@ def get_team_info_puuid(summoner_id: str, server: str) -> Optional[Dict[str, Any
     server_code = get_server_code(server)
     api_key = get_api_key()
 
-    url = f"https://{server_code}.api.riotgames.com/lol/clash/v1/players/by-summoner/{summoner_id}"
+    url = f"{get_api_base_url(server_code)}/lol/clash/v1/players/by-summoner/{summoner_id}"
     headers = {"X-Riot-Token": api_key}
 
     logger.debug(f"Fetching clash team | Summoner ID: {summoner_id[:8]}...")
@@ -308,6 +528,8 @@ def get_team_info_puuid(summoner_id: str, server: str) -> Optional[Dict[str, Any
         return None
     except NotFoundError:
         return None
+    except CallBudgetExceeded:
+        raise
     except RiotAPIError as e:
         logger.error(f"Failed to get clash team: {e}")
         return None
@@ -318,7 +540,7 @@ def get_tournament_id_by_team(team_info: Dict[str, Any]) -> Optional[int]:
     return team_info.get('tournamentId')
 
 
-@cached(ttl=600, key_prefix='clash_tournament')
+@cached(ttl=600, key_prefix='clash_tournament', single_flight=True)
 def get_tournament_team_details(team_id: str, server: str) -> Optional[Dict[str, Any]]:
     """
     Get detailed clash team information.
@@ -333,7 +555,7 @@ def get_tournament_team_details(team_id: str, server: str) -> Optional[Dict[str,
     server_code = get_server_code(server)
     api_key = get_api_key()
 
-    url = f"https://{server_code}.api.riotgames.com/lol/clash/v1/teams/{team_id}"
+    url = f"{get_api_base_url(server_code)}/lol/clash/v1/teams/{team_id}"
     headers = {"X-Riot-Token": api_key}
 
     logger.debug(f"Fetching tournament team | Team ID: {team_id}")
@@ -342,6 +564,8 @@ def get_tournament_team_details(team_id: str, server: str) -> Optional[Dict[str,
         return make_api_request(url, headers=headers)
     except NotFoundError:
         return None
+    except CallBudgetExceeded:
+        raise
     except RiotAPIError as e:
         logger.error(f"Failed to get tournament team: {e}")
         return None
@@ -400,24 +624,68 @@ def display_matches(
         logger.warning(f"No matches found for PUUID: {puuid[:8]}...")
         return None
 
-    # Fetch and process match details
+    # Fetch match details in parallel and process them in order
     matches = []
-    for match_id in match_ids:
-        match_data = get_match_details(match_id, server)
+    for match_data in fetch_match_details_concurrently(match_ids, server):
         if match_data:
             # Process the raw match data
             processed_match = process_match_for_player(match_data, puuid, game_name, tag_line, server)
             if processed_match:
                 matches.append(processed_match)
 
-        # Small delay to avoid rate limiting
-        time.sleep(0.05)
-
     logger.info(f"Retrieved {len(matches)} matches for {game_name}#{tag_line}")
 
     return matches
 
 
+def display_matches_batch(
+        game_name: str,
+        tag_line: str,
+        server: str,
+        offset: int = 0,
+        batch_size: int = 2,
+        limit: int = 10
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Get one progressive-loading slice of a player's recent matches.
+
+    Match IDs are looked up for the whole ``limit`` window (the same cached
+    call display_matches makes), but only the matches in
+    ``[offset, offset + batch_size)`` are fetched and processed, so loading
+    a page in batches costs one pass over the history instead of one per batch.
+
+    Args:
+        game_name: Player's game name
+        tag_line: Player's tag line
+        server: Server region
+        offset: Index of the first match in the window
+        batch_size: Number of matches to return
+        limit: Size of the match history window
+
+    Returns:
+        Tuple of (processed matches in the slice, total matches in the window)
+    """
+    account_info = get_account_info(game_name, tag_line, server)
+    if not account_info:
+        logger.warning(f"Account not found: {game_name}#{tag_line}")
+        return [], 0
+
+    puuid = account_info['puuid']
+
+    match_ids = get_match_ids(puuid, server, start=0, count=limit)
+    if not match_ids:
+        return [], 0
+
+    matches = []
+    for match_data in fetch_match_details_concurrently(match_ids[offset:offset + batch_size], server):
+        if match_data:
+            processed_match = process_match_for_player(match_data, puuid, game_name, tag_line, server)
+            if processed_match:
+                matches.append(processed_match)
+
+    return matches, len(match_ids)
+
+
 def process_match_for_player(
         match_data: dict[str, Any],
         puuid: str,
@@ -629,13 +897,10 @@ def display_matches_by_value(
 
     # Fetch match details
     matches = []
-    for match_id in match_ids:
-        match_data = get_match_details(match_id, server)
+    for match_data in fetch_match_details_concurrently(match_ids, server):
         if match_data:
             matches.append([match_data])  # Wrap in list for compatibility
 
-        time.sleep(0.05)
-
     return matches
 
 
@@ -730,16 +995,13 @@ def display_matches_by_value_async(
     if not match_ids:
         return None
 
-    # Fetch and process match details
+    # Fetch match details in parallel and process them in order
     matches = []
-    for match_id in match_ids:
-        match_data = get_match_details(match_id, server)
+    for match_data in fetch_match_details_concurrently(match_ids, server):
         if match_data:
             # Process the raw match data
             processed_match = process_match_for_player(match_data, puuid, game_name, tag_line, server)
             if processed_match:
                 matches.append(processed_match)
 
-        time.sleep(0.05)
-
     return matches
\ No newline at end of file
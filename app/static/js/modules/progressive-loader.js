@@ -14,6 +14,7 @@
         init: function(options) {
             const config = {
                 endpoint: '/player_stats/load_batch',
+                streamEndpoint: null,  // e.g. '/player_stats/stream' - preferred when set
                 containerSelector: '#match-list',
                 loadingSelector: '#initial-loading',
                 noMatchesSelector: '#no-matches',
@@ -70,8 +71,19 @@
             console.log('Starting progressive loading...', config.playerData);
 
             try {
+                // Prefer streaming: each card is shown as soon as its match arrives
+                if (config.streamEndpoint && ProgressiveLoader.supportsStreaming()) {
+                    try {
+                        await ProgressiveLoader.streamMatches(config, state, elements);
+                    } catch (error) {
+                        console.warn('Streaming failed, falling back to batches:', error);
+                        container.innerHTML = '';
+                        state.currentOffset = 0;
+                    }
+                }
+
                 // Load batches progressively
-                while (state.currentOffset < config.totalToLoad && !state.isLoading) {
+                while (state.hasMore && state.currentOffset < config.totalToLoad && !state.isLoading) {
                     state.isLoading = true;
 
                     const batchPayload = {
@@ -158,6 +170,121 @@
             }
         },
 
+        /**
+         * Whether the browser can read a fetch response incrementally
+         */
+        supportsStreaming: function() {
+            return typeof window.fetch === 'function' &&
+                typeof window.ReadableStream === 'function' &&
+                typeof window.TextDecoder === 'function';
+        },
+
+        /**
+         * Load matches from the NDJSON stream endpoint.
+         * Cards arrive in completion order and are placed by their index.
+         */
+        streamMatches: async function(config, state, elements) {
+            const { container, loadingIndicator } = elements;
+
+            const params = new URLSearchParams({
+                name: config.playerData.summonerName,
+                tag: config.playerData.summonerTag,
+                server: config.playerData.server,
+                offset: state.currentOffset,
+                count: config.totalToLoad - state.currentOffset
+            });
+
+            console.log('Streaming matches...', params.toString());
+
+            const response = await fetch(`${config.streamEndpoint}?${params}`, {
+                headers: { 'Accept': 'application/x-ndjson' }
+            });
+
+            if (!response.ok || !response.body) {
+                throw new Error(`Stream request failed: ${response.status}`);
+            }
+
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            let summary = null;
+
+            const handleEvent = function(event) {
+                if (event.type === 'match') {
+                    // Show container on first card
+                    if (container.children.length === 0) {
+                        if (loadingIndicator) loadingIndicator.style.display = 'none';
+                        container.style.display = 'block';
+                    }
+
+                    ProgressiveLoader.insertCard(event.html, event.index, container);
+
+                    if (config.statsCallbacks.onUpdate) {
+                        const stats = ProgressiveLoader.calculateStats(container);
+                        config.statsCallbacks.onUpdate(stats.total, stats.wins, stats.losses);
+                    }
+                } else if (event.type === 'done') {
+                    summary = event;
+                } else if (event.type === 'error') {
+                    throw new Error(event.message);
+                }
+            };
+
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) break;
+
+                buffer += decoder.decode(value, { stream: true });
+
+                let newline;
+                while ((newline = buffer.indexOf('\n')) >= 0) {
+                    const line = buffer.slice(0, newline).trim();
+                    buffer = buffer.slice(newline + 1);
+                    if (line) handleEvent(JSON.parse(line));
+                }
+            }
+
+            if (!summary) {
+                throw new Error('Stream ended before completion');
+            }
+
+            console.log(`Stream complete | Matches: ${summary.loaded}`);
+
+            state.currentOffset = summary.offset;
+            state.hasMore = summary.has_more;
+        },
+
+        /**
+         * Insert a single card keeping match order, with animation
+         */
+        insertCard: function(htmlString, index, container) {
+            const tempDiv = document.createElement('div');
+            tempDiv.innerHTML = htmlString.trim();
+
+            const card = tempDiv.firstElementChild;
+            if (!card) {
+                console.error('No card element found in HTML');
+                return;
+            }
+
+            card.dataset.streamIndex = index;
+
+            const next = Array.from(container.children).find(
+                el => parseInt(el.dataset.streamIndex, 10) > index
+            );
+
+            card.style.opacity = '0';
+            card.style.transform = 'translateY(20px)';
+            card.style.transition = 'opacity 0.3s ease-out, transform 0.3s ease-out';
+
+            container.insertBefore(card, next || null);
+
+            requestAnimationFrame(() => {
+                card.style.opacity = '1';
+                card.style.transform = 'translateY(0)';
+            });
+        },
+
         /**
          * Render batch of matches with animations
          */
@@ -61,6 +61,7 @@
 
             ProgressiveLoader.init({
                 endpoint: '/player_stats/load_batch',
+                streamEndpoint: '/player_stats/stream',
                 containerSelector: '#match-list',
                 loadingSelector: '#initial-loading',
                 noMatchesSelector: '#no-matches',
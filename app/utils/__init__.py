@@ -79,6 +79,11 @@ from app.utils.helpers import (
     get_version
 )
 
+from app.utils.request_stats import (
+    RequestStats,
+    current_request_stats
+)
+
 __all__ = [
     # Formatters
     'slugify_server',
@@ -150,5 +155,9 @@ __all__ = [
     'deep_merge',
     'is_production',
     'is_development',
-    'get_version'
-]
\ No newline at end of file
+    'get_version',
+
+    # Request Stats
+    'RequestStats',
+    'current_request_stats'
+]
@@ -0,0 +1,149 @@
+# app/utils/request_stats.py
+"""
+Per-request accounting of upstream work.
+
+Each incoming request gets a RequestStats object held in a context
+variable. Riot API calls, cache lookups and time spent waiting made
+while serving it are counted there, including those made from worker
+threads that run in a copy of the request's context (see
+iter_match_details). The totals are logged with the request and
+returned in a Server-Timing header.
+
+A request may also carry a cap on Riot calls (RIOT_CALLS_PER_REQUEST_MAX):
+once it is spent, further calls are refused without touching the
+network.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+_current: ContextVar[Optional['RequestStats']] = ContextVar('request_stats', default=None)
+
+
+class RequestStats:
+    """Counters and timers for one request."""
+
+    FIELDS = ('riot_calls', 'riot_calls_refused', 'cache_hits', 'cache_misses')
+
+    # Timer name -> Server-Timing description. Timers add up across threads,
+    # so with parallel fetches riot can exceed the request's wall time.
+    TIMERS = {
+        'riot': 'Riot API',
+        'riot_queue': 'Waiting for Riot budget',
+        'render': 'Templates',
+        'sleep': 'Sleeping'
+    }
+
+    def __init__(self, riot_call_limit: Optional[int] = None):
+        """
+        Initialize request stats.
+
+        Args:
+            riot_call_limit: Most Riot calls this request may make (None = unlimited)
+        """
+        self.start = time.perf_counter()
+        self.riot_call_limit = riot_call_limit
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self.FIELDS, 0)
+        self._times = dict.fromkeys(self.TIMERS, 0.0)
+        # Set while render_template runs (template signals, request thread only)
+        self.render_started: Optional[float] = None
+
+    def add(self, field: str, amount: int = 1):
+        with self._lock:
+            self._counts[field] += amount
+
+    def add_time(self, timer: str, seconds: float):
+        with self._lock:
+            self._times[timer] += seconds
+
+    def charge_riot_call(self) -> bool:
+        """Count a Riot call, or refuse it when the request's cap is spent."""
+        with self._lock:
+            if self.riot_call_limit is not None and self._counts['riot_calls'] >= self.riot_call_limit:
+                self._counts['riot_calls_refused'] += 1
+                return False
+            self._counts['riot_calls'] += 1
+            return True
+
+    def __getitem__(self, field: str) -> int:
+        return self._counts[field]
+
+    @property
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.start) * 1000
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Counts plus timers in milliseconds (as ``<timer>_ms``)."""
+        with self._lock:
+            result: Dict[str, Any] = dict(self._counts)
+            for timer, seconds in self._times.items():
+                result[f'{timer}_ms'] = round(seconds * 1000, 2)
+        return result
+
+    def server_timing(self) -> str:
+        """Format the stats as a Server-Timing header value."""
+        counts = self.as_dict()
+        metrics = [
+            f'{timer};dur={counts[f"{timer}_ms"]};desc="{description}"'
+            for timer, description in self.TIMERS.items()
+            if counts[f'{timer}_ms']
+        ]
+        metrics.append(f'riot-calls;desc="{counts["riot_calls"]}"')
+        metrics.append(f'cache;desc="hits={counts["cache_hits"]} misses={counts["cache_misses"]}"')
+        metrics.append(f'total;dur={round(self.elapsed_ms, 2)}')
+        return ', '.join(metrics)
+
+
+def begin_request(riot_call_limit: Optional[int] = None) -> RequestStats:
+    """Start accounting for the current request."""
+    stats = RequestStats(riot_call_limit)
+    _current.set(stats)
+    return stats
+
+
+def end_request():
+    """Stop accounting (the thread may serve another request next)."""
+    _current.set(None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    """Stats of the request being served, or None outside a request."""
+    return _current.get()
+
+
+def record(field: str, amount: int = 1):
+    """Count work for the current request; a no-op outside a request."""
+    stats = _current.get()
+    if stats is not None:
+        stats.add(field, amount)
+
+
+def charge_riot_call() -> bool:
+    """
+    Count a Riot call for the current request.
+
+    Returns:
+        False if the request's Riot call cap is spent (the call must not
+        be made), True otherwise, including outside a request
+    """
+    stats = _current.get()
+    return stats is None or stats.charge_riot_call()
+
+
+@contextmanager
+def timed(timer: str) -> Iterator[None]:
+    """Add the block's duration to a timer of the current request."""
+    stats = _current.get()
+    if stats is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.add_time(timer, time.perf_counter() - start)
@@ -0,0 +1,4 @@
+"""
+Offline benchmarks for Clash Finder.
+Run with: python -m benchmarks.<module>
+"""
@@ -0,0 +1,73 @@
+# benchmarks/bench_cache.py
+"""
+Microbenchmark: InMemoryCache set/get throughput at increasing sizes.
+
+Each size fills the cache to capacity, then measures:
+  * set   - inserts of new keys into a full cache (every set evicts)
+  * get   - lookups of resident keys
+
+Usage:
+    python -m benchmarks.bench_cache [--sizes 10000 100000 1000000] [--ops 100000]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.cache import InMemoryCache
+
+
+def bench_size(size: int, ops: int) -> dict:
+    """Run set/get throughput for one cache size."""
+    cache = InMemoryCache(max_size=size, default_ttl=3600)
+
+    for i in range(size):
+        cache.set(f'warm:{i}', i)
+
+    start = time.perf_counter()
+    for i in range(ops):
+        cache.set(f'new:{i}', i)
+    set_elapsed = time.perf_counter() - start
+
+    # Keys written above are the most recent ones, so they are all resident
+    resident = [f'new:{i}' for i in range(min(ops, size))]
+    start = time.perf_counter()
+    for i in range(ops):
+        cache.get(resident[i % len(resident)])
+    get_elapsed = time.perf_counter() - start
+
+    stats = cache.get_stats()
+    return {
+        'size': size,
+        'set_ops_per_sec': ops / set_elapsed,
+        'get_ops_per_sec': ops / get_elapsed,
+        'evictions': stats['evictions'],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--ops', type=int, default=100_000, help='operations per measurement')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    print(f"{'entries':>10} {'set/s':>12} {'get/s':>12} {'evictions':>10}")
+    for size in args.sizes:
+        result = bench_size(size, args.ops)
+        print(
+            f"{result['size']:>10,} {result['set_ops_per_sec']:>12,.0f} "
+            f"{result['get_ops_per_sec']:>12,.0f} {result['evictions']:>10,}"
+        )
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,218 @@
+# benchmarks/bench_game_data_load.py
+"""
+Benchmark: game data load time and per-worker memory, JSON vs compiled.
+
+Writes Data Dragon-sized, pretty-printed champion, item, spell and rune
+files, then starts N worker processes per mode that each load a
+ResourceManager snapshot and resolve a run of match cards, like
+gunicorn workers serving traffic (items are drawn from a pool the size
+of one map's shop; items.json lists every map and mode). With every
+worker of a mode still
+alive, reports per worker:
+  * load    - time to publish the first snapshot
+  * rss     - resident set size (counts shared pages in full)
+  * pss     - proportional set size (shared pages split between workers)
+  * private - pages no other process shares
+
+Usage:
+    python -m benchmarks.bench_game_data_load [--workers 4] [--cards 200] [--item-pool 200]
+"""
+
+import argparse
+import gc
+import json
+import logging
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.bench_resource_lookups import CHAMPIONS, SPELLS, TREES
+
+ITEMS = 700
+TEXT = 'Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor. '
+
+
+def write_data(directory: Path):
+    """Write files shaped and sized like Data Dragon's, indented as older downloads were."""
+    champions = {
+        f'Champion{i}': {
+            'id': f'Champion{i}', 'key': str(i + 1), 'name': f'Champion {i}', 'title': TEXT[:30],
+            'lore': TEXT * 12, 'blurb': TEXT * 3, 'tags': ['Fighter', 'Tank'], 'partype': 'Mana',
+            'image': {'full': f'Champion{i}.png', 'sprite': 'champion0.png', 'group': 'champion',
+                      'x': 0, 'y': 0, 'w': 48, 'h': 48},
+            'info': {'attack': 8, 'defense': 4, 'magic': 3, 'difficulty': 4},
+            'stats': {f'stat{n}': n * 1.5 for n in range(20)},
+            'spells': [
+                {'id': f'Champion{i}{s}', 'name': f'Spell {s}', 'description': TEXT * 4, 'tooltip': TEXT * 6,
+                 'cooldown': [14, 12, 10, 8, 6], 'cost': [50, 55, 60, 65, 70], 'range': [600] * 5}
+                for s in 'QWER'
+            ],
+            'skins': [{'id': str(i * 1000 + n), 'num': n, 'name': f'Skin {n}', 'chromas': False} for n in range(12)]
+        }
+        for i in range(CHAMPIONS)
+    }
+    items = {
+        str(1000 + i): {
+            'name': f'Item {i}', 'description': f'<mainText><stats>{TEXT * 5}</stats></mainText>',
+            'colloq': ';', 'plaintext': TEXT, 'into': [str(3000 + i % 50)], 'from': [str(1000 + i % 30)],
+            'image': {'full': f'{1000 + i}.png', 'sprite': f'item{i // 120}.png', 'group': 'item',
+                      'x': 0, 'y': 0, 'w': 48, 'h': 48},
+            'gold': {'base': 300, 'purchasable': True, 'total': 1100, 'sell': 770},
+            'tags': ['Damage', 'AttackSpeed'], 'maps': {'11': True, '12': True, '21': True, '22': False},
+            'stats': {'FlatPhysicalDamageMod': 25}
+        }
+        for i in range(ITEMS)
+    }
+    spells = {
+        f'Summoner{i}': {'id': f'Summoner{i}', 'key': str(i + 1), 'name': f'Spell {i}', 'description': TEXT * 2,
+                         'image': {'full': f'Summoner{i}.png'}}
+        for i in range(SPELLS)
+    }
+    runes = [
+        {
+            'id': 8000 + tree * 100, 'key': f'Tree{tree}', 'icon': f'perk-images/Styles/{tree}.png',
+            'slots': [
+                {'runes': [{'id': 8000 + tree * 100 + slot * 10 + n, 'name': f'Rune {tree}.{slot}.{n}',
+                            'shortDesc': TEXT, 'longDesc': TEXT * 4,
+                            'icon': f'perk-images/{tree}/{slot}/{n}.png'} for n in range(4 if slot == 0 else 3)]}
+                for slot in range(4)
+            ]
+        }
+        for tree in range(TREES)
+    ]
+
+    for filename, document in (('champions.json', {'data': champions}), ('items.json', {'data': items}),
+                               ('summoner_spells.json', {'data': spells}), ('runes.json', runes)):
+        (directory / filename).write_text(json.dumps(document, indent=2, ensure_ascii=False))
+
+
+def memory() -> Dict[str, int]:
+    """RSS, PSS and private memory of this process in KB (Linux)."""
+    fields = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            name, _, value = line.partition(':')
+            if value.strip().endswith('kB'):
+                fields[name] = int(value.split()[0])
+    return {
+        'rss_kb': fields.get('Rss', 0),
+        'pss_kb': fields.get('Pss', 0),
+        'private_kb': fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0)
+    }
+
+
+def worker(data_dir: str, cards: int, item_pool: int, seed: int):
+    """One worker: load, serve match cards, wait for the parent, report."""
+    logging.disable(logging.CRITICAL)
+    from app.services.resource_manager import ResourceManager
+
+    gc.collect()
+    before = memory()
+
+    start = time.perf_counter()
+    manager = ResourceManager(data_dir)
+    manager.publish('bench')
+    load_seconds = time.perf_counter() - start
+
+    rng = random.Random(seed)
+    item_ids = random.Random(0).sample(range(1000, 1000 + ITEMS), min(item_pool, ITEMS))
+    rune_ids = [8000 + tree * 100 + slot * 10 + n for tree in range(TREES) for slot in range(4) for n in range(3)]
+    for _ in range(cards):
+        for _ in range(10):
+            manager.get_champion_icon(rng.randint(1, CHAMPIONS))
+        for _ in range(70):
+            manager.get_item_name(rng.choice(item_ids))
+        for _ in range(20):
+            manager.get_summoner_spell_name(rng.randint(1, SPELLS))
+        for _ in range(90):
+            manager.get_rune_name(rng.choice(rune_ids))
+    gc.collect()
+
+    print('ready', flush=True)
+    sys.stdin.readline()
+
+    after = memory()
+    print(json.dumps({
+        'load_ms': load_seconds * 1000,
+        'source': manager.snapshot.source,
+        **{key: value - before[key] if key == 'private_kb' else value for key, value in after.items()},
+        'baseline_rss_kb': before['rss_kb']
+    }), flush=True)
+    sys.stdin.readline()
+
+
+def run_workers(data_dir: Path, workers: int, cards: int, item_pool: int) -> list:
+    """Start workers together and collect their reports while all are alive."""
+    processes = [
+        subprocess.Popen(
+            [sys.executable, '-m', 'benchmarks.bench_game_data_load', '--worker', str(data_dir),
+             '--cards', str(cards), '--item-pool', str(item_pool), '--seed', str(seed)],
+            cwd=project_root, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True
+        )
+        for seed in range(workers)
+    ]
+    for process in processes:
+        assert process.stdout.readline().strip() == 'ready'
+    for process in processes:
+        process.stdin.write('measure\n')
+        process.stdin.flush()
+    reports = [json.loads(process.stdout.readline()) for process in processes]
+    for process in processes:
+        process.communicate('exit\n')
+    return reports
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--workers', type=int, default=4, help='worker processes per mode')
+    parser.add_argument('--cards', type=int, default=200, help='match cards each worker resolves')
+    parser.add_argument('--item-pool', type=int, default=200, help='distinct items seen in matches')
+    parser.add_argument('--worker', metavar='DATA_DIR', help=argparse.SUPPRESS)
+    parser.add_argument('--seed', type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args.worker, args.cards, args.item_pool, args.seed)
+        return 0
+
+    logging.disable(logging.CRITICAL)
+    from app.services.resource_manager import ResourceManager
+
+    with tempfile.TemporaryDirectory() as json_dir, tempfile.TemporaryDirectory() as compiled_dir:
+        for directory in (json_dir, compiled_dir):
+            write_data(Path(directory))
+        json_size = sum(path.stat().st_size for path in Path(json_dir).glob('*.json'))
+
+        start = time.perf_counter()
+        compiled = ResourceManager(compiled_dir).compile_game_data('bench')
+        compile_seconds = time.perf_counter() - start
+
+        print(f"JSON files: {json_size / 1024 / 1024:.1f} MB | compiled: "
+              f"{compiled.stat().st_size / 1024 / 1024:.1f} MB in {compile_seconds * 1000:.0f} ms")
+        print(f"{args.workers} workers x {args.cards} match cards, {args.item_pool} items in play; memory is the worker's process "
+              f"after loading (private: growth over the bare interpreter)")
+        print()
+        print(f"{'mode':<10} {'load ms':>9} {'rss MB':>8} {'pss MB':>8} {'private MB':>11}")
+
+        for label, directory in (('json', json_dir), ('compiled', compiled_dir)):
+            reports = run_workers(Path(directory), args.workers, args.cards, args.item_pool)
+            assert all(report['source'] != 'json' for report in reports) == (label == 'compiled')
+
+            def mean(key):
+                return sum(report[key] for report in reports) / len(reports)
+
+            print(f"{label:<10} {mean('load_ms'):>9.1f} {mean('rss_kb') / 1024:>8.1f} "
+                  f"{mean('pss_kb') / 1024:>8.1f} {mean('private_kb') / 1024:>11.1f}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+# benchmarks/bench_logging.py
+"""
+Microbenchmark: latency of one logger.info() call on the request thread.
+
+Runs the application's logging setup (console + rotating file handlers)
+against a temporary directory, once with handlers attached directly to
+the root logger and once through the QueueHandler/QueueListener
+pipeline. Console output goes to /dev/null. Small rotation size makes
+rotation happen during the run, as it does on a long-lived server.
+
+A tight logging loop outpaces the writer thread, so by default the queue
+holds the whole run; pass a smaller --queue-size to see the drop policy.
+
+Usage:
+    python -m benchmarks.bench_logging [--calls 50000] [--threads 8] [--queue-size N]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import logging_config
+from config.logging_config import setup_logging, get_log_queue_stats
+
+
+def run(use_queue: bool, calls: int, threads: int, queue_size: int, log_dir: str) -> dict:
+    """Time ``calls`` log calls spread over ``threads`` threads."""
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        setup_logging(
+            log_level='INFO',
+            log_file=os.path.join(log_dir, f"app-{'queued' if use_queue else 'direct'}.log"),
+            use_queue=use_queue,
+            queue_size=queue_size
+        )
+    finally:
+        devnull, sys.stdout = sys.stdout, stdout
+
+    # Rotate every ~1MB so rollover cost shows up in the tail
+    for handler in logging_config._queue_listener.handlers if use_queue else logging.getLogger().handlers:
+        if hasattr(handler, 'maxBytes'):
+            handler.maxBytes = 1024 * 1024
+
+    logger = logging.getLogger('bench.request')
+    per_thread = calls // threads
+    latencies = [[] for _ in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index: int):
+        samples = latencies[index]
+        barrier.wait()
+        for i in range(per_thread):
+            start = time.perf_counter()
+            logger.info(f"Request: GET /player_stats/Player%23EUW/euw | Endpoint: player_stats | Time: 0.{i % 1000:03d}s")
+            samples.append(time.perf_counter() - start)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+
+    dropped = get_log_queue_stats().get('dropped', 0)
+    # Flush queued records and release file handles before the next run
+    setup_logging(log_level='CRITICAL', enable_console=False, enable_file=False)
+    devnull.close()
+
+    samples = sorted(s for thread_samples in latencies for s in thread_samples)
+    return {
+        'elapsed': elapsed,
+        'p50': samples[len(samples) // 2],
+        'p99': samples[int(len(samples) * 0.99)],
+        'max': samples[-1],
+        'dropped': dropped,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--calls', type=int, default=50000, help='log calls in total')
+    parser.add_argument('--threads', type=int, default=8, help='logging threads')
+    parser.add_argument('--queue-size', type=int, default=None, help='log queue capacity (default: --calls)')
+    args = parser.parse_args()
+    queue_size = args.queue_size or args.calls
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        results = [(label, run(use_queue, args.calls, args.threads, queue_size, log_dir))
+                   for label, use_queue in (('direct', False), ('queued', True))]
+
+    print(f"{args.calls} logger.info() calls from {args.threads} threads (console + rotating file) | "
+          f"queue size {queue_size}")
+    print()
+    print(f"{'':<8} {'p50 us':>8} {'p99 us':>8} {'max ms':>8} {'calls/s':>9} {'dropped':>8}")
+    for label, result in results:
+        print(
+            f"{label:<8} {result['p50'] * 1e6:>8.1f} {result['p99'] * 1e6:>8.1f} {result['max'] * 1e3:>8.2f} "
+            f"{args.calls / result['elapsed']:>9.0f} {result['dropped']:>8}"
+        )
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,106 @@
+# benchmarks/bench_match_fanout.py
+"""
+Benchmark: sequential vs concurrent match-detail fan-out in display_matches,
+and time-to-first-card for the batch endpoint vs the streaming endpoint.
+
+Usage:
+    python -m benchmarks.bench_match_fanout [--latency 0.1] [--matches 10]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app import create_app
+from app.services.cache import cache
+from app.services.api.session_pool import session_pool
+from app.services.riot_api import display_matches
+from benchmarks.stub_riot_server import StubRiotServer
+
+
+def run_page(app, stub: StubRiotServer, matches: int, concurrency: int) -> float:
+    """Load one cold page of matches and return its latency in seconds."""
+    app.config['RIOT_API_MAX_CONCURRENCY'] = concurrency
+    cache.clear()
+    stub.reset_counters()
+
+    with app.app_context():
+        start = time.perf_counter()
+        result = display_matches('Bench', 'STUB', 'EUW', limit=matches)
+        elapsed = time.perf_counter() - start
+
+    assert result and len(result) == matches, "stub returned an incomplete page"
+    return elapsed
+
+
+def first_card_times(app, stub: StubRiotServer, matches: int) -> dict:
+    """Cold time until the browser has its first match card, per endpoint."""
+    client = app.test_client()
+    player = {'SUMMONER_NAME': 'Bench', 'SUMMONER_TAG': 'STUB', 'server': 'EUW'}
+    times = {}
+
+    cache.clear()
+    stub.reset_counters()
+    start = time.perf_counter()
+    client.post('/player_stats/load_batch', json={**player, 'offset': 0, 'batch_size': 2})
+    times['load_batch'] = time.perf_counter() - start
+
+    cache.clear()
+    start = time.perf_counter()
+    client.post('/player_stats/load_initial', json=player)
+    times['load_initial'] = time.perf_counter() - start
+
+    cache.clear()
+    start = time.perf_counter()
+    response = client.get(
+        f'/player_stats/stream?name=Bench&tag=STUB&server=EUW&count={matches}', buffered=False
+    )
+    for chunk in response.response:
+        if b'"type":"match"' in chunk:
+            times['stream'] = time.perf_counter() - start
+            break
+    response.close()
+
+    return times
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--latency', type=float, default=0.1, help='stub latency per call (s)')
+    parser.add_argument('--matches', type=int, default=10, help='matches per page')
+    parser.add_argument('--concurrency', type=int, default=8, help='parallel fetches')
+    args = parser.parse_args()
+
+    app = create_app('testing')
+    logging.disable(logging.CRITICAL)
+
+    with StubRiotServer(latency=args.latency) as stub:
+        app.config.update(RIOT_API_KEY='bench', RIOT_API_BASE_URL=stub.base_url)
+
+        sequential = run_page(app, stub, args.matches, concurrency=1)
+        concurrent = run_page(app, stub, args.matches, concurrency=args.concurrency)
+        in_flight = stub.max_in_flight
+        pool = session_pool.get_stats()
+        first_card = first_card_times(app, stub, args.matches)
+
+    # account + match ids are serial; match details are the fan-out
+    print(f"Stub latency:         {args.latency * 1000:.0f} ms/call, {args.matches} matches")
+    print(f"Sequential page:      {sequential * 1000:8.1f} ms")
+    print(f"Concurrent page:      {concurrent * 1000:8.1f} ms  (max in flight: {in_flight})")
+    print(f"Speed-up:             {sequential / concurrent:8.2f}x")
+    print(f"Connections reused:   {pool['connection_hits']:5d} / {pool['requests']} requests "
+          f"({pool['connection_misses']} opened)")
+    print("Time to first card (cold):")
+    for endpoint, elapsed in first_card.items():
+        print(f"  {endpoint:<18}  {elapsed * 1000:8.1f} ms")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
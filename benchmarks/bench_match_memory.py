@@ -0,0 +1,118 @@
+# benchmarks/bench_match_memory.py
+"""
+Memory benchmark: bytes per cached match, raw match-v5 vs packed projection.
+
+Measures, for a full-size synthetic match document:
+  * heap    - deep Python object size held by InMemoryCache
+  * redis   - serialized size as written by RedisCache (pickle + zlib)
+  * store   - compressed payload size in the SQLite match store
+  * json    - uncompressed JSON size
+
+Heap usage is also cross-checked with tracemalloc by filling an
+InMemoryCache with N matches of each form.
+
+Usage:
+    python -m benchmarks.bench_match_memory [--matches 500]
+"""
+
+import argparse
+import json
+import logging
+import pickle
+import sys
+import tracemalloc
+import zlib
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.cache import InMemoryCache
+from app.services.match_projection import pack_match, unpack_match
+from app.services.match_store import MatchStore
+from benchmarks.stub_riot_server import make_match
+
+
+def deep_sizeof(obj, seen=None) -> int:
+    """Recursive sys.getsizeof, counting shared objects once."""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    return size
+
+
+def redis_size(value) -> int:
+    """Bytes RedisCache writes for a value (pickled, zlib above 1 KB)."""
+    payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    if len(payload) > 1024:
+        payload = zlib.compress(payload)
+    return len(payload) + 1
+
+
+def store_size(value) -> int:
+    """Bytes the match store keeps for a value."""
+    return len(MatchStore._encode(value))
+
+
+def cache_heap(documents, transform) -> float:
+    """Average traced heap bytes per entry when filling an InMemoryCache."""
+    cache = InMemoryCache(max_size=len(documents) + 1, default_ttl=3600)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for index, document in enumerate(documents):
+        # Decode inside the traced region, as a fresh API response would be
+        cache.set(f'match:{index}', transform(json.loads(document)))
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return (after - before) / len(documents)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--matches', type=int, default=500, help='matches per heap measurement')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    raw = make_match('EUW1_1', full=True)
+    packed = pack_match(raw)
+
+    rows = [
+        ('heap (deep sizeof)', deep_sizeof(raw), deep_sizeof(packed)),
+        ('redis (pickle+zlib)', redis_size(raw), redis_size(packed)),
+        ('store (json+zlib)', len(zlib.compress(json.dumps(raw, separators=(',', ':')).encode(), 6)),
+         store_size(packed)),
+        ('json', len(json.dumps(raw)), len(json.dumps(packed))),
+    ]
+
+    documents = [json.dumps(make_match(f'EUW1_{i}', full=True)) for i in range(args.matches)]
+    raw_heap = cache_heap(documents, lambda match: match)
+    packed_heap = cache_heap(documents, pack_match)
+    rows.append((f'cache heap x{args.matches} (tracemalloc)', raw_heap, packed_heap))
+
+    print(f"{'bytes per match':<32} {'raw':>10} {'packed':>10} {'ratio':>7}")
+    for label, before, after in rows:
+        print(f"{label:<32} {before:>10,.0f} {after:>10,.0f} {before / after:>6.1f}x")
+
+    # Consumers still see a match-v5 shaped dict
+    slim = unpack_match(packed)
+    print()
+    print(f"unpacked participants: {len(slim['info']['participants'])} | "
+          f"keys per participant: {len(raw['info']['participants'][0])} -> "
+          f"{len(slim['info']['participants'][0])}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
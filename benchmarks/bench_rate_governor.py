@@ -0,0 +1,100 @@
+# benchmarks/bench_rate_governor.py
+"""
+Simulation: a burst of Riot API calls against a stub enforcing Riot-style limits.
+
+The stub applies fixed-window application and per-method limits (time
+scaled down so a run takes seconds) and answers 429 when they are
+exceeded. The same burst is replayed with the outbound rate governor
+disabled and enabled.
+
+Usage:
+    python -m benchmarks.bench_rate_governor [--requests 60] [--threads 16]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app import create_app
+from app.services.api.rate_governor import rate_governor
+from app.services.riot_api import make_api_request, get_api_base_url, RateLimitError
+from benchmarks.stub_riot_server import StubRiotServer
+
+# Dev-key shaped limits (20:1,100:120), windows shortened for the simulation
+APP_LIMITS = [(20, 1), (50, 4)]
+METHOD_LIMITS = [(30, 4)]
+
+
+def run_burst(app, stub: StubRiotServer, requests: int, threads: int, governed: bool) -> dict:
+    """Fire ``requests`` match-v5 calls from ``threads`` workers at once."""
+    app.config['RIOT_RATE_GOVERNOR_ENABLED'] = governed
+    rate_governor.init_app(app)
+    stub.reset_counters()
+
+    def call(index: int) -> bool:
+        with app.app_context():
+            url = f"{get_api_base_url('europe')}/lol/match/v5/matches/SIM_{index}"
+            try:
+                make_api_request(url, headers={'X-Riot-Token': 'bench'})
+                return True
+            except RateLimitError:
+                return False
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(call, range(requests)))
+    elapsed = time.perf_counter() - start
+
+    stats = rate_governor.get_stats()
+    return {
+        'ok': sum(results),
+        'rate_limited': stub.rate_limited_count,
+        'elapsed': elapsed,
+        'delayed': stats['delayed'],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=60, help='calls in the burst')
+    parser.add_argument('--threads', type=int, default=16, help='concurrent callers')
+    parser.add_argument('--latency', type=float, default=0.02, help='stub latency per call (s)')
+    args = parser.parse_args()
+
+    app = create_app('testing')
+    logging.disable(logging.CRITICAL)
+
+    with StubRiotServer(latency=args.latency, app_limits=APP_LIMITS, method_limits=METHOD_LIMITS) as stub:
+        # Only the short window is known up front; the rest is learned from headers
+        app.config.update(
+            RIOT_API_BASE_URL=stub.base_url,
+            RIOT_APP_RATE_LIMIT='20:1',
+            RIOT_RATE_LIMIT_MAX_WAIT=30.0
+        )
+
+        ungoverned = run_burst(app, stub, args.requests, args.threads, governed=False)
+        time.sleep(max(window for _, window in APP_LIMITS + METHOD_LIMITS))
+        governed = run_burst(app, stub, args.requests, args.threads, governed=True)
+
+    limits = ', '.join(f"{c}:{w}" for c, w in APP_LIMITS)
+    print(f"Stub limits:   app {limits} | method {METHOD_LIMITS[0][0]}:{METHOD_LIMITS[0][1]}")
+    print(f"Burst:         {args.requests} calls from {args.threads} threads")
+    print()
+    print(f"{'':<12} {'ok':>5} {'429s':>6} {'delayed':>8} {'time':>8} {'ok/s':>7}")
+    for label, result in (('ungoverned', ungoverned), ('governed', governed)):
+        print(
+            f"{label:<12} {result['ok']:>5} {result['rate_limited']:>6} {result['delayed']:>8} "
+            f"{result['elapsed']:>7.2f}s {result['ok'] / result['elapsed']:>7.1f}"
+        )
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,99 @@
+# benchmarks/bench_rate_limiter.py
+"""
+Contention benchmark: inbound rate limiter under many concurrent threads.
+
+Threads hammer the limiter with minute+hour checks for a large pool of
+client keys (the storage is pre-filled, as on a busy server). Measures
+throughput and per-request latency for:
+  * global  - one lock, minute and hour checked in two calls (old call pattern)
+  * striped - lock-striped storage, both windows checked in one call
+
+Usage:
+    python -m benchmarks.bench_rate_limiter [--threads 64] [--ops 2000] [--keys 20000]
+"""
+
+import argparse
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.rate_limiter import InMemoryRateLimiter
+
+LIMITS = ((1_000_000, 60), (1_000_000, 3600))  # High enough that every check is allowed
+
+
+def run(stripes: int, combined: bool, threads: int, ops: int, keys: int) -> dict:
+    """Run ``ops`` checks in each of ``threads`` threads."""
+    limiter = InMemoryRateLimiter(stripes=stripes)
+    for i in range(keys):
+        limiter.check_limits(f'10.0.{i // 256}.{i % 256}:player.player_stats', LIMITS)
+
+    latencies = [[] for _ in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index: int):
+        samples = latencies[index]
+        barrier.wait()
+        for i in range(ops):
+            n = (index * ops + i) % keys
+            key = f'10.0.{n // 256}.{n % 256}:player.player_stats'
+            start = time.perf_counter()
+            if combined:
+                limiter.check_limits(key, LIMITS)
+            else:
+                limiter.check_rate_limit(f'{key}:minute', *LIMITS[0])
+                limiter.check_rate_limit(f'{key}:hour', *LIMITS[1])
+            samples.append(time.perf_counter() - start)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for w in workers:
+        w.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+
+    samples = sorted(s for thread_samples in latencies for s in thread_samples)
+    return {
+        'requests': len(samples),
+        'elapsed': elapsed,
+        'p50': samples[len(samples) // 2],
+        'p99': samples[int(len(samples) * 0.99)],
+        'max': samples[-1],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--threads', type=int, default=64, help='concurrent threads')
+    parser.add_argument('--ops', type=int, default=2000, help='requests per thread')
+    parser.add_argument('--keys', type=int, default=20000, help='distinct client keys')
+    parser.add_argument('--stripes', type=int, default=64, help='lock stripes for the striped run')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    print(f"{args.threads} threads x {args.ops} requests | {args.keys} client keys | "
+          f"switch interval {sys.getswitchinterval() * 1000:.0f}ms")
+    print()
+    print(f"{'':<9} {'req/s':>9} {'p50 us':>8} {'p99 us':>8} {'max ms':>8}")
+
+    for label, stripes, combined in (('global', 1, False), ('striped', args.stripes, True)):
+        result = run(stripes, combined, args.threads, args.ops, args.keys)
+        print(
+            f"{label:<9} {result['requests'] / result['elapsed']:>9.0f} "
+            f"{result['p50'] * 1e6:>8.1f} {result['p99'] * 1e6:>8.1f} {result['max'] * 1e3:>8.2f}"
+        )
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,146 @@
+# benchmarks/bench_resource_lookups.py
+"""
+Benchmark: ResourceManager id lookups, linear scan vs prebuilt index.
+
+Writes Data Dragon-sized champion, summoner spell and rune files to a
+temporary directory and times the lookups one match card makes (10
+champions, 20 spells, 10 players x 9 runes and trees), repeated.
+
+Usage:
+    python -m benchmarks.bench_resource_lookups [--cards 2000]
+"""
+
+import argparse
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.resource_manager import ResourceManager
+
+CHAMPIONS = 170
+SPELLS = 18
+TREES = 5
+
+
+def write_data(directory: Path):
+    """Write files shaped like Data Dragon's (keys are numeric strings)."""
+    champions = {
+        f'Champion{i}': {'id': f'Champion{i}', 'key': str(i + 1), 'name': f'Champion {i}',
+                         'image': {'full': f'Champion{i}.png'}}
+        for i in range(CHAMPIONS)
+    }
+    spells = {
+        f'Summoner{i}': {'id': f'Summoner{i}', 'key': str(i + 1), 'name': f'Spell {i}',
+                         'image': {'full': f'Summoner{i}.png'}}
+        for i in range(SPELLS)
+    }
+    runes = [
+        {
+            'id': 8000 + tree * 100, 'key': f'Tree{tree}', 'icon': f'perk-images/Styles/{tree}.png',
+            'slots': [
+                {'runes': [{'id': 8000 + tree * 100 + slot * 10 + n, 'name': f'Rune {tree}.{slot}.{n}',
+                            'icon': f'perk-images/{tree}/{slot}/{n}.png'} for n in range(4 if slot == 0 else 3)]}
+                for slot in range(4)
+            ]
+        }
+        for tree in range(TREES)
+    ]
+
+    (directory / 'champions.json').write_text(json.dumps({'data': champions}))
+    (directory / 'summoner_spells.json').write_text(json.dumps({'data': spells}))
+    (directory / 'runes.json').write_text(json.dumps(runes))
+    return runes
+
+
+# The lookups as they were before indexing
+def scan_champion(manager: ResourceManager, champion_id: int):
+    for champ_data in manager.load_champions().get('data', {}).values():
+        if int(champ_data.get('key', -1)) == champion_id:
+            return champ_data
+    return None
+
+
+def scan_spell(manager: ResourceManager, spell_id: int):
+    for spell_data in manager.load_summoner_spells().get('data', {}).values():
+        if int(spell_data.get('key', -1)) == spell_id:
+            return spell_data
+    return None
+
+
+def scan_rune(manager: ResourceManager, rune_id: int):
+    for tree in manager.load_runes():
+        if tree.get('id') == rune_id:
+            return tree
+        for slot in tree.get('slots', []):
+            for rune in slot.get('runes', []):
+                if rune.get('id') == rune_id:
+                    return rune
+    return None
+
+
+def run(champion, spell, rune, manager: ResourceManager, cards: list) -> float:
+    """Return seconds to resolve every lookup of every card."""
+    start = time.perf_counter()
+    for champions, spells, runes in cards:
+        for champion_id in champions:
+            champion(manager, champion_id)
+        for spell_id in spells:
+            spell(manager, spell_id)
+        for rune_id in runes:
+            rune(manager, rune_id)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--cards', type=int, default=2000, help='match cards to resolve')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(1)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        trees = write_data(Path(data_dir))
+        rune_ids = [tree['id'] for tree in trees] + [
+            rune['id'] for tree in trees for slot in tree['slots'] for rune in slot['runes']
+        ]
+
+        cards = [
+            (
+                [rng.randint(1, CHAMPIONS) for _ in range(10)],
+                [rng.randint(1, SPELLS) for _ in range(20)],
+                [rng.choice(rune_ids) for _ in range(90)]
+            )
+            for _ in range(args.cards)
+        ]
+        lookups = args.cards * (10 + 20 + 90)
+
+        manager = ResourceManager(data_dir)
+        manager.reload_all()
+
+        scanned = run(scan_champion, scan_spell, scan_rune, manager, cards)
+        indexed = run(
+            ResourceManager.get_champion_by_id,
+            ResourceManager.get_summoner_spell_by_id,
+            ResourceManager.get_rune_by_id,
+            manager, cards
+        )
+
+    print(f"{args.cards} match cards, {lookups} lookups")
+    print(f"{'':<8} {'lookups/s':>12} {'us/card':>9}")
+    for label, elapsed in (('scan', scanned), ('index', indexed)):
+        print(f"{label:<8} {lookups / elapsed:>12,.0f} {elapsed / args.cards * 1e6:>9.1f}")
+    print(f"Speed-up: {scanned / indexed:.1f}x")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,266 @@
+# benchmarks/bench_suite.py
+"""
+End-to-end benchmark suite: the real app against the stub Riot server.
+
+Drives create_app('testing') through the player_bp and clash_bp flows
+with the stub serving the recorded fixtures. Each scenario runs twice:
+  * cold - one request at a time, cache cleared before each
+  * warm - concurrent clients against a primed cache
+
+and reports throughput, p50/p99 latency, upstream calls per page (seen
+by the stub) and 429s. clash_team measures the lookup chain up to the
+"not found" page (see SCENARIOS), not a rendered team. Results are written as JSON; pass an earlier
+file with --compare to print the change per scenario.
+
+Usage:
+    python -m benchmarks.bench_suite [--latency 0.05] [--jitter 0.02] [--rate-limit-probability 0.01]
+        [--iterations 200] [--threads 8] [--scenarios load_initial,clash_team]
+        [--output results.json] [--compare baseline.json]
+"""
+
+import argparse
+import json
+import logging
+import platform
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app import create_app
+from app.services.api.rate_governor import rate_governor
+from app.services.cache import cache
+from benchmarks.stub_riot_server import StubRiotServer, load_fixtures
+
+RESULTS_DIR = Path(__file__).parent / 'results'
+
+PLAYER = {'SUMMONER_NAME': 'Bench', 'SUMMONER_TAG': 'STUB', 'server': 'EUW'}
+
+
+def _read_stream(response) -> None:
+    for _ in response.response:
+        pass
+    response.close()
+
+
+# Scenario name -> request against a test client (responses are fully read)
+SCENARIOS: Dict[str, Callable[[Any], Any]] = {
+    'player_page': lambda client: client.get('/player_stats/Bench--STUB/eu-west'),
+    'load_initial': lambda client: client.post('/player_stats/load_initial', json=PLAYER),
+    'load_more': lambda client: client.post(
+        '/player_stats/load_more', json={**PLAYER, 'current_count': 10, 'number': 5}
+    ),
+    'load_batch': lambda client: client.post(
+        '/player_stats/load_batch', json={**PLAYER, 'offset': 0, 'batch_size': 5}
+    ),
+    'stream': lambda client: client.get('/player_stats/stream?name=Bench&tag=STUB&server=EUW&count=10'),
+    # Always ends in a 404: the fixture team has no tournamentId and show_players_team
+    # is a placeholder, so this times the account/summoner/clash lookups and error page
+    'clash_team': lambda client: client.get('/clash_team/Bench--STUB/eu-west'),
+}
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of sorted samples."""
+    return samples[min(len(samples) - 1, int(len(samples) * pct / 100))]
+
+
+def summarize(latencies: List[float], elapsed: float, statuses: Dict[int, int], stub: StubRiotServer) -> dict:
+    latencies = sorted(latencies)
+    requests = len(latencies)
+    return {
+        'requests': requests,
+        'throughput': round(requests / elapsed, 2),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+        'max_ms': round(latencies[-1] * 1000, 2),
+        'upstream_calls_per_page': round(stub.request_count / requests, 2),
+        'upstream_429s': stub.rate_limited_count,
+        'upstream_by_route': dict(stub.route_counts),
+        'statuses': {str(status): count for status, count in sorted(statuses.items())}
+    }
+
+
+def timed_request(scenario: Callable, client) -> tuple:
+    start = time.perf_counter()
+    response = scenario(client)
+    if response.is_streamed:
+        _read_stream(response)
+    return time.perf_counter() - start, response.status_code
+
+
+def run_cold(app, stub: StubRiotServer, scenario: Callable, iterations: int) -> dict:
+    """One request at a time, every request starting from an empty cache."""
+    client = app.test_client()
+    latencies, statuses = [], {}
+    stub.reset_counters()
+    start = time.perf_counter()
+
+    for _ in range(iterations):
+        cache.clear()
+        latency, status = timed_request(scenario, client)
+        latencies.append(latency)
+        statuses[status] = statuses.get(status, 0) + 1
+
+    return summarize(latencies, time.perf_counter() - start, statuses, stub)
+
+
+def run_warm(app, stub: StubRiotServer, scenario: Callable, iterations: int, threads: int) -> dict:
+    """Concurrent clients against a primed cache."""
+    cache.clear()
+    timed_request(scenario, app.test_client())
+    stub.reset_counters()
+
+    latencies: List[List[float]] = [[] for _ in range(threads)]
+    statuses: List[Dict[int, int]] = [{} for _ in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index: int):
+        client = app.test_client()
+        barrier.wait()
+        for _ in range(index, iterations, threads):
+            latency, status = timed_request(scenario, client)
+            latencies[index].append(latency)
+            statuses[index][status] = statuses[index].get(status, 0) + 1
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+
+    merged: Dict[int, int] = {}
+    for counts in statuses:
+        for status, count in counts.items():
+            merged[status] = merged.get(status, 0) + count
+
+    return summarize([s for samples in latencies for s in samples], elapsed, merged, stub)
+
+
+def git_revision() -> Dict[str, Any]:
+    """Commit the results belong to (dirty = uncommitted changes present)."""
+    def git(*args) -> str:
+        return subprocess.run(
+            ['git', *args], cwd=project_root, capture_output=True, text=True, check=False
+        ).stdout.strip()
+
+    return {'commit': git('rev-parse', '--short', 'HEAD') or None, 'dirty': bool(git('status', '--porcelain', '--untracked-files=no'))}
+
+
+def compare(results: dict, baseline: dict):
+    """Print the change against a previous results file."""
+    print()
+    print(f"Change vs {baseline['meta'].get('commit') or 'baseline'}:")
+    print(f"{'scenario':<22} {'req/s':>9} {'p50':>9} {'p99':>9} {'calls/page':>11}")
+
+    for name, phases in results['scenarios'].items():
+        for phase, current in phases.items():
+            previous = baseline['scenarios'].get(name, {}).get(phase)
+            if previous is None:
+                continue
+
+            def delta(key: str) -> str:
+                if not previous[key]:
+                    return 'n/a'
+                return f"{(current[key] - previous[key]) / previous[key] * 100:+.1f}%"
+
+            print(
+                f"{name + '/' + phase:<22} {delta('throughput'):>9} {delta('p50_ms'):>9} "
+                f"{delta('p99_ms'):>9} {delta('upstream_calls_per_page'):>11}"
+            )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--latency', type=float, default=0.05, help='stub latency per call (s)')
+    parser.add_argument('--jitter', type=float, default=0.02, help='extra random latency per call, up to (s)')
+    parser.add_argument('--rate-limit-probability', type=float, default=0.0, help='share of calls answered 429')
+    parser.add_argument('--app-limits', default='', help="stub app limits, e.g. '20:1,100:120'")
+    parser.add_argument('--iterations', type=int, default=100, help='warm requests per scenario')
+    parser.add_argument('--cold-iterations', type=int, default=10, help='cold requests per scenario')
+    parser.add_argument('--threads', type=int, default=8, help='concurrent clients in the warm phase')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help='comma-separated scenario names')
+    parser.add_argument('--governor', action='store_true', help='enable the outbound Riot rate governor')
+    parser.add_argument('--seed', type=int, default=1, help='seed for stub jitter and 429s')
+    parser.add_argument('--output', type=Path, help='results file (default: benchmarks/results/<commit>.json)')
+    parser.add_argument('--compare', type=Path, help='earlier results file to compare against')
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.scenarios.split(',') if name.strip()]
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    app_limits = [tuple(int(v) for v in limit.split(':')) for limit in args.app_limits.split(',') if limit]
+
+    app = create_app('testing')
+    logging.disable(logging.CRITICAL)
+
+    results: Dict[str, Any] = {
+        'meta': {
+            **git_revision(),
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'args': {key: str(value) if isinstance(value, Path) else value for key, value in vars(args).items()}
+        },
+        'scenarios': {}
+    }
+
+    stub = StubRiotServer(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit_probability=args.rate_limit_probability,
+        app_limits=app_limits,
+        fixtures=load_fixtures(),
+        seed=args.seed
+    )
+
+    with stub:
+        app.config.update(RIOT_API_KEY='bench', RIOT_API_BASE_URL=stub.base_url, RATE_LIMIT_ENABLED=False)
+        rate_governor.enabled = args.governor
+
+        print(f"Stub: {args.latency * 1000:.0f} ms + up to {args.jitter * 1000:.0f} ms jitter, "
+              f"{args.rate_limit_probability:.1%} 429s | warm: {args.threads} threads x {args.iterations} requests")
+        print()
+        print(f"{'scenario':<22} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'calls/page':>11} {'429s':>5}  statuses")
+
+        for name in names:
+            scenario = SCENARIOS[name]
+            phases = {
+                'cold': run_cold(app, stub, scenario, args.cold_iterations),
+                'warm': run_warm(app, stub, scenario, args.iterations, args.threads)
+            }
+            results['scenarios'][name] = phases
+
+            for phase, result in phases.items():
+                statuses = ' '.join(f"{status}x{count}" for status, count in result['statuses'].items())
+                print(
+                    f"{name + '/' + phase:<22} {result['throughput']:>9.1f} {result['p50_ms']:>9.1f} "
+                    f"{result['p99_ms']:>9.1f} {result['upstream_calls_per_page']:>11.2f} "
+                    f"{result['upstream_429s']:>5}  {statuses}"
+                )
+
+    output = args.output or RESULTS_DIR / f"{results['meta']['commit'] or 'results'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2), encoding='utf-8')
+    print()
+    print(f"Results written to {output}")
+
+    if args.compare:
+        compare(results, json.loads(args.compare.read_text(encoding='utf-8')))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,103 @@
+# benchmarks/record_fixtures.py
+"""
+Record Riot API responses as stub server fixtures.
+
+Fetches one account, summoner, match and (if the player is in one) Clash
+team from the live API and writes them to benchmarks/fixtures/ with
+player identities replaced: the recorded player becomes STUB_PUUID and
+everyone else a numbered placeholder. Needs RIOT_API_KEY.
+
+Usage:
+    python -m benchmarks.record_fixtures "Name#TAG" EUW [--out benchmarks/fixtures]
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app import create_app
+from app.services.riot_api import RiotAPIError, get_api_base_url, get_region, get_server_code, make_api_request
+from benchmarks.stub_riot_server import FIXTURES_DIR, STUB_PUUID
+
+# Fields holding player identity; values are replaced wherever they appear
+IDENTITY_FIELDS = ('puuid', 'summonerId', 'summonerName', 'riotIdGameName', 'riotIdTagline', 'gameName', 'id')
+
+
+def anonymize(document: Any, puuid: str) -> Any:
+    """Replace player identities; the recorded player maps to STUB_PUUID."""
+    aliases: Dict[str, str] = {puuid: STUB_PUUID}
+
+    def alias(value: str) -> str:
+        if value not in aliases:
+            aliases[value] = f'player-{len(aliases):02d}'
+        return aliases[value]
+
+    def walk(node: Any, key: str = '') -> Any:
+        if isinstance(node, dict):
+            return {k: walk(v, k) for k, v in node.items()}
+        if isinstance(node, list):
+            # metadata.participants is a plain list of PUUIDs
+            return [alias(v) if key == 'participants' and isinstance(v, str) else walk(v) for v in node]
+        if key in IDENTITY_FIELDS and isinstance(node, str):
+            return alias(node)
+        return node
+
+    return walk(document)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('riot_id', help='player as Name#TAG')
+    parser.add_argument('server', help="server name, e.g. 'EUW'")
+    parser.add_argument('--out', type=Path, default=FIXTURES_DIR, help='fixture directory')
+    args = parser.parse_args()
+
+    game_name, _, tag_line = args.riot_id.partition('#')
+    app = create_app('development')
+    logging.disable(logging.INFO)
+
+    if not app.config.get('RIOT_API_KEY'):
+        print("RIOT_API_KEY is not set", file=sys.stderr)
+        return 1
+
+    headers = {'X-Riot-Token': app.config['RIOT_API_KEY']}
+    regional = get_api_base_url(get_region(args.server))
+    platform = get_api_base_url(get_server_code(args.server))
+    fixtures: Dict[str, Any] = {}
+
+    with app.app_context():
+        try:
+            account = make_api_request(f'{regional}/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}', headers)
+            puuid = account['puuid']
+            fixtures['account'] = account
+            fixtures['summoner'] = summoner = make_api_request(f'{platform}/lol/summoner/v4/summoners/by-puuid/{puuid}', headers)
+
+            match_ids = make_api_request(f'{regional}/lol/match/v5/matches/by-puuid/{puuid}/ids', headers, {'count': 1})
+            if match_ids:
+                fixtures['match'] = make_api_request(f'{regional}/lol/match/v5/matches/{match_ids[0]}', headers)
+
+            teams = make_api_request(f"{platform}/lol/clash/v1/players/by-summoner/{summoner['id']}", headers)
+            if teams:
+                fixtures['clash_player'] = teams
+                fixtures['clash_team'] = make_api_request(f"{platform}/lol/clash/v1/teams/{teams[0]['teamId']}", headers)
+        except (RiotAPIError, KeyError, TypeError) as e:
+            print(f"Recording failed: {e}", file=sys.stderr)
+            return 1
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    for route, document in fixtures.items():
+        path = args.out / f'{route}.json'
+        path.write_text(json.dumps(anonymize(document, puuid), indent=1), encoding='utf-8')
+        print(f"{path}  {path.stat().st_size / 1024:6.1f} KB")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,389 @@
+# benchmarks/stub_riot_server.py
+"""
+Local stand-in for the Riot API used by benchmarks.
+
+Serves account-v1, summoner-v4, match-v5 and clash-v1 payloads with
+configurable latency, jitter and 429 behaviour. Payloads come from the
+recorded fixtures in benchmarks/fixtures/ (one document per route, with
+identifiers rewritten per request; see benchmarks/record_fixtures.py),
+or are synthesized when no fixture directory is given. Point the app at
+it with::
+
+    RIOT_API_BASE_URL = server.base_url   # 'http://127.0.0.1:<port>/{host}'
+"""
+
+import copy
+import json
+import random
+import re
+import threading
+import time
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs, unquote
+
+STUB_PUUID = 'stub-puuid-0000000000000000000000000000000000000000000000000000'
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+
+def load_fixtures(directory: Path = FIXTURES_DIR) -> Dict[str, Any]:
+    """Load ``<route>.json`` fixtures from a directory, keyed by route name."""
+    return {path.stem: json.loads(path.read_text(encoding='utf-8')) for path in Path(directory).glob('*.json')}
+
+
+def make_participant(index: int, puuid: str) -> Dict[str, Any]:
+    """Build a synthetic match-v5 participant."""
+    return {
+        'puuid': puuid,
+        'riotIdGameName': f'Player{index}',
+        'riotIdTagline': 'STUB',
+        'championName': 'Aatrox',
+        'championId': 266,
+        'champLevel': 18,
+        'teamId': 100 if index < 5 else 200,
+        'teamPosition': ['TOP', 'JUNGLE', 'MIDDLE', 'BOTTOM', 'UTILITY'][index % 5],
+        'individualPosition': ['TOP', 'JUNGLE', 'MIDDLE', 'BOTTOM', 'UTILITY'][index % 5],
+        'kills': index, 'deaths': 3, 'assists': 7,
+        'win': index < 5,
+        'totalMinionsKilled': 180, 'neutralMinionsKilled': 20,
+        'totalDamageDealtToChampions': 25000, 'totalDamageTaken': 18000,
+        'goldEarned': 15000, 'visionScore': 45,
+        'item0': 3153, 'item1': 3074, 'item2': 3071, 'item3': 3111,
+        'item4': 3065, 'item5': 3143, 'item6': 3340,
+        'summoner1Id': 4, 'summoner2Id': 14,
+        'profileIconId': 29,
+    }
+
+
+# Shape of the bulk of a real match-v5 participant that the app never reads
+_EXTRA_STAT_COUNT = 40
+_CHALLENGE_COUNT = 90
+_MISSION_COUNT = 12
+
+
+def add_full_detail(participant: Dict[str, Any], index: int) -> Dict[str, Any]:
+    """
+    Pad a participant to the size of a real match-v5 entry.
+
+    Adds ``perks``, ``challenges``, ``missions`` and the long tail of
+    per-player counters (roughly 5 KB of JSON per participant).
+    """
+    participant.update({
+        'perks': {
+            'statPerks': {'defense': 5002, 'flex': 5008, 'offense': 5005},
+            'styles': [
+                {
+                    'description': 'primaryStyle',
+                    'style': 8000,
+                    'selections': [
+                        {'perk': perk, 'var1': 1200 + index, 'var2': 0, 'var3': 0}
+                        for perk in (8010, 9111, 9105, 8299)
+                    ]
+                },
+                {
+                    'description': 'subStyle',
+                    'style': 8400,
+                    'selections': [
+                        {'perk': perk, 'var1': 300, 'var2': 0, 'var3': 0}
+                        for perk in (8444, 8453)
+                    ]
+                }
+            ]
+        },
+        'challenges': {f'challengeStat{i:03d}': round((i * 7919 + index) % 1000 / 7, 2) for i in range(_CHALLENGE_COUNT)},
+        'missions': {f'playerScore{i}': float(i + index) for i in range(_MISSION_COUNT)},
+        'physicalDamageDealtToChampions': 14000,
+        'magicDamageDealtToChampions': 9000,
+        'trueDamageDealtToChampions': 2000,
+        'damageSelfMitigated': 21000,
+        'wardsPlaced': 12,
+        'wardsKilled': 4,
+        'detectorWardsPlaced': 3,
+        'doubleKills': 1,
+        'largestKillingSpree': 4,
+        'largestMultiKill': 2,
+        'summonerId': f'summoner-id-{index:02d}-000000000000000000000000000000',
+        'summonerName': f'Player{index}',
+    })
+    participant.update({f'extraCounterStat{i:02d}': i * index for i in range(_EXTRA_STAT_COUNT)})
+    return participant
+
+
+def make_match(match_id: str, puuid: str = STUB_PUUID, full: bool = False) -> Dict[str, Any]:
+    """
+    Build a synthetic match-v5 document containing ``puuid``.
+
+    Args:
+        match_id: Match ID
+        puuid: PUUID of the first participant
+        full: Pad participants to the size of real payloads (see add_full_detail)
+    """
+    participants = [make_participant(0, puuid)]
+    participants += [make_participant(i, f'other-puuid-{i}') for i in range(1, 10)]
+
+    if full:
+        participants = [add_full_detail(p, i) for i, p in enumerate(participants)]
+
+    return {
+        'metadata': {
+            'matchId': match_id,
+            'participants': [p['puuid'] for p in participants]
+        },
+        'info': {
+            'gameCreation': 1700000000000,
+            'gameDuration': 1800,
+            'gameEndTimestamp': 1700001800000,
+            'gameMode': 'CLASSIC',
+            'queueId': 420,
+            'participants': participants,
+            'teams': [{'teamId': 100, 'win': True}, {'teamId': 200, 'win': False}]
+        }
+    }
+
+
+class StubRiotServer:
+    """Threaded HTTP server emulating the Riot API endpoints used by the app."""
+
+    ROUTES = [
+        ('account', re.compile(r'^/riot/account/v1/accounts/by-riot-id/([^/]+)/([^/]+)$')),
+        ('summoner', re.compile(r'^/lol/summoner/v4/summoners/by-puuid/([^/]+)$')),
+        ('match_ids', re.compile(r'^/lol/match/v5/matches/by-puuid/([^/]+)/ids$')),
+        ('match', re.compile(r'^/lol/match/v5/matches/([^/]+)$')),
+        ('clash_player', re.compile(r'^/lol/clash/v1/players/by-summoner/([^/]+)$')),
+        ('clash_team', re.compile(r'^/lol/clash/v1/teams/([^/]+)$')),
+    ]
+
+    def __init__(
+            self,
+            latency: float = 0.0,
+            host: str = '127.0.0.1',
+            port: int = 0,
+            app_limits: Optional[List[Tuple[int, int]]] = None,
+            method_limits: Optional[List[Tuple[int, int]]] = None,
+            jitter: float = 0.0,
+            rate_limit_probability: float = 0.0,
+            retry_after: int = 1,
+            fixtures: Optional[Dict[str, Any]] = None,
+            seed: Optional[int] = None
+    ):
+        """
+        Initialize stub server.
+
+        Args:
+            latency: Seconds to wait before answering each request
+            host: Interface to bind
+            port: Port to bind (0 = pick a free port)
+            app_limits: Riot-style (count, window seconds) limits across all routes
+            method_limits: Riot-style limits applied to each route separately
+            jitter: Extra latency drawn uniformly from [0, jitter] seconds per request
+            rate_limit_probability: Share of requests answered with a 429 regardless of limits
+            retry_after: Retry-After seconds sent with those injected 429s
+            fixtures: Payloads by route name (see load_fixtures); synthetic when missing
+            seed: Seed for jitter and injected 429s (reproducible runs)
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_probability = rate_limit_probability
+        self.retry_after = retry_after
+        self.fixtures = fixtures or {}
+        self._random = random.Random(seed)
+        self.request_count = 0
+        self.rate_limited_count = 0
+        self.route_counts: Dict[str, int] = {}
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+        # Fixed windows as Riot enforces them: [count, window_start] per limit
+        self.app_limits = app_limits or []
+        self.method_limits = method_limits or []
+        self._app_windows = [[0, 0.0] for _ in self.app_limits]
+        self._method_windows: Dict[str, List[List[float]]] = {}
+
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """RIOT_API_BASE_URL template pointing at this server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/{{host}}"
+
+    def start(self) -> 'StubRiotServer':
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True, name='StubRiotServer')
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the server."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset_counters(self):
+        """Reset request counters and rate limit windows."""
+        with self._lock:
+            self.request_count = 0
+            self.rate_limited_count = 0
+            self.route_counts = {}
+            self.max_in_flight = 0
+            self._app_windows = [[0, 0.0] for _ in self.app_limits]
+            self._method_windows = {}
+
+    @staticmethod
+    def _count_windows(limits, windows, now: float) -> Tuple[bool, float, str]:
+        """Count a request in each fixed window; returns (allowed, retry_after, counts)."""
+        allowed = True
+        retry_after = 0.0
+
+        for (limit, window), state in zip(limits, windows):
+            if now - state[1] >= window:
+                state[0], state[1] = 0, now
+            state[0] += 1
+            if state[0] > limit:
+                allowed = False
+                retry_after = max(retry_after, state[1] + window - now)
+
+        counts = ','.join(f"{int(state[0])}:{window}" for (_, window), state in zip(limits, windows))
+        return allowed, retry_after, counts
+
+    def check_rate_limits(self, route: str) -> Tuple[Optional[float], Dict[str, str]]:
+        """
+        Apply Riot-style limits to one request.
+
+        Returns:
+            Tuple of (Retry-After seconds if the request is rejected, rate limit headers)
+        """
+        headers = {}
+        now = time.monotonic()
+
+        with self._lock:
+            app_ok, app_retry, app_counts = self._count_windows(self.app_limits, self._app_windows, now)
+            windows = self._method_windows.setdefault(route, [[0, 0.0] for _ in self.method_limits])
+            method_ok, method_retry, method_counts = self._count_windows(self.method_limits, windows, now)
+
+            if not (app_ok and method_ok):
+                self.rate_limited_count += 1
+
+        if self.app_limits:
+            headers['X-App-Rate-Limit'] = ','.join(f"{c}:{w}" for c, w in self.app_limits)
+            headers['X-App-Rate-Limit-Count'] = app_counts
+        if self.method_limits:
+            headers['X-Method-Rate-Limit'] = ','.join(f"{c}:{w}" for c, w in self.method_limits)
+            headers['X-Method-Rate-Limit-Count'] = method_counts
+
+        if app_ok and method_ok:
+            return None, headers
+
+        headers['X-Rate-Limit-Type'] = 'application' if not app_ok else 'method'
+        return max(app_retry, method_retry), headers
+
+    def __enter__(self) -> 'StubRiotServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def route_name(self, path: str) -> str:
+        """Name of the route serving a path (method limits are per route)."""
+        for name, pattern in self.ROUTES:
+            if pattern.match(path):
+                return name
+        return 'unknown'
+
+    def handle(self, path: str, query: Dict[str, list]) -> Tuple[int, Any]:
+        """Resolve a request path (without the host prefix) to a payload."""
+        for name, pattern in self.ROUTES:
+            match = pattern.match(path)
+            if not match:
+                continue
+
+            arg = unquote(match.group(1))
+
+            fixture = self.fixtures.get(name)
+
+            if name == 'account':
+                return 200, {**(fixture or {}), 'puuid': STUB_PUUID, 'gameName': arg, 'tagLine': unquote(match.group(2))}
+            if name == 'summoner':
+                if fixture:
+                    return 200, {**fixture, 'puuid': arg}
+                return 200, {'id': 'stub-summoner-id', 'puuid': arg, 'profileIconId': 29, 'summonerLevel': 150}
+            if name == 'match_ids':
+                start = int(query.get('start', ['0'])[0])
+                count = int(query.get('count', ['20'])[0])
+                return 200, [f'STUB_{i}' for i in range(start, start + count)]
+            if name == 'match':
+                if fixture:
+                    # Only the ID differs between served matches; the rest is shared read-only
+                    return 200, {**fixture, 'metadata': {**fixture['metadata'], 'matchId': arg}}
+                return 200, make_match(arg)
+            if name == 'clash_player':
+                if fixture:
+                    return 200, [{**entry, 'summonerId': arg} for entry in copy.deepcopy(fixture)]
+                return 200, [{'summonerId': arg, 'teamId': 'stub-team', 'position': 'TOP', 'role': 'CAPTAIN'}]
+            if name == 'clash_team':
+                if fixture:
+                    return 200, {**fixture, 'id': arg}
+                return 200, {'id': arg, 'tournamentId': 5001, 'name': 'Stub Team', 'players': []}
+
+        return 404, {'status': {'message': 'Data not found', 'status_code': 404}}
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.request_count += 1
+                    stub._in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub._in_flight)
+
+                try:
+                    with stub._lock:
+                        delay = stub.latency + (stub._random.uniform(0, stub.jitter) if stub.jitter else 0.0)
+                        injected_429 = stub._random.random() < stub.rate_limit_probability
+                    if delay:
+                        time.sleep(delay)
+
+                    parsed = urlparse(self.path)
+                    # Strip routing host prefix ('/europe/lol/...' -> '/lol/...')
+                    path = '/' + parsed.path.lstrip('/').partition('/')[2]
+                    route = stub.route_name(path)
+
+                    with stub._lock:
+                        stub.route_counts[route] = stub.route_counts.get(route, 0) + 1
+
+                    retry_after, limit_headers = stub.check_rate_limits(route)
+                    if retry_after is None and injected_429:
+                        with stub._lock:
+                            stub.rate_limited_count += 1
+                        retry_after = float(stub.retry_after)
+                        limit_headers['X-Rate-Limit-Type'] = 'service'
+                    if retry_after is not None:
+                        status, payload = 429, {'status': {'message': 'Rate limit exceeded', 'status_code': 429}}
+                        limit_headers['Retry-After'] = str(max(1, int(retry_after + 0.999)))
+                    else:
+                        status, payload = stub.handle(path, parse_qs(parsed.query))
+
+                    body = json.dumps(payload).encode('utf-8')
+                    self.send_response(status)
+                    for name, value in limit_headers.items():
+                        self.send_header(name, value)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with stub._lock:
+                        stub._in_flight -= 1
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -68,6 +68,7 @@ from config.ssl_config import (
 
 from config.logging_config import (
     setup_logging,
+    get_log_queue_stats,
     get_logger,
     log_error_with_context,
     log_request_info,
@@ -146,6 +147,7 @@ __all__ = [
 
     # Logging Config
     'setup_logging',
+    'get_log_queue_stats',
     'get_logger',
     'log_error_with_context',
     'log_request_info',
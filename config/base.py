@@ -25,18 +25,59 @@ class Config:
     # Riot API
     RIOT_API_KEY = os.getenv('RIOT_API_KEY', '')
     RIOT_API_TIMEOUT = int(os.getenv('RIOT_API_TIMEOUT', '10'))
+    RIOT_API_BASE_URL = os.getenv('RIOT_API_BASE_URL', 'https://{host}.api.riotgames.com')
+    RIOT_API_MAX_CONCURRENCY = int(os.getenv('RIOT_API_MAX_CONCURRENCY', '8'))  # Parallel match fetches
+    RIOT_CALLS_PER_REQUEST_MAX = int(os.getenv('RIOT_CALLS_PER_REQUEST_MAX', '0'))  # Fail fast past this many calls (0 = no cap)
+
+    # Riot HTTP connection pool (one keep-alive pool per API host)
+    RIOT_HTTP_POOL_MAXSIZE = int(os.getenv('RIOT_HTTP_POOL_MAXSIZE', '10'))  # Connections per host
+    RIOT_HTTP_POOL_BLOCK = False  # Wait for a free connection instead of opening an extra one
+    RIOT_HTTP_KEEP_ALIVE = os.getenv('RIOT_HTTP_KEEP_ALIVE', 'true').lower() == 'true'
+
+    # Outbound Riot rate governor (limits are learned from X-*-Rate-Limit headers)
+    RIOT_RATE_GOVERNOR_ENABLED = True
+    RIOT_APP_RATE_LIMIT = os.getenv('RIOT_APP_RATE_LIMIT', '20:1,100:120')  # Assumed until Riot reports it
+    RIOT_RATE_LIMIT_MARGIN = 0.1  # Seconds added to each window for latency / clock skew
+    RIOT_RATE_LIMIT_MAX_WAIT = 10.0  # Longest a call waits for budget before RateLimitError
+    RIOT_BACKGROUND_HEADROOM = 0.25  # Share of each window background calls leave for page loads
+
+    # Sampled outbound call tracing (JSON lines on the 'riot.trace' logger, credentials redacted;
+    # logged at INFO whatever LOG_LEVEL is)
+    RIOT_TRACE_ENABLED = os.getenv('RIOT_TRACE_ENABLED', 'false').lower() == 'true'
+    RIOT_TRACE_SAMPLE_RATE = float(os.getenv('RIOT_TRACE_SAMPLE_RATE', '0.01'))
+    RIOT_TRACE_LOG = True  # Also log records (hooks receive them either way)
+
+    # Prometheus metrics (multiprocess under gunicorn via PROMETHEUS_MULTIPROC_DIR, see gunicorn.conf.py)
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+    METRICS_PATH = '/metrics'
+
+    # Per-request Riot call / cache / wait breakdown in a Server-Timing response header
+    SERVER_TIMING_ENABLED = os.getenv('SERVER_TIMING_ENABLED', 'true').lower() == 'true'
 
     # Redis (for caching and rate limiting)
     REDIS_URL = os.getenv('REDIS_URL', None)
 
     # Cache settings
-    CACHE_TYPE = 'simple'  # 'simple' for in-memory, 'redis' for Redis
+    CACHE_TYPE = os.getenv('CACHE_TYPE', 'simple')  # 'simple' for in-memory, 'redis' for Redis
     CACHE_DEFAULT_TIMEOUT = 300  # 5 minutes
     CACHE_MAX_SIZE = 1000  # Max items in in-memory cache
+    CACHE_REDIS_URL = os.getenv('CACHE_REDIS_URL', REDIS_URL)  # Shared by all workers
+    CACHE_KEY_PREFIX = 'clashfinder:'
+    CACHE_STALE_REFRESH_WORKERS = 4  # Max background refreshes for stale_ttl entries
+
+    # Persistent match store (finished match-v5 payloads, SQLite WAL; opt in per deployment)
+    MATCH_STORE_ENABLED = os.getenv('MATCH_STORE_ENABLED', 'false').lower() == 'true'
+    MATCH_STORE_PATH = os.getenv(
+        'MATCH_STORE_PATH',
+        os.path.join(os.path.dirname(os.path.dirname(__file__)), 'instance', 'match_store.db')
+    )
+    MATCH_STORE_MAX_BYTES = int(os.getenv('MATCH_STORE_MAX_BYTES', str(512 * 1024 * 1024)))
 
     # Rate limiting
     RATE_LIMIT_ENABLED = True
-    RATE_LIMIT_STORAGE_URL = REDIS_URL
+    RATE_LIMIT_STORAGE_URL = os.getenv('RATE_LIMIT_STORAGE_URL', REDIS_URL)  # Shared by all workers when set
+    RATE_LIMIT_KEY_PREFIX = 'clashfinder:ratelimit:'
+    RATE_LIMIT_LOCK_STRIPES = 64  # Independently locked key partitions in the in-memory limiter
 
     # Rate limits per endpoint (per minute, per hour)
     RATE_LIMIT_HOME_MINUTE = 100
@@ -66,6 +107,10 @@ class Config:
     LOG_FILE = os.path.join(LOG_DIR, 'app.log')
     LOG_MAX_BYTES = 10 * 1024 * 1024  # 10MB
     LOG_BACKUP_COUNT = 5
+    LOG_QUEUE_ENABLED = os.getenv('LOG_QUEUE_ENABLED', 'false').lower() == 'true'  # Write logs from a background thread
+    LOG_QUEUE_SIZE = 10000  # Records buffered before low-priority ones are dropped
+    LOG_JSON = os.getenv('LOG_JSON', 'false').lower() == 'true'  # JSON-lines log files (scripts/check_logs.py)
+    REQUEST_LOG_LEVEL = os.getenv('REQUEST_LOG_LEVEL', 'INFO')  # 'requests' logger (per-request summaries), independent of LOG_LEVEL
 
     # Static files
     STATIC_FOLDER = 'static'
@@ -204,6 +249,12 @@ class TestingConfig(Config):
     # Use in-memory cache for tests
     CACHE_TYPE = 'simple'
 
+    # Keep tests off the on-disk match store
+    MATCH_STORE_ENABLED = False
+
+    # Mocked Riot calls carry no rate limit headers
+    RIOT_RATE_GOVERNOR_ENABLED = False
+
     # Disable CSRF for testing
     WTF_CSRF_ENABLED = False
 
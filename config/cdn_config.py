@@ -13,6 +13,10 @@ DDRAGON_VERSION = os.getenv('DDRAGON_VERSION', '15.19.1')
 CDN_BASE_URL = 'https://ddragon.leagueoflegends.com/cdn'
 COMMUNITY_DRAGON_URL = 'https://raw.communitydragon.org/latest'
 
+# Local icon mirror (see ResourceDownloader.download_assets), one directory per version
+ASSET_MIRROR_DIR = 'app/static/img/ddragon'
+ASSET_MIRROR_URL = '/static/img/ddragon'
+
 # Resource paths
 RESOURCE_PATHS = {
     'champion': f'{CDN_BASE_URL}/{DDRAGON_VERSION}/img/champion',
@@ -4,12 +4,15 @@ Logging configuration for Clash Finder application.
 Provides structured logging with rotation and multiple handlers.
 """
 
+import atexit
+import json
 import os
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 # Log directory
 LOG_DIR = Path(__file__).parent.parent / 'logs'
@@ -59,26 +62,163 @@ class ColoredFormatter(logging.Formatter):
         return result
 
 
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line.
+
+    Always has ts (epoch seconds), time, level, logger and msg. Values
+    passed with ``extra=`` (e.g. endpoint, duration_ms, riot_calls,
+    cache_hits on request summaries) become top-level keys.
+    """
+
+    # Attributes every LogRecord has; anything else came from extra=
+    RESERVED = frozenset(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+    def format(self, record):
+        """Format log record as a JSON line."""
+        entry = {
+            'ts': round(record.created, 3),
+            'time': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage()
+        }
+
+        for key, value in record.__dict__.items():
+            if key not in self.RESERVED and not key.startswith('_'):
+                entry[key] = value
+
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+
+        return json.dumps(entry, default=str, separators=(',', ':'))
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler with a bounded queue that never stalls the caller for long.
+
+    When the queue is full, records below WARNING are dropped at once and
+    WARNING and above wait up to ``block_timeout`` seconds for room before
+    being dropped. Drops are counted and reported with a WARNING record as
+    soon as the queue accepts records again.
+    """
+
+    def __init__(self, log_queue: queue.Queue, block_timeout: float = 0.1):
+        super().__init__(log_queue)
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self._unreported = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            if record.levelno >= logging.WARNING:
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            with self.lock:
+                self.dropped += 1
+                self._unreported += 1
+            return
+
+        with self.lock:
+            dropped, self._unreported = self._unreported, 0
+
+        if dropped:
+            notice = logging.LogRecord(
+                'logging', logging.WARNING, __file__, 0,
+                f"Log queue full - dropped {dropped} records", None, None
+            )
+            try:
+                self.queue.put_nowait(notice)
+            except queue.Full:
+                with self.lock:
+                    self._unreported += dropped
+
+
+class _LogQueueListener(QueueListener):
+    """QueueListener whose stop() waits for room instead of failing on a full queue."""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+# Listener of the active queued pipeline (one per process)
+_queue_listener: Optional[QueueListener] = None
+_queue_handler: Optional[DroppingQueueHandler] = None
+
+
+def _stop_queue_listener():
+    """Flush and stop the background log writer, if running."""
+    global _queue_listener, _queue_handler
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+        _queue_handler = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+def get_log_queue_stats() -> dict:
+    """Get queued logging pipeline statistics."""
+    if _queue_handler is None:
+        return {'enabled': False}
+
+    return {
+        'enabled': True,
+        'queued': _queue_handler.queue.qsize(),
+        'capacity': _queue_handler.queue.maxsize,
+        'dropped': _queue_handler.dropped
+    }
+
+
 def setup_logging(
         app=None,
         log_level: str = DEFAULT_LOG_LEVEL,
         log_file: Optional[str] = None,
         enable_console: bool = True,
-        enable_file: bool = True
+        enable_file: bool = True,
+        use_queue: bool = False,
+        queue_size: int = 10000,
+        json_format: bool = False,
+        logger_levels: Optional[Dict[str, str]] = None
 ):
     """
     Setup application logging.
 
+    With ``use_queue`` the console and file handlers run on a background
+    QueueListener thread and the root logger only enqueues records, so
+    request threads never wait on file I/O or rotation. Call after any
+    fork (e.g. in each gunicorn worker), as the listener thread does not
+    survive one.
+
     Args:
         app: Flask application instance (optional)
         log_level: Logging level ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
         log_file: Path to log file (default: logs/app.log)
         enable_console: Enable console logging
         enable_file: Enable file logging
+        use_queue: Write records from a background thread
+        queue_size: Records buffered before the drop policy applies
+        json_format: Write log files as JSON lines (see JsonFormatter and scripts/check_logs.py)
+        logger_levels: Levels of named loggers that apply instead of log_level
+            (e.g. {'requests': 'INFO'} keeps request summaries at a WARNING root level)
     """
+    global _queue_listener, _queue_handler
+
     # Get log level
     level = LOG_LEVELS.get(log_level, logging.INFO)
 
+    # Named loggers filter their own records; handlers pass the lowest level any logger uses
+    handler_level = level
+    for name, logger_level in (logger_levels or {}).items():
+        named_level = LOG_LEVELS.get(logger_level.upper(), logging.INFO)
+        logging.getLogger(name).setLevel(named_level)
+        handler_level = min(handler_level, named_level)
+
     # Default log file
     if log_file is None:
         log_file = str(LOG_DIR / 'app.log')
@@ -87,13 +227,15 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
 
-    # Remove existing handlers
+    # Remove existing handlers (flushing a previous queued pipeline first)
+    _stop_queue_listener()
     root_logger.handlers.clear()
+    handlers = []
 
     # Console handler
     if enable_console:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(level)
+        console_handler.setLevel(handler_level)
 
         # Use colored formatter for console
         console_formatter = ColoredFormatter(
@@ -101,7 +243,7 @@ def setup_logging(
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         console_handler.setFormatter(console_formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # File handler with rotation
     if enable_file:
@@ -110,15 +252,18 @@ def setup_logging(
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=5
         )
-        file_handler.setLevel(level)
+        file_handler.setLevel(handler_level)
 
         # Detailed formatter for file
-        file_formatter = logging.Formatter(
-            '[%(asctime)s] %(levelname)s [%(name)s:%(lineno)d] %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        if json_format:
+            file_formatter = JsonFormatter()
+        else:
+            file_formatter = logging.Formatter(
+                '[%(asctime)s] %(levelname)s [%(name)s:%(lineno)d] %(message)s',
+                datefmt='%Y-%m-%d %H:%M:%S'
+            )
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
     # Error file handler (only errors and above)
     if enable_file:
@@ -130,7 +275,16 @@ def setup_logging(
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(file_formatter)
-        root_logger.addHandler(error_handler)
+        handlers.append(error_handler)
+
+    if use_queue:
+        _queue_handler = DroppingQueueHandler(queue.Queue(maxsize=queue_size))
+        _queue_listener = _LogQueueListener(_queue_handler.queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
+        root_logger.addHandler(_queue_handler)
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
 
     # Configure Flask app logger if provided
     if app:
@@ -141,7 +295,7 @@ def setup_logging(
             logging.getLogger('werkzeug').setLevel(logging.WARNING)
 
     # Log startup message
-    root_logger.info(f"Logging initialized | Level: {log_level} | File: {log_file}")
+    root_logger.info(f"Logging initialized | Level: {log_level} | File: {log_file} | Queued: {use_queue} | JSON: {json_format}")
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -0,0 +1,40 @@
+# gunicorn.conf.py
+"""
+Gunicorn settings for Clash Finder.
+
+Picked up automatically when gunicorn is started from the project root:
+
+    gunicorn "app:create_app('production')"
+
+Prometheus metrics run in multiprocess mode: each worker writes its
+samples to PROMETHEUS_MULTIPROC_DIR and /metrics merges them, so a
+scrape sees the totals of all workers whichever one answers it.
+"""
+
+import os
+import shutil
+import tempfile
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.getenv('GUNICORN_WORKERS', '4'))
+threads = int(os.getenv('GUNICORN_THREADS', '4'))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '60'))
+
+# Must be set before prometheus_client is imported (workers import the app after this file)
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', os.path.join(tempfile.gettempdir(), 'clashfinder-metrics'))
+
+
+def on_starting(server):
+    """Start from an empty metrics directory; files from a previous run would be merged in."""
+    metrics_dir = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """Drop a dead worker's live gauges (in-flight fetches) from the aggregate."""
+    try:
+        from prometheus_client import multiprocess
+    except ImportError:  # pragma: no cover - prometheus_client is optional
+        return
+    multiprocess.mark_process_dead(worker.pid)
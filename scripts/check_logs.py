@@ -1,153 +1,422 @@
 # scripts/check_logs.py
 """
 Script to analyze application logs.
+
+Streams the log file and its rotations (app.log.N ... app.log) line by
+line, so multi-GB logs are analyzed in constant memory. Reads both the
+JSON-lines format (LOG_JSON=true) and the classic text format. For JSON
+logs it also reports request latency percentiles per endpoint and Riot
+API calls per page view, taken from the per-request summary records.
+
+Usage:
+    python scripts/check_logs.py [hours]
+    python scripts/check_logs.py --since 2026-01-31T18:00 --until 2026-01-31T19:00
+    python scripts/check_logs.py --follow --interval 30
 """
 
+import argparse
+import json
+import math
+import os
+import re
 import sys
+import time
+from collections import Counter, deque
+from datetime import datetime
 from pathlib import Path
-from collections import Counter
-from datetime import datetime, timedelta
-import re
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Pattern: [timestamp] LEVEL in module: message  /  [timestamp] LEVEL [module:line] message
+TEXT_PATTERN = re.compile(r'\[(.+?)\] (\w+) (?:in (.+?): |\[(.+?)(?::\d+)?\] )?(.+)')
 
-def parse_log_line(line):
-    """Parse a log line and extract components."""
-    # Pattern: [timestamp] LEVEL in module: message
-    pattern = r'\[(.+?)\] (\w+) (?:in (.+?): )?(.+)'
-    match = re.match(pattern, line)
+# Endpoints that are full page loads (follow-up XHR/stream requests are charged to them)
+DEFAULT_PAGE_ENDPOINTS = ('player.player_stats', 'clash.clash_team', 'main.index')
 
-    if match:
-        timestamp_str, level, module, message = match.groups()
+_timestamp_cache: Dict[str, Optional[float]] = {}
+
+
+def _text_timestamp(value: str) -> Optional[float]:
+    """Epoch seconds of a '%Y-%m-%d %H:%M:%S' stamp (cached; many lines share a second)."""
+    epoch = _timestamp_cache.get(value)
+    if epoch is None and value not in _timestamp_cache:
+        try:
+            epoch = time.mktime(time.strptime(value, '%Y-%m-%d %H:%M:%S'))
+        except ValueError:
+            epoch = None
+        if len(_timestamp_cache) > 100000:
+            _timestamp_cache.clear()
+        _timestamp_cache[value] = epoch
+    return epoch
+
+
+def parse_log_line(line: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse a log line (JSON or text) into a record.
+
+    Returns:
+        Dict with ts (epoch seconds or None), level, module and message,
+        plus any structured fields of JSON records; None if unparseable
+    """
+    if line.startswith('{'):
         try:
-            timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
+            entry = json.loads(line)
         except ValueError:
-            timestamp = None
+            return None
+        entry['module'] = entry.get('logger', 'unknown')
+        entry['message'] = entry.get('msg', '')
+        return entry
 
-        return {
-            'timestamp': timestamp,
-            'level': level,
-            'module': module or 'unknown',
-            'message': message
-        }
+    match = TEXT_PATTERN.match(line)
+    if not match:
+        return None
 
+    timestamp_str, level, module, file_module, message = match.groups()
+    return {
+        'ts': _text_timestamp(timestamp_str),
+        'level': level,
+        'module': module or file_module or 'unknown',
+        'message': message
+    }
+
+
+def parse_time(value: str) -> float:
+    """Parse an ISO timestamp or a number of hours ago into epoch seconds."""
+    try:
+        return time.time() - float(value) * 3600
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram (~2.5% resolution, constant memory)."""
+
+    SCALE = 40
+
+    def __init__(self):
+        self.buckets: Counter = Counter()
+        self.count = 0
+
+    def add(self, ms: float):
+        self.buckets[int(math.log1p(max(ms, 0.0)) * self.SCALE)] += 1
+        self.count += 1
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th percentile (ms)."""
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * q / 100)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return math.expm1((bucket + 1) / self.SCALE)
+        return 0.0
+
+
+class EndpointStats:
+    """Request summary totals for one endpoint."""
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.riot_calls = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.server_errors = 0
+
+    def add(self, entry: Dict[str, Any]):
+        self.latency.add(float(entry.get('duration_ms', 0)))
+        self.riot_calls += entry.get('riot_calls', 0)
+        self.cache_hits += entry.get('cache_hits', 0)
+        self.cache_misses += entry.get('cache_misses', 0)
+        if entry.get('status', 0) >= 500:
+            self.server_errors += 1
+
+
+class LogAnalysis:
+    """Streaming accumulator for parsed log records."""
+
+    def __init__(self, page_endpoints=DEFAULT_PAGE_ENDPOINTS):
+        self.page_endpoints = set(page_endpoints)
+        self.level_counts: Counter = Counter()
+        self.module_counts: Counter = Counter()
+        self.errors: deque = deque(maxlen=10)
+        self.warnings: deque = deque(maxlen=10)
+        self.endpoints: Dict[str, EndpointStats] = {}
+        self.lines = 0
+        self.first_ts: Optional[float] = None
+        self.last_ts: Optional[float] = None
+
+    def add(self, entry: Dict[str, Any]):
+        self.lines += 1
+        level = entry.get('level', 'UNKNOWN')
+        self.level_counts[level] += 1
+        self.module_counts[entry['module']] += 1
+
+        ts = entry.get('ts')
+        if ts is not None:
+            if self.first_ts is None:
+                self.first_ts = ts
+            self.last_ts = ts
+
+        if level == 'ERROR':
+            self.errors.append(entry)
+        elif level == 'WARNING':
+            self.warnings.append(entry)
+
+        # Per-request summary records (JSON format only)
+        if 'duration_ms' in entry and entry.get('endpoint'):
+            stats = self.endpoints.get(entry['endpoint'])
+            if stats is None:
+                stats = self.endpoints[entry['endpoint']] = EndpointStats()
+            stats.add(entry)
+
+    @property
+    def page_views(self) -> int:
+        return sum(self.endpoints[name].latency.count for name in self.page_endpoints if name in self.endpoints)
+
+    @property
+    def riot_calls(self) -> int:
+        return sum(stats.riot_calls for stats in self.endpoints.values())
+
+
+def log_files(log_file: Path) -> List[Path]:
+    """A log file and its rotations, oldest first."""
+    rotated = []
+    for path in log_file.parent.glob(f"{log_file.name}.*"):
+        suffix = path.name[len(log_file.name) + 1:]
+        if suffix.isdigit():
+            rotated.append((int(suffix), path))
+
+    files = [path for _, path in sorted(rotated, reverse=True)]
+    if log_file.exists():
+        files.append(log_file)
+    return files
+
+
+def _line_ts(f: BinaryIO) -> Optional[float]:
+    """Timestamp of the next parseable line from the current position."""
+    for _ in range(100):
+        raw = f.readline()
+        if not raw:
+            return None
+        entry = parse_log_line(raw.decode('utf-8', errors='replace').strip())
+        if entry and entry.get('ts') is not None:
+            return entry['ts']
     return None
 
 
-def analyze_logs(log_file, hours=24):
-    """Analyze log file."""
-    if not log_file.exists():
-        print(f"Log file not found: {log_file}")
-        return
+def seek_to_time(f: BinaryIO, since: float) -> int:
+    """
+    Position f at (or shortly before) the first line logged at or after since.
+
+    Binary search over byte offsets; only O(log size) lines are read.
+    """
+    f.seek(0, os.SEEK_END)
+    low, high = 0, f.tell()
+
+    while high - low > 64 * 1024:
+        mid = (low + high) // 2
+        f.seek(mid)
+        f.readline()  # Skip the partial line
+        ts = _line_ts(f)
+        if ts is None or ts >= since:
+            high = mid
+        else:
+            low = mid
+
+    f.seek(low)
+    if low:
+        f.readline()
+    return f.tell()
+
+
+def iter_records(path: Path, since: Optional[float] = None, until: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+    """Stream parsed records of one file within [since, until)."""
+    with open(path, 'rb') as f:
+        if since is not None:
+            seek_to_time(f, since)
+
+        for raw in f:
+            entry = parse_log_line(raw.decode('utf-8', errors='replace').strip())
+            if entry is None:
+                continue
 
-    cutoff_time = datetime.now() - timedelta(hours=hours)
+            ts = entry.get('ts')
+            if ts is not None:
+                if since is not None and ts < since:
+                    continue
+                if until is not None and ts >= until:
+                    return
 
-    # Counters
-    level_counts = Counter()
-    module_counts = Counter()
-    recent_errors = []
-    recent_warnings = []
+            yield entry
 
-    # Read and parse logs
-    with open(log_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            parsed = parse_log_line(line.strip())
 
-            if not parsed:
-                continue
+def analyze_logs(log_file: Path, since: Optional[float] = None, until: Optional[float] = None,
+                 page_endpoints=DEFAULT_PAGE_ENDPOINTS) -> Optional[LogAnalysis]:
+    """Analyze a log file and its rotations."""
+    files = log_files(log_file)
+    if not files:
+        print(f"Log file not found: {log_file}")
+        return None
 
-            # Skip old logs
-            if parsed['timestamp'] and parsed['timestamp'] < cutoff_time:
-                continue
+    analysis = LogAnalysis(page_endpoints)
 
-            # Count by level
-            level_counts[parsed['level']] += 1
+    for path in files:
+        # Rotations are written in order - skip files that end before the range
+        if since is not None and path.stat().st_mtime < since:
+            continue
 
-            # Count by module
-            module_counts[parsed['module']] += 1
+        for entry in iter_records(path, since, until):
+            analysis.add(entry)
 
-            # Collect errors and warnings
-            if parsed['level'] == 'ERROR':
-                recent_errors.append(parsed)
-            elif parsed['level'] == 'WARNING':
-                recent_warnings.append(parsed)
+    return analysis
 
-    return {
-        'level_counts': level_counts,
-        'module_counts': module_counts,
-        'errors': recent_errors[-10:],  # Last 10 errors
-        'warnings': recent_warnings[-10:],  # Last 10 warnings
-    }
 
+def follow(log_file: Path, analysis: LogAnalysis, interval: float):
+    """Tail the log (surviving rotation) and print a report every interval seconds."""
+    f = open(log_file, 'rb')
+    f.seek(0, os.SEEK_END)
+    inode = os.fstat(f.fileno()).st_ino
+    next_report = time.time() + interval
 
-def main():
-    """Main function."""
-    log_dir = project_root / 'logs'
-    log_file = log_dir / 'app.log'
+    try:
+        while True:
+            raw = f.readline()
+            if raw:
+                entry = parse_log_line(raw.decode('utf-8', errors='replace').strip())
+                if entry is not None:
+                    analysis.add(entry)
+                continue
 
-    print("=" * 60)
-    print("Clash Finder - Log Analyzer")
-    print("=" * 60)
-    print()
+            if time.time() >= next_report:
+                print_report(analysis)
+                next_report = time.time() + interval
 
-    # Get time range
-    hours = 24
-    if len(sys.argv) > 1:
-        try:
-            hours = int(sys.argv[1])
-        except ValueError:
-            print(f"Invalid hours: {sys.argv[1]}, using default (24)")
+            try:
+                if os.stat(log_file).st_ino != inode:
+                    f.close()
+                    f = open(log_file, 'rb')
+                    inode = os.fstat(f.fileno()).st_ino
+                    continue
+            except FileNotFoundError:
+                pass
 
-    print(f"Analyzing logs from last {hours} hours...")
-    print()
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        f.close()
 
-    # Analyze
-    results = analyze_logs(log_file, hours)
 
-    if not results:
-        return 1
+def _format_ts(ts: Optional[float]) -> str:
+    return datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S') if ts else 'N/A'
+
+
+def print_report(results: LogAnalysis):
+    """Print an analysis summary."""
+    print(f"Lines: {results.lines} | From: {_format_ts(results.first_ts)} | To: {_format_ts(results.last_ts)}")
+    print()
 
     # Display summary
     print("Log Level Summary:")
     print("-" * 60)
-    for level, count in results['level_counts'].most_common():
+    for level, count in results.level_counts.most_common():
         print(f"  {level:12s}: {count:5d}")
 
     print()
     print("Most Active Modules:")
     print("-" * 60)
-    for module, count in results['module_counts'].most_common(10):
+    for module, count in results.module_counts.most_common(10):
         print(f"  {module:30s}: {count:5d}")
 
+    if results.endpoints:
+        print()
+        print("Request Latency (ms):")
+        print("-" * 60)
+        print(f"  {'endpoint':30s} {'count':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'riot/req':>9} {'5xx':>5}")
+        ranked = sorted(results.endpoints.items(), key=lambda item: -item[1].latency.count)
+        for name, stats in ranked:
+            count = stats.latency.count
+            print(
+                f"  {name[:30]:30s} {count:>7} {stats.latency.percentile(50):>8.1f} "
+                f"{stats.latency.percentile(95):>8.1f} {stats.latency.percentile(99):>8.1f} "
+                f"{stats.riot_calls / count:>9.2f} {stats.server_errors:>5}"
+            )
+
+        page_views = results.page_views
+        print()
+        if page_views:
+            print(f"  Riot calls per page view: {results.riot_calls / page_views:.2f} "
+                  f"({results.riot_calls} calls / {page_views} page views)")
+        else:
+            print(f"  Riot calls: {results.riot_calls} (no page views in range)")
+
     # Display errors
-    if results['errors']:
+    if results.errors:
         print()
         print("Recent Errors:")
         print("-" * 60)
-        for error in results['errors']:
-            timestamp = error['timestamp'].strftime('%Y-%m-%d %H:%M:%S') if error['timestamp'] else 'N/A'
-            print(f"  [{timestamp}] {error['module']}")
+        for error in results.errors:
+            print(f"  [{_format_ts(error.get('ts'))}] {error['module']}")
             print(f"    {error['message'][:100]}")
             print()
 
     # Display warnings
-    if results['warnings']:
+    if results.warnings:
         print()
         print("Recent Warnings:")
         print("-" * 60)
-        for warning in results['warnings']:
-            timestamp = warning['timestamp'].strftime('%Y-%m-%d %H:%M:%S') if warning['timestamp'] else 'N/A'
-            print(f"  [{timestamp}] {warning['module']}")
+        for warning in results.warnings:
+            print(f"  [{_format_ts(warning.get('ts'))}] {warning['module']}")
             print(f"    {warning['message'][:100]}")
             print()
 
     print("=" * 60)
 
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Analyze Clash Finder logs')
+    parser.add_argument('hours', nargs='?', type=float, default=24, help='analyze the last N hours (default: 24)')
+    parser.add_argument('--file', type=Path, default=project_root / 'logs' / 'app.log', help='log file')
+    parser.add_argument('--since', help='start time (ISO timestamp or hours ago); overrides hours')
+    parser.add_argument('--until', help='end time (ISO timestamp or hours ago)')
+    parser.add_argument('--follow', action='store_true', help='keep reading new lines')
+    parser.add_argument('--interval', type=float, default=30, help='seconds between reports with --follow')
+    parser.add_argument('--page-endpoints', default=','.join(DEFAULT_PAGE_ENDPOINTS),
+                        help='comma separated endpoints counted as page views')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Clash Finder - Log Analyzer")
+    print("=" * 60)
+    print()
+
+    since = parse_time(args.since) if args.since else time.time() - args.hours * 3600
+    until = parse_time(args.until) if args.until else None
+    page_endpoints = [name for name in args.page_endpoints.split(',') if name]
+
+    print(f"Analyzing logs since {_format_ts(since)}" + (f" until {_format_ts(until)}" if until else "") + "...")
+    print()
+
+    # Analyze
+    results = analyze_logs(args.file, since, until, page_endpoints)
+
+    if not results:
+        return 1
+
+    print_report(results)
+
+    if args.follow:
+        print(f"Following {args.file} (Ctrl+C to stop)...")
+        follow(args.file, results, args.interval)
+
     return 0
 
 
 if __name__ == '__main__':
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
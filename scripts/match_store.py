@@ -0,0 +1,72 @@
+"""
+Script to report on and compact the persistent match store.
+
+Usage:
+    python scripts/match_store.py            # report
+    python scripts/match_store.py compact    # evict to budget, checkpoint WAL, VACUUM
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config import get_config
+from app.services.match_store import MatchStore
+
+
+def format_bytes(value: int) -> str:
+    """Format byte count as MB."""
+    return f"{value / 1024 / 1024:.1f}MB"
+
+
+def main():
+    """Main function."""
+    action = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+    if action not in ('stats', 'compact'):
+        print(f"Unknown action: {action} (expected 'stats' or 'compact')")
+        return 1
+
+    config = get_config()
+    store_path = Path(config.MATCH_STORE_PATH)
+
+    print("=" * 60)
+    print("Clash Finder - Match Store")
+    print("=" * 60)
+    print()
+
+    if not store_path.exists():
+        print(f"Match store not found: {store_path}")
+        return 1
+
+    store = MatchStore(str(store_path), config.MATCH_STORE_MAX_BYTES)
+
+    if action == 'compact':
+        print("Compacting...")
+        result = store.compact()
+        print(f"✓ {format_bytes(result['before'])} -> {format_bytes(result['after'])}")
+        print()
+
+    stats = store.get_stats()
+
+    print(f"  Path:          {stats['path']}")
+    print(f"  Matches:       {stats['matches']}")
+    print(f"  Players:       {stats['players']}")
+    print(f"  Payload size:  {format_bytes(stats['payload_bytes'])}")
+    print(f"  File size:     {format_bytes(stats['file_bytes'])}")
+    print(f"  Budget:        {format_bytes(stats['max_bytes'])}")
+
+    if stats['matches']:
+        print(f"  Avg per match: {stats['payload_bytes'] / stats['matches'] / 1024:.1f}KB")
+
+    print()
+    print("=" * 60)
+
+    store.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -11,6 +11,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from app.services.resource_downloader import resource_downloader
+from app.services.resource_manager import resource_manager
 from config.logging_config import get_logger
 
 logger = get_logger('scripts.update_resources')
@@ -80,6 +81,23 @@ def main():
         status = "✓" if valid else "✗"
         print(f"  {status} {filename}")
 
+    # Compile game data for the workers to map
+    if all_valid:
+        compiled = resource_manager.compile_game_data(resource_downloader.version)
+        print(f"\n✓ Compiled game data: {compiled}")
+
+    # Mirror icons and sprite sheets
+    print("\n" + "-" * 60)
+    print("Mirroring icons and sprite sheets...")
+    print("-" * 60)
+
+    assets = resource_downloader.download_assets()
+
+    print(f"\n  Downloaded: {assets['downloaded']} ({assets['bytes'] / 1024:.1f} KB)")
+    print(f"  Already present: {assets['present']}")
+    print(f"  Failed: {assets['failed']} (served from the CDN)")
+    print(f"  Time: {assets['seconds']:.2f}s")
+
     # Summary
     print("\n" + "=" * 60)
     if all(results.values()) and all_valid:
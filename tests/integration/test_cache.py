@@ -194,6 +194,38 @@ class TestCacheBackend:
         assert isinstance(cache.backend, InMemoryCache)
 
 
+class TestInMemoryCacheEviction:
+    """Test LRU eviction and proactive expiry."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that reading a key protects it from eviction."""
+        from app.services.cache import InMemoryCache
+
+        backend = InMemoryCache(max_size=2, default_ttl=60)
+        backend.set('a', 1)
+        backend.set('b', 2)
+        backend.get('a')
+        backend.set('c', 3)
+
+        assert backend.get('a') == 1
+        assert backend.get('b') is None
+        assert backend.get_stats()['evictions'] == 1
+
+    def test_expired_entries_purged_on_write(self):
+        """Test that expired entries are removed without being read."""
+        from app.services.cache import InMemoryCache
+
+        backend = InMemoryCache(max_size=10, default_ttl=60)
+        backend.set('short', 'value', ttl=0)
+        time.sleep(0.01)
+        backend.set('other', 'value')
+
+        stats = backend.get_stats()
+        assert stats['size'] == 1
+        assert stats['expirations'] == 1
+        assert stats['evictions'] == 0
+
+
 class TestCachePerformance:
     """Test cache performance."""
 
@@ -257,4 +289,243 @@ class TestCacheEdgeCases:
         cache.set('false_key', False)
 
         assert cache.get('true_key') is True
-        assert cache.get('false_key') is False
\ No newline at end of file
+        assert cache.get('false_key') is False
+
+
+class TestRedisCache:
+    """Test Redis cache backend (against fakeredis)."""
+
+    @pytest.fixture
+    def redis_cache(self):
+        fakeredis = pytest.importorskip('fakeredis')
+        from app.services.cache import RedisCache
+
+        return RedisCache(fakeredis.FakeRedis(), default_ttl=60, compress_threshold=64)
+
+    def test_set_get_roundtrip(self, redis_cache):
+        """Test values survive serialization, including compressed ones."""
+        small = {'tuple': (1, 2, 3)}
+        large = {'data': 'x' * 10000}
+
+        redis_cache.set('small', small)
+        redis_cache.set('large', large)
+
+        assert redis_cache.get('small') == small
+        assert redis_cache.get('large') == large
+        assert redis_cache.get('missing') is None
+
+    def test_get_many_preserves_order(self, redis_cache):
+        """Test pipelined multi-get."""
+        redis_cache.set('a', 1)
+        redis_cache.set('c', 3)
+
+        assert redis_cache.get_many(['a', 'b', 'c']) == [1, None, 3]
+        assert redis_cache.get_stats()['hits'] == 2
+
+    def test_stats_count_each_miss_once(self, redis_cache):
+        """Test a prefetch that leaves misses to get() does not count them twice."""
+        redis_cache._client.set('other:key', 'not ours')
+
+        assert redis_cache.get_many(['a', 'b'], count_misses=False) == [None, None]
+        redis_cache.get('a')
+        redis_cache.get('b')
+
+        stats = redis_cache.get_stats()
+        assert stats['misses'] == 2
+        assert 'size' not in stats
+
+    def test_server_side_ttl(self, redis_cache):
+        """Test TTL is set on the Redis key."""
+        redis_cache.set('ttl_key', 'value', ttl=30)
+
+        assert 0 < redis_cache._client.ttl('clashfinder:ttl_key') <= 30
+
+    def test_delete_exists_clear(self, redis_cache):
+        """Test delete, exists and prefix-scoped clear."""
+        redis_cache.set('k1', 'v1')
+        redis_cache.set('k2', 'v2')
+        redis_cache._client.set('other:key', 'untouched')
+
+        assert redis_cache.exists('k1') is True
+        assert redis_cache.delete('k1') is True
+        assert redis_cache.exists('k1') is False
+
+        redis_cache.clear()
+        assert redis_cache.get('k2') is None
+        assert redis_cache._client.get('other:key') == b'untouched'
+
+    def test_cached_decorator_on_redis(self, redis_cache, app_context):
+        """Test @cached works unchanged on the Redis backend."""
+        previous = cache.backend
+        cache.backend = redis_cache
+        call_count = {'count': 0}
+
+        @cached(ttl=60, key_prefix='test')
+        def double(x):
+            call_count['count'] += 1
+            return x * 2
+
+        try:
+            assert double(4) == 8
+            assert double(4) == 8
+            assert call_count['count'] == 1
+            assert redis_cache.exists(double.make_cache_key(4))
+        finally:
+            cache.backend = previous
+
+
+class TestSingleFlight:
+    """Test request coalescing in @cached."""
+
+    def test_concurrent_misses_call_upstream_once(self, app_context):
+        """Test that concurrent callers share one computation."""
+        import threading
+        from app.services.cache import single_flight_group
+
+        call_count = {'count': 0}
+        started = threading.Event()
+
+        @cached(ttl=60, key_prefix='sf', single_flight=True)
+        def slow_lookup(x):
+            call_count['count'] += 1
+            started.set()
+            time.sleep(0.2)
+            return x * 2
+
+        coalesced_before = single_flight_group.coalesced
+        results = []
+
+        def worker():
+            results.append(slow_lookup(21))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        threads[0].start()
+        started.wait(1)
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [42] * 8
+        assert call_count['count'] == 1
+        assert single_flight_group.coalesced - coalesced_before == 7
+
+    def test_followers_receive_leader_exception(self, app_context):
+        """Test that an upstream failure is shared, not retried by each waiter."""
+        import threading
+        from app.services.cache import SingleFlight
+
+        group = SingleFlight()
+        release = threading.Event()
+        calls = {'count': 0}
+        errors = []
+
+        def failing():
+            calls['count'] += 1
+            release.wait(2)
+            raise ValueError("upstream failed")
+
+        def worker():
+            try:
+                group.do('key', failing)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+
+        # Fail the leader only once every other thread is waiting on it
+        deadline = time.monotonic() + 2
+        while group.coalesced < 4 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert group.coalesced == 4
+        assert calls['count'] == 1
+        assert len(errors) == 5
+        assert all(error is errors[0] for error in errors)
+        assert group.get_stats()['in_flight'] == 0
+
+    def test_waits_for_other_worker_holding_lock(self, app_context):
+        """Test cross-worker coalescing on a distributed backend."""
+        import threading
+        fakeredis = pytest.importorskip('fakeredis')
+        from app.services.cache import RedisCache, single_flight_group
+
+        previous = cache.backend
+        cache.backend = RedisCache(fakeredis.FakeRedis(), default_ttl=60)
+        call_count = {'count': 0}
+
+        @cached(ttl=60, key_prefix='sf', single_flight=True)
+        def lookup(x):
+            call_count['count'] += 1
+            return 'computed here'
+
+        key = lookup.make_cache_key(1)
+        token = cache.acquire_lock(key, 5)
+
+        def other_worker():
+            time.sleep(0.1)
+            cache.set(key, 'computed elsewhere', 60)
+            cache.release_lock(key, token)
+
+        try:
+            remote_before = single_flight_group.coalesced_remote
+            threading.Thread(target=other_worker).start()
+
+            assert lookup(1) == 'computed elsewhere'
+            assert call_count['count'] == 0
+            assert single_flight_group.coalesced_remote - remote_before == 1
+        finally:
+            cache.backend = previous
+
+
+class TestStaleWhileRevalidate:
+    """Test @cached(stale_ttl=...)."""
+
+    def test_serves_stale_and_refreshes_in_background(self, app_context):
+        """Test expired value is returned immediately and refreshed."""
+        from app.services.cache import get_cache_stats
+
+        calls = {'count': 0}
+
+        @cached(ttl=1, key_prefix='swr', stale_ttl=60)
+        def versioned(x):
+            calls['count'] += 1
+            return f"v{calls['count']}"
+
+        assert versioned(1) == 'v1'
+        time.sleep(1.1)
+
+        # Stale: old value now, refresh happens off the request path
+        assert versioned(1) == 'v1'
+
+        deadline = time.time() + 2
+        while calls['count'] < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+
+        assert versioned(1) == 'v2'
+
+        prefix_stats = get_cache_stats()['prefixes']['swr']
+        assert prefix_stats['stale'] >= 1
+        assert prefix_stats['refreshes'] == 1
+        assert prefix_stats['misses'] == 1
+
+    def test_refreshes_capped(self):
+        """Test that refreshes beyond the worker cap are skipped."""
+        import threading
+        from app.services.cache import StaleRefresher
+
+        refresher = StaleRefresher(max_workers=1)
+        release = threading.Event()
+
+        assert refresher.schedule('a', release.wait) is True
+        assert refresher.schedule('a', release.wait) is False
+        assert refresher.schedule('b', release.wait) is False
+        assert refresher.get_stats()['skipped'] == 1
+
+        release.set()
@@ -0,0 +1,126 @@
+# tests/integration/test_match_store.py
+"""
+Integration tests for the persistent match store.
+"""
+
+import sqlite3
+import threading
+
+import pytest
+from unittest.mock import patch
+
+from app.services.match_projection import pack_match, unpack_match
+from app.services.match_store import MatchStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Match store backed by a temporary SQLite file."""
+    match_store = MatchStore(str(tmp_path / 'matches.db'))
+    yield match_store
+    match_store.close()
+
+
+class TestMatchStore:
+    """Test MatchStore operations."""
+
+    def test_put_and_get(self, store, mock_match_data):
+        """Test packed record round-trip."""
+        record = pack_match(mock_match_data)
+        assert store.put('EUW1_1234567890', record) is True
+
+        assert store.get('EUW1_1234567890') == record
+        assert store.get('EUW1_missing') is None
+
+    def test_raw_payload_is_projected(self, store, mock_match_data):
+        """Test raw match-v5 payloads are stored in projected form."""
+        store.put('EUW1_1234567890', mock_match_data)
+
+        assert store.get('EUW1_1234567890') == pack_match(mock_match_data)
+
+    def test_survives_reopen(self, tmp_path, mock_match_data):
+        """Test matches persist across store instances (restarts)."""
+        path = str(tmp_path / 'matches.db')
+        MatchStore(path).put('EUW1_1234567890', mock_match_data)
+
+        assert MatchStore(path).get('EUW1_1234567890') == pack_match(mock_match_data)
+
+    def test_participant_index(self, store, mock_match_data):
+        """Test lookup of stored matches by participant PUUID."""
+        store.put('EUW1_1234567890', mock_match_data)
+
+        assert store.get_match_ids_for_puuid('puuid1') == ['EUW1_1234567890']
+        assert store.get_match_ids_for_puuid('unknown') == []
+
+    def test_size_based_eviction(self, store, mock_match_data):
+        """Test least recently used matches are evicted over budget."""
+        store.put('EUW1_1', mock_match_data)
+        entry_size = store.get_stats()['payload_bytes']
+        store.max_bytes = entry_size * 2
+
+        store.put('EUW1_2', mock_match_data)
+        store.put('EUW1_3', mock_match_data)
+
+        stats = store.get_stats()
+        assert stats['payload_bytes'] <= store.max_bytes
+        assert stats['evictions'] >= 1
+        assert store.get('EUW1_1') is None
+        assert store.get('EUW1_3') is not None
+
+    def test_compact(self, store, mock_match_data):
+        """Test compaction reports file sizes."""
+        store.put('EUW1_1', mock_match_data)
+
+        result = store.compact()
+
+        assert result['after'] > 0
+
+    def test_connections_reused_across_threads(self, store, mock_match_data):
+        """Test short-lived reader threads share pooled connections."""
+        store.put('EUW1_1', mock_match_data)
+
+        with patch('app.services.match_store.sqlite3.connect', wraps=sqlite3.connect) as connect:
+            for _ in range(20):
+                thread = threading.Thread(target=store.get, args=('EUW1_1',))
+                thread.start()
+                thread.join()
+
+        assert connect.call_count == 0
+        assert store._pool.qsize() == 1
+
+    def test_disabled_store(self, mock_match_data):
+        """Test store without a path is a no-op."""
+        disabled = MatchStore()
+
+        assert disabled.put('EUW1_1', mock_match_data) is False
+        assert disabled.get('EUW1_1') is None
+
+
+class TestMatchDetailsReadThrough:
+    """Test get_match_details reads through the store."""
+
+    @patch('app.services.riot_api.make_api_request')
+    def test_store_hit_skips_riot(self, mock_request, store, mock_match_data, app_context):
+        """Test stored matches are served without an API call."""
+        from app.services.riot_api import get_match_details
+
+        store.put('EUW1_1234567890', mock_match_data)
+
+        with patch('app.services.riot_api.match_store', store):
+            result = get_match_details('EUW1_1234567890', 'EUW')
+
+        assert result == unpack_match(pack_match(mock_match_data))
+        mock_request.assert_not_called()
+
+    @patch('app.services.riot_api.get_api_key', return_value='test-key')
+    @patch('app.services.riot_api.make_api_request')
+    def test_fetched_match_is_stored(self, mock_request, mock_key, store, mock_match_data, app_context):
+        """Test matches fetched from Riot are written to the store."""
+        from app.services.riot_api import get_match_details
+
+        mock_request.return_value = mock_match_data
+
+        with patch('app.services.riot_api.match_store', store):
+            get_match_details('EUW1_1234567890', 'EUW')
+
+        assert store.get('EUW1_1234567890') == pack_match(mock_match_data)
@@ -0,0 +1,120 @@
+# tests/integration/test_rate_limiter_redis.py
+"""
+Integration tests for the Redis rate limiter backend.
+
+Runs against a throwaway redis-server started on a free port; skipped
+when redis-server is not installed.
+"""
+
+import shutil
+import socket
+import subprocess
+import time
+
+import pytest
+
+redis = pytest.importorskip('redis')
+
+from app.services.rate_limiter import RedisRateLimiter
+
+KEY = '127.0.0.1:player.player_stats'
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(scope='module')
+def redis_url():
+    """Start a local redis-server for the module."""
+    server = shutil.which('redis-server')
+    if server is None:
+        pytest.skip('redis-server not installed')
+
+    port = _free_port()
+    process = subprocess.Popen(
+        [server, '--port', str(port), '--save', '', '--appendonly', 'no'],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    url = f'redis://127.0.0.1:{port}/0'
+
+    client = redis.Redis.from_url(url)
+    for _ in range(50):
+        try:
+            client.ping()
+            break
+        except redis.ConnectionError:
+            time.sleep(0.1)
+
+    yield url
+
+    process.terminate()
+    process.wait(timeout=5)
+
+
+@pytest.fixture
+def limiter(redis_url):
+    limiter = RedisRateLimiter.from_url(redis_url, key_prefix='test:ratelimit:')
+    limiter.clear()
+    return limiter
+
+
+class TestRedisRateLimiter:
+    """Test shared GCRA accounting in Redis."""
+
+    def test_burst_then_deny(self, limiter):
+        """Test a full burst is allowed and the next request is denied."""
+        results = [limiter.check_rate_limit(KEY, 3, 60)[0] for _ in range(4)]
+        assert results == [True, True, True, False]
+
+        allowed, info = limiter.check_rate_limit(KEY, 3, 60)
+        assert allowed is False
+        assert 19 <= info['retry_after'] <= 20
+
+    def test_shared_between_workers(self, limiter, redis_url):
+        """Test two workers draw from the same budget."""
+        other = RedisRateLimiter.from_url(redis_url, key_prefix='test:ratelimit:')
+
+        assert limiter.check_rate_limit(KEY, 2, 60)[0] is True
+        assert other.check_rate_limit(KEY, 2, 60)[0] is True
+        assert limiter.check_rate_limit(KEY, 2, 60)[0] is False
+
+    def test_minute_and_hour_together(self, limiter):
+        """Test windows are checked atomically and only counted when allowed."""
+        limits = ((2, 60), (5, 3600))
+
+        allowed, info = limiter.check_limits(KEY, limits)
+        assert allowed is True
+        assert info['windows'] == {60: 1, 3600: 4}
+
+        limiter.check_limits(KEY, limits)
+        allowed, info = limiter.check_limits(KEY, limits)
+        assert allowed is False
+        assert info['window'] == 60
+
+        status = limiter.get_status(KEY)
+        assert status['windows'][3600]['remaining'] == 3
+
+    def test_key_expires(self, limiter):
+        """Test keys carry a TTL so idle clients do not accumulate."""
+        limiter.check_limits(KEY, ((10, 60), (100, 3600)))
+
+        ttl = limiter._client.pttl(f'test:ratelimit:{KEY}')
+        assert 0 < ttl <= 36 * 1000 + 1000
+
+
+class TestRedisFallback:
+    """Test in-memory fallback while Redis is unreachable."""
+
+    def test_unreachable_redis_falls_back(self):
+        """Test checks keep limiting in-memory when Redis is down."""
+        client = redis.Redis(host='127.0.0.1', port=_free_port(), socket_connect_timeout=0.2)
+        limiter = RedisRateLimiter(client, retry_interval=60)
+
+        results = [limiter.check_rate_limit(KEY, 2, 60)[0] for _ in range(3)]
+
+        assert results == [True, True, False]
+        assert limiter._errors == 1
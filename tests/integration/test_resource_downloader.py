@@ -0,0 +1,209 @@
+# tests/integration/test_resource_downloader.py
+"""
+Integration tests for Data Dragon downloads against a local HTTP stub.
+"""
+
+import hashlib
+import json
+import struct
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.services.resource_downloader import (
+    DOWNLOADED,
+    FAILED,
+    NOT_MODIFIED,
+    RESOURCE_FILES,
+    SKIPPED,
+    ResourceDownloader
+)
+from app.services.asset_mirror import AssetMirror
+
+
+def fake_png(width: int, height: int) -> bytes:
+    return b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR' + struct.pack('>II', width, height) + b'\x08\x06\x00\x00\x00'
+
+
+class DataDragonStub:
+    """Serves every version's files from one set of documents, with ETags."""
+
+    def __init__(self):
+        self.documents = {
+            remote: json.dumps({'type': remote, 'data': {str(i): {'key': str(i)} for i in range(200)}}).encode()
+            for remote, _ in RESOURCE_FILES.values()
+        }
+        self.requests = 0
+        self.body_bytes = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    @property
+    def base_url(self) -> str:
+        return f'http://127.0.0.1:{self._server.server_address[1]}/cdn'
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                body = stub.documents.get(self.path.rsplit('/', 1)[-1])
+                if body is None:
+                    status, body, etag = 404, b'{}', None
+                else:
+                    etag = f'"{hashlib.md5(body).hexdigest()}"'
+                    status = 304 if self.headers.get('If-None-Match') == etag else 200
+                    if status == 304:
+                        body = b''
+
+                with stub._lock:
+                    stub.requests += 1
+                    stub.body_bytes += len(body)
+
+                self.send_response(status)
+                if etag:
+                    self.send_header('ETag', etag)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def stub():
+    server = DataDragonStub()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def downloader(stub, tmp_path):
+    downloader = ResourceDownloader(str(tmp_path), base_url=stub.base_url, assets_dir=str(tmp_path / 'ddragon'))
+    downloader.version = '15.1.1'
+    return downloader
+
+
+class TestConditionalDownloads:
+    """Test unchanged files are not transferred again."""
+
+    def test_first_download(self, downloader, stub, tmp_path):
+        """Test every file is fetched and written as received."""
+        results = downloader.download_resources()
+
+        assert {r['status'] for r in results.values()} == {DOWNLOADED}
+        assert stub.requests == len(RESOURCE_FILES)
+        assert (tmp_path / 'items.json').read_bytes() == stub.documents['item.json']
+        assert not list(tmp_path.glob('*.tmp'))
+
+    def test_noop_update_transfers_nothing(self, downloader, stub):
+        """Test a second run for the same version makes no requests."""
+        downloader.download_resources()
+        requests_before, bytes_before = stub.requests, stub.body_bytes
+
+        results = downloader.download_resources()
+
+        assert {r['status'] for r in results.values()} == {SKIPPED}
+        assert stub.requests == requests_before
+        assert stub.body_bytes == bytes_before
+
+    def test_new_version_with_unchanged_files(self, downloader, stub):
+        """Test a new version is revalidated with ETags and unchanged bodies are not resent."""
+        downloader.download_resources()
+        bytes_before = stub.body_bytes
+
+        assert downloader.update_version('15.2.1')
+
+        assert {r['status'] for r in downloader.last_results.values()} == {NOT_MODIFIED}
+        assert stub.body_bytes == bytes_before
+
+    def test_failed_download_keeps_old_file(self, downloader, stub, tmp_path):
+        """Test a bad response never replaces the file on disk."""
+        downloader.download_resources()
+        good = (tmp_path / 'runes.json').read_bytes()
+        stub.documents['runesReforged.json'] = b'<html>error</html>'
+
+        results = downloader.download_resources(['runes'], force=True)
+
+        assert results['runes']['status'] == FAILED
+        assert (tmp_path / 'runes.json').read_bytes() == good
+
+
+class TestIconMirror:
+    """Test icons and sprite sheets are mirrored and indexed."""
+
+    @pytest.fixture
+    def data_files(self, tmp_path, stub):
+        sprite = {'sprite': 'champion0.png', 'group': 'champion', 'w': 48, 'h': 48, 'y': 0}
+        (tmp_path / 'champions.json').write_text(json.dumps({'data': {
+            'Aatrox': {'key': '266', 'image': {'full': 'Aatrox.png', 'x': 0, **sprite}},
+            'Ahri': {'key': '103', 'image': {'full': 'Ahri.png', 'x': 48, **sprite}}
+        }}))
+        (tmp_path / 'runes.json').write_text(json.dumps([
+            {'id': 8000, 'icon': 'perk-images/Styles/7201_Precision.png', 'slots': []}
+        ]))
+        stub.documents.update({
+            'Aatrox.png': fake_png(120, 120),
+            'Ahri.png': fake_png(120, 120),
+            'champion0.png': fake_png(480, 144),
+            '7201_Precision.png': fake_png(64, 64)
+        })
+
+    def test_mirror_and_index(self, downloader, stub, tmp_path, data_files):
+        """Test icons, sheets and the coordinate index are written, then reused."""
+        summary = downloader.download_assets(['champion', 'rune'])
+
+        assert summary['downloaded'] == 4
+        assert summary['failed'] == 0
+        version_dir = tmp_path / 'ddragon' / '15.1.1'
+        assert (version_dir / 'rune' / 'perk-images' / 'Styles' / '7201_Precision.png').exists()
+        assert '.dd-sprite-champion0' in (version_dir / 'sprites.css').read_text()
+
+        index = json.loads((version_dir / 'index.json').read_text())
+        assert index['sheets'] == {'champion0.png': [480, 144]}
+        assert index['sprites']['champion']['Ahri.png'] == ['champion0.png', 48, 0, 48, 48]
+
+        requests_before = stub.requests
+        assert downloader.download_assets(['champion', 'rune'])['present'] == 4
+        assert stub.requests == requests_before
+
+    def test_update_version_mirrors_icons(self, downloader, stub, tmp_path, data_files):
+        """Test a version update also refreshes the icon mirror and its index."""
+        stub.documents['champion.json'] = (tmp_path / 'champions.json').read_bytes()
+        stub.documents['runesReforged.json'] = (tmp_path / 'runes.json').read_bytes()
+
+        assert downloader.update_version('15.2.1')
+
+        version_dir = tmp_path / 'ddragon' / '15.2.1'
+        assert (version_dir / 'champion' / 'Ahri.png').exists()
+        assert (version_dir / 'sprites.css').exists()
+        index = json.loads((version_dir / 'index.json').read_text())
+        assert index['version'] == '15.2.1'
+        assert index['files']['champion'] == ['Aatrox.png', 'Ahri.png']
+
+    def test_rendered_from_mirror(self, downloader, tmp_path, data_files):
+        """Test the mirror serves small icons from the sheet and large ones as files."""
+        downloader.download_assets(['champion'])
+        mirror = AssetMirror(str(tmp_path / 'ddragon'), '/static/img/ddragon')
+
+        small = mirror.icon('champion', 'Ahri.png', 24, alt='Ahri', version='15.1.1')
+        assert 'dd-sprite-champion0' in small
+        assert 'background-position:-24px 0px' in small
+        assert 'background-size:240px 72px' in small
+
+        large = mirror.icon('champion', 'Ahri.png', 80, version='15.1.1')
+        assert 'src="/static/img/ddragon/15.1.1/champion/Ahri.png"' in large
+
+        assert mirror.icon_url('item', '1001.png', '15.1.1').startswith('https://ddragon.leagueoflegends.com/cdn/15.1.1/img/item/')
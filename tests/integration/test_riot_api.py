@@ -248,4 +248,94 @@ class TestRealAPICall:
         result = get_account_info('Faker', 'KR1', 'KR')
 
         if result:
-            assert 'puuid' in result
\ No newline at end of file
+            assert 'puuid' in result
+
+
+class TestConcurrentMatchFetch:
+    """Test concurrent match detail fan-out."""
+
+    @patch('app.services.riot_api.get_match_details')
+    def test_results_keep_match_id_order(self, mock_details, app_context):
+        """Test that results are aligned with the requested match IDs."""
+        import time
+        from app.services.riot_api import fetch_match_details_concurrently
+
+        def slow_details(match_id, server):
+            # Earlier IDs finish last
+            time.sleep(0.01 * (5 - int(match_id[-1])))
+            return None if match_id.endswith('3') else {'id': match_id}
+
+        mock_details.side_effect = slow_details
+        match_ids = [f'EUW1_{i}' for i in range(5)]
+
+        results = fetch_match_details_concurrently(match_ids, 'EUW', max_concurrency=5)
+
+        assert [r['id'] if r else None for r in results] == [
+            'EUW1_0', 'EUW1_1', 'EUW1_2', None, 'EUW1_4'
+        ]
+        assert mock_details.call_count == 5
+
+    @patch('app.services.riot_api.get_match_details')
+    def test_process_cap_not_resized_per_call(self, mock_details, app, app_context):
+        """Test a call's max_concurrency never changes the process-wide cap."""
+        import threading
+        import time
+        from app.services import riot_api
+        from app.services.riot_api import fetch_match_details_concurrently, init_fetch_slots
+
+        lock = threading.Lock()
+        running = {'now': 0, 'peak': 0}
+
+        def tracked_details(match_id, server):
+            with lock:
+                running['now'] += 1
+                running['peak'] = max(running['peak'], running['now'])
+            time.sleep(0.05)
+            with lock:
+                running['now'] -= 1
+            return {'id': match_id}
+
+        mock_details.side_effect = tracked_details
+        match_ids = [f'EUW1_{i}' for i in range(6)]
+
+        try:
+            # A small first call does not size the cap for everyone after it
+            riot_api._fetch_slots = None
+            fetch_match_details_concurrently(match_ids[:2], 'EUW', max_concurrency=2)
+            fetch_match_details_concurrently(match_ids, 'EUW', max_concurrency=6)
+            assert running['peak'] == 6
+
+            # Nor does a large call lift the configured cap
+            running['peak'] = 0
+            init_fetch_slots(2)
+            fetch_match_details_concurrently(match_ids, 'EUW', max_concurrency=6)
+            assert running['peak'] == 2
+        finally:
+            init_fetch_slots(app.config['RIOT_API_MAX_CONCURRENCY'])
+
+    def test_cache_lookups_counted_once(self, app, app_context, mock_match_data):
+        """Test batched hits reach the prefix stats and each miss is counted once."""
+        from app.services.cache import cache, get_cache_stats
+        from app.services.match_projection import pack_match
+        from app.services.riot_api import fetch_match_details_concurrently, get_match_record
+
+        cache.clear()
+        cache.set(get_match_record.make_cache_key('EUW1_0', 'EUW'), pack_match(mock_match_data))
+        before = get_cache_stats()['prefixes'].get('match', {})
+
+        with patch.dict(app.config, {'RIOT_API_KEY': 'test-key'}), \
+                patch('app.services.riot_api.make_api_request', return_value=None):
+            results = fetch_match_details_concurrently(['EUW1_0', 'EUW1_1', 'EUW1_2', 'EUW1_3'], 'EUW',
+                                                       max_concurrency=1)
+
+        assert results[0] is not None
+        stats = get_cache_stats()
+        assert stats['misses'] == 3
+        assert stats['prefixes']['match']['hits'] - before.get('hits', 0) == 1
+        assert stats['prefixes']['match']['misses'] - before.get('misses', 0) == 3
+
+    def test_empty_match_list(self, app_context):
+        """Test that no work is scheduled for an empty page."""
+        from app.services.riot_api import fetch_match_details_concurrently
+
+        assert fetch_match_details_concurrently([], 'EUW') == []
@@ -0,0 +1,75 @@
+# tests/integration/test_session_pool.py
+"""
+Integration tests for pooled Riot sessions against a local HTTP server.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.services.api.session_pool import SessionPool
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b'{}'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+class TestSessionPool:
+    """Test session and connection reuse statistics."""
+
+    def test_connection_reused(self, server_url):
+        """Test sequential calls share one session and one connection."""
+        pool = SessionPool()
+
+        for _ in range(3):
+            assert pool.get(f'{server_url}/lol/status').status_code == 200
+
+        stats = pool.get_stats()
+        assert stats['session_misses'] == 1
+        assert stats['session_hits'] == 2
+        assert stats['requests'] == 3
+        assert stats['connection_misses'] == 1
+        assert stats['connection_hits'] == 2
+
+        pool.close_all()
+
+    def test_session_counters_under_contention(self, server_url):
+        """Test no session lookup is lost when threads race on the counters."""
+        pool = SessionPool()
+        host = server_url.split('//', 1)[1]
+
+        def lookups():
+            for _ in range(2000):
+                pool.get_session(host)
+
+        threads = [threading.Thread(target=lookups) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = pool.get_stats()
+        assert stats['session_hits'] + stats['session_misses'] == 8000
+
+        pool.close_all()
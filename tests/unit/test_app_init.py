@@ -32,9 +32,13 @@ class TestAppCreation:
 
     def test_create_app_production(self):
         """Test creating app with production config."""
+        from app.services.match_store import match_store
+
         app = create_app('production')
 
         assert app.config['DEBUG'] is False
+        # The on-disk match store is opt-in, so creating an app writes nothing
+        assert match_store.enabled is False
 
 
 class TestAppConfig:
@@ -0,0 +1,88 @@
+# tests/unit/test_check_logs.py
+"""
+Unit tests for the streaming log analyzer.
+"""
+
+import json
+
+from scripts.check_logs import LatencyHistogram, analyze_logs, parse_log_line, seek_to_time
+
+START = 1_760_000_000.0
+
+
+def write_log(path, count, start=START, step=1.0):
+    """Write JSON request summaries, one per step seconds."""
+    with open(path, 'w') as f:
+        for i in range(count):
+            f.write(json.dumps({
+                'ts': start + i * step,
+                'level': 'INFO',
+                'logger': 'requests',
+                'msg': 'Request complete',
+                'endpoint': 'player.player_stats' if i % 2 == 0 else 'player.stream',
+                'duration_ms': float(i % 100 + 1),
+                'riot_calls': 3,
+                'cache_hits': 1,
+                'status': 200
+            }) + '\n')
+
+
+class TestParse:
+    """Test line parsing."""
+
+    def test_text_line(self):
+        """Test the classic text format still parses."""
+        entry = parse_log_line('[2026-01-31 18:00:00] WARNING [services.cache:12] Redis get failed')
+
+        assert entry['level'] == 'WARNING'
+        assert entry['module'] == 'services.cache'
+        assert entry['message'] == 'Redis get failed'
+        assert entry['ts'] is not None
+
+    def test_json_line(self):
+        """Test JSON records keep their structured fields."""
+        entry = parse_log_line('{"ts": 1.5, "level": "INFO", "logger": "requests", "msg": "x", "duration_ms": 12}')
+
+        assert entry['module'] == 'requests'
+        assert entry['duration_ms'] == 12
+
+
+class TestLatencyHistogram:
+    """Test percentile estimates."""
+
+    def test_percentiles_within_resolution(self):
+        """Test percentiles are within bucket resolution of the exact values."""
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.add(ms)
+
+        assert abs(histogram.percentile(50) - 500) / 500 < 0.03
+        assert abs(histogram.percentile(99) - 990) / 990 < 0.03
+
+
+class TestAnalyze:
+    """Test streaming analysis of files."""
+
+    def test_seek_by_timestamp(self, tmp_path):
+        """Test seeking lands just before the requested time."""
+        log_file = tmp_path / 'app.log'
+        write_log(log_file, 20000)
+
+        with open(log_file, 'rb') as f:
+            seek_to_time(f, START + 15000)
+            first = json.loads(f.readline())
+
+        assert START + 14000 < first['ts'] <= START + 15000
+
+    def test_range_and_rotations(self, tmp_path):
+        """Test rotated files are read oldest first and filtered by time."""
+        write_log(tmp_path / 'app.log.1', 100, start=START)
+        write_log(tmp_path / 'app.log', 100, start=START + 100)
+
+        results = analyze_logs(tmp_path / 'app.log', since=START + 50, until=START + 150)
+
+        assert results.lines == 100
+        assert results.first_ts == START + 50
+        assert results.endpoints['player.player_stats'].latency.count == 50
+        assert results.page_views == 50
+        assert results.riot_calls == 300
@@ -0,0 +1,92 @@
+# tests/unit/test_logging_config.py
+"""
+Unit tests for the queued logging pipeline.
+"""
+
+import logging
+import queue
+import threading
+
+import pytest
+
+from config.logging_config import DroppingQueueHandler, setup_logging
+
+
+def make_record(level: int, message: str) -> logging.LogRecord:
+    return logging.LogRecord('test', level, __file__, 1, message, None, None)
+
+
+class TestDroppingQueueHandler:
+    """Test bounded queue drop policy."""
+
+    def test_drops_when_full_and_reports(self):
+        """Test records are dropped on a full queue and the drop is reported later."""
+        log_queue = queue.Queue(maxsize=2)
+        handler = DroppingQueueHandler(log_queue, block_timeout=0.01)
+
+        for i in range(3):
+            handler.handle(make_record(logging.INFO, f'info {i}'))
+        handler.handle(make_record(logging.ERROR, 'error'))
+
+        assert handler.dropped == 2
+        assert [log_queue.get_nowait().getMessage() for _ in range(2)] == ['info 0', 'info 1']
+
+        handler.handle(make_record(logging.INFO, 'after'))
+
+        assert log_queue.get_nowait().getMessage() == 'after'
+        notice = log_queue.get_nowait()
+        assert notice.levelno == logging.WARNING
+        assert 'dropped 2 records' in notice.getMessage()
+
+    def test_drop_count_is_thread_safe(self):
+        """Test concurrent drops are all counted and reported once."""
+        log_queue = queue.Queue(maxsize=2)
+        for _ in range(2):
+            log_queue.put_nowait(make_record(logging.INFO, 'filler'))
+        handler = DroppingQueueHandler(log_queue, block_timeout=0.01)
+
+        def flood():
+            for _ in range(500):
+                handler.emit(make_record(logging.INFO, 'flood'))
+
+        threads = [threading.Thread(target=flood) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert handler.dropped == 4000
+
+        for _ in range(2):
+            log_queue.get_nowait()
+        handler.emit(make_record(logging.INFO, 'after'))
+
+        assert log_queue.get_nowait().getMessage() == 'after'
+
+        assert log_queue.get_nowait().getMessage() == 'Log queue full - dropped 4000 records'
+
+
+class TestLoggerLevels:
+    """Test named loggers keep their own level under a stricter root level."""
+
+    @pytest.fixture
+    def restore_logging(self):
+        root = logging.getLogger()
+        handlers, level = root.handlers[:], root.level
+        named = {name: logging.getLogger(name).level for name in ('requests', 'services.other')}
+        yield
+        root.handlers[:] = handlers
+        root.setLevel(level)
+        for name, named_level in named.items():
+            logging.getLogger(name).setLevel(named_level)
+
+    def test_request_summaries_survive_warning_root(self, restore_logging, capsys):
+        """Test INFO records pass on a named logger and are still dropped elsewhere."""
+        setup_logging(log_level='WARNING', enable_file=False, logger_levels={'requests': 'INFO'})
+
+        logging.getLogger('requests').info('Request complete')
+        logging.getLogger('services.other').info('routine detail')
+
+        output = capsys.readouterr().out
+        assert 'Request complete' in output
+        assert 'routine detail' not in output
@@ -0,0 +1,110 @@
+# tests/unit/test_match_projection.py
+"""
+Unit tests for match-v5 projection.
+"""
+
+import json
+import pytest
+
+from app.services.match_projection import (
+    pack_match,
+    unpack_match,
+    load_record,
+    record_participants,
+    record_game_creation,
+    RECORD_VERSION
+)
+
+
+@pytest.fixture
+def full_match(mock_match_data):
+    """Match with the bulky fields real payloads carry."""
+    participant = mock_match_data['info']['participants'][0]
+    participant['challenges'] = {f'stat{i}': i / 3 for i in range(100)}
+    participant['missions'] = {'playerScore0': 1.0}
+    participant['perks'] = {
+        'statPerks': {'defense': 5002, 'flex': 5008, 'offense': 5005},
+        'styles': [
+            {'style': 8000, 'selections': [{'perk': 8010, 'var1': 1}, {'perk': 9111, 'var1': 2}]},
+            {'style': 8400, 'selections': [{'perk': 8444, 'var1': 3}]}
+        ]
+    }
+    return mock_match_data
+
+
+class TestPackMatch:
+    """Test projection round-trip."""
+
+    def test_round_trip_keeps_used_fields(self, full_match):
+        """Test fields read by the renderers survive projection."""
+        slim = unpack_match(pack_match(full_match))
+        original = full_match['info']['participants'][0]
+        participant = slim['info']['participants'][0]
+
+        assert slim['metadata']['matchId'] == 'EUW1_1234567890'
+        assert slim['info']['queueId'] == 420
+        assert slim['info']['gameDuration'] == 1800
+        for key in ('puuid', 'riotIdGameName', 'championName', 'kills', 'item6', 'summoner2Id', 'win'):
+            assert participant[key] == original[key]
+
+        assert slim['info']['teams'][0]['win'] is True
+        assert slim['info']['teams'][0]['objectives']['dragon']['kills'] == 3
+        assert [ban['championId'] for ban in slim['info']['teams'][0]['bans']] == [157, 238]
+
+    def test_drops_unused_fields(self, full_match):
+        """Test challenges, missions and stat shards are not kept."""
+        participant = unpack_match(pack_match(full_match))['info']['participants'][0]
+
+        assert 'challenges' not in participant
+        assert 'missions' not in participant
+        assert 'statPerks' not in participant['perks']
+
+    def test_perks_keep_styles_and_selections(self, full_match):
+        """Test rune styles and selected perks are kept."""
+        perks = unpack_match(pack_match(full_match))['info']['participants'][0]['perks']
+
+        assert perks['styles'][0]['style'] == 8000
+        assert perks['styles'][0]['selections'][0]['perk'] == 8010
+        assert perks['styles'][1]['style'] == 8400
+
+    def test_missing_fields_are_omitted(self, mock_match_data):
+        """Test absent fields stay absent so .get() defaults still apply."""
+        participant = unpack_match(pack_match(mock_match_data))['info']['participants'][0]
+
+        assert 'pentaKills' not in participant
+        assert 'perks' not in participant
+
+    def test_packed_record_is_smaller(self, full_match):
+        """Test the packed form is much smaller than the raw payload."""
+        assert len(json.dumps(pack_match(full_match))) * 3 < len(json.dumps(full_match))
+
+    def test_unpack_none(self):
+        """Test missing matches stay None."""
+        assert unpack_match(None) is None
+
+
+class TestLoadRecord:
+    """Test normalizing stored values."""
+
+    def test_json_form(self, mock_match_data):
+        """Test records decoded from JSON become tuples again."""
+        record = pack_match(mock_match_data)
+
+        assert load_record(json.loads(json.dumps(record))) == record
+
+    def test_raw_payload(self, mock_match_data):
+        """Test raw payloads cached before projection are packed."""
+        assert load_record(mock_match_data) == pack_match(mock_match_data)
+
+    def test_other_version_is_discarded(self, mock_match_data):
+        """Test records from another layout are treated as missing."""
+        record = (RECORD_VERSION + 1,) + pack_match(mock_match_data)[1:]
+
+        assert load_record(record) is None
+
+    def test_accessors(self, mock_match_data):
+        """Test index accessors used by the match store."""
+        record = pack_match(mock_match_data)
+
+        assert record_participants(record) == ['puuid1']
+        assert record_game_creation(record) == 1640000000000
@@ -0,0 +1,102 @@
+# tests/unit/test_metrics.py
+"""
+Unit tests for Prometheus metrics.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+prometheus_client = pytest.importorskip('prometheus_client')
+
+from prometheus_client import REGISTRY, CollectorRegistry, multiprocess
+
+from app.services.metrics import metrics
+from app.services.riot_api import RiotAPIError, make_api_request
+
+URL = 'https://europe.api.riotgames.com/lol/match/v5/matches/EUW1_1'
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestMetricsEndpoint:
+    """Test request recording and exposition."""
+
+    def test_request_latency_by_endpoint(self, client):
+        """Test served requests land in the per-endpoint histogram."""
+        labels = {'endpoint': 'main.index', 'method': 'GET', 'status': '200'}
+        before = sample('clashfinder_request_duration_seconds_count', **labels)
+
+        client.get('/')
+        response = client.get('/metrics')
+
+        assert response.status_code == 200
+        assert sample('clashfinder_request_duration_seconds_count', **labels) == before + 1
+        assert b'clashfinder_request_duration_seconds_bucket{endpoint="main.index"' in response.data
+
+
+class TestRiotCallMetrics:
+    """Test outbound call counters."""
+
+    @pytest.fixture(autouse=True)
+    def enabled(self, app_context):
+        previous, metrics.enabled = metrics.enabled, True
+        yield
+        metrics.enabled = previous
+
+    def test_counts_by_status(self):
+        """Test calls are counted by host, method and status and leave nothing in flight."""
+        labels = {'host': 'europe.api.riotgames.com', 'method': 'match-v5.match', 'status': '200'}
+        calls_before = sample('clashfinder_riot_calls_total', **labels)
+        durations_before = sample('clashfinder_riot_call_duration_seconds_count', **labels)
+        response = MagicMock(status_code=200, headers={}, content=b'{}')
+        response.json.return_value = {}
+
+        with patch('app.services.riot_api.session_pool.get', return_value=response):
+            make_api_request(URL)
+
+        assert sample('clashfinder_riot_calls_total', **labels) == calls_before + 1
+        assert sample('clashfinder_riot_call_duration_seconds_count', **labels) == durations_before + 1
+        assert sample('clashfinder_riot_fetches_in_flight', host='europe.api.riotgames.com') == 0
+
+    def test_errors_labelled_by_exception(self):
+        """Test a failed call is recorded under the exception name."""
+        import requests
+
+        labels = {'host': 'europe.api.riotgames.com', 'method': 'match-v5.match', 'status': 'ConnectionError'}
+        before = sample('clashfinder_riot_calls_total', **labels)
+
+        with patch('app.services.riot_api.session_pool.get', side_effect=requests.exceptions.ConnectionError()):
+            with pytest.raises(RiotAPIError):
+                make_api_request(URL)
+
+        assert sample('clashfinder_riot_calls_total', **labels) == before + 1
+
+
+class TestMultiprocess:
+    """Test aggregation across worker processes."""
+
+    def test_workers_are_summed(self, tmp_path):
+        """Test samples written by separate processes are merged by the collector."""
+        script = (
+            "from app.services.metrics import metrics, observe_riot_call\n"
+            "metrics.enabled = True\n"
+            "observe_riot_call('europe.api.riotgames.com', 'match-v5.match', 200, 0.1)\n"
+        )
+        env = dict(os.environ, PROMETHEUS_MULTIPROC_DIR=str(tmp_path))
+        for _ in range(2):
+            subprocess.run([sys.executable, '-c', script], cwd=PROJECT_ROOT, env=env, check=True)
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry, path=str(tmp_path))
+
+        labels = {'host': 'europe.api.riotgames.com', 'method': 'match-v5.match', 'status': '200'}
+        assert registry.get_sample_value('clashfinder_riot_calls_total', labels) == 2
+        assert registry.get_sample_value('clashfinder_riot_call_duration_seconds_count', labels) == 2
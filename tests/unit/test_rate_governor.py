@@ -0,0 +1,138 @@
+# tests/unit/test_rate_governor.py
+"""
+Unit tests for the outbound Riot rate governor.
+"""
+
+import asyncio
+import sys
+
+import pytest
+
+from app.services.api.rate_governor import RateGovernor, parse_rate_limit
+
+governor_module = sys.modules['app.services.api.rate_governor']
+
+HOST = 'europe.api.riotgames.com'
+MATCH = 'match-v5.match'
+
+
+class FakeClock:
+    """Stands in for the time module: monotonic() is set by the test, sleep() advances it."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable clock for the governor."""
+    fake = FakeClock()
+    monkeypatch.setattr(governor_module, 'time', fake)
+    return fake
+
+
+@pytest.fixture
+def governor(clock):
+    """Governor with a small application limit."""
+    return RateGovernor(app_limits='3:10', margin=0.0, max_wait=0.0)
+
+
+class TestParseRateLimit:
+    """Test header parsing."""
+
+    def test_limit_header(self):
+        """Test multi-window limit header."""
+        assert parse_rate_limit('20:1,100:120') == [(20, 1), (100, 120)]
+
+    def test_invalid_header(self):
+        """Test missing or malformed headers."""
+        assert parse_rate_limit(None) == []
+        assert parse_rate_limit('abc, 5:1') == [(5, 1)]
+
+
+class TestClassify:
+    """Test URL to scope mapping."""
+
+    def test_match_endpoints(self):
+        """Test match endpoints map to separate methods."""
+        base = f'https://{HOST}/lol/match/v5/matches'
+
+        assert RateGovernor.classify(f'{base}/EUW1_1') == (HOST, 'match-v5.match')
+        assert RateGovernor.classify(f'{base}/by-puuid/abc/ids') == (HOST, 'match-v5.ids-by-puuid')
+
+    def test_host_prefixed_base_url(self):
+        """Test URLs built from a RIOT_API_BASE_URL with a path prefix."""
+        assert RateGovernor.classify('http://127.0.0.1:8000/europe/lol/match/v5/matches/X')[1] == MATCH
+
+
+class TestReserve:
+    """Test token accounting."""
+
+    def test_app_limit_blocks(self, governor):
+        """Test calls beyond the application limit must wait."""
+        assert [governor.reserve(HOST, MATCH) for _ in range(3)] == [0.0, 0.0, 0.0]
+
+        assert governor.reserve(HOST, MATCH) > 0
+        assert governor.acquire(HOST, MATCH) is False
+        assert governor.get_stats()['rejected'] == 1
+
+    def test_hosts_are_independent(self, governor):
+        """Test each routing host has its own application budget."""
+        for _ in range(3):
+            governor.reserve(HOST, MATCH)
+
+        assert governor.reserve('americas.api.riotgames.com', MATCH) == 0.0
+
+    def test_learns_limits_from_headers(self, governor):
+        """Test method limits and counts are adopted from a response."""
+        governor.update(HOST, MATCH, {
+            'X-App-Rate-Limit': '100:10',
+            'X-App-Rate-Limit-Count': '1:10',
+            'X-Method-Rate-Limit': '2:10',
+            'X-Method-Rate-Limit-Count': '2:10'
+        })
+
+        # Riot says the method window is already spent
+        assert governor.reserve(HOST, MATCH) > 0
+        assert governor.reserve(HOST, 'match-v5.ids-by-puuid') == 0.0
+
+        stats = governor.get_stats()
+        assert stats['app'][HOST][0]['limit'] == '100:10'
+        assert stats['methods'][f'{HOST} {MATCH}'][0]['used'] == 2
+
+    def test_throttle_after_429(self, governor):
+        """Test a 429 holds back only the reported scope."""
+        governor.throttle(HOST, MATCH, retry_after=5, limit_type='method')
+
+        assert governor.reserve(HOST, MATCH) == 5
+        assert governor.reserve(HOST, 'match-v5.ids-by-puuid') == 0.0
+
+    def test_waits_for_window_reset(self, clock):
+        """Test acquire sleeps until budget frees up."""
+        governor = RateGovernor(app_limits='1:1', margin=0.0, max_wait=2.0)
+        start = clock.now
+
+        assert governor.acquire(HOST, MATCH) is True
+        assert governor.acquire(HOST, MATCH) is True
+
+        assert clock.now == start + 1
+        assert governor.get_stats()['delayed'] == 1
+
+    def test_acquire_async(self, governor):
+        """Test the async path shares the same buckets."""
+        for _ in range(3):
+            governor.reserve(HOST, MATCH)
+
+        assert asyncio.run(governor.acquire_async(HOST, MATCH)) is False
+
+    def test_disabled(self):
+        """Test a disabled governor never delays calls."""
+        governor = RateGovernor(app_limits='1:10', enabled=False)
+
+        assert all(governor.reserve(HOST, MATCH) == 0.0 for _ in range(5))
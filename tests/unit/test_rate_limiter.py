@@ -0,0 +1,129 @@
+# tests/unit/test_rate_limiter.py
+"""
+Unit tests for the in-memory GCRA rate limiter.
+"""
+
+import sys
+
+import pytest
+
+from app.services.rate_limiter import InMemoryRateLimiter
+
+# The package re-exports the ``rate_limiter`` instance under the module's name
+limiter_module = sys.modules['app.services.rate_limiter']
+
+KEY = '127.0.0.1:player.player_stats'
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock."""
+    now = [1000.0]
+    monkeypatch.setattr(limiter_module.time, 'monotonic', lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def limiter():
+    return InMemoryRateLimiter(stripes=4)
+
+
+class TestCheckLimits:
+    """Test GCRA accounting."""
+
+    def test_burst_then_deny(self, limiter, clock):
+        """Test a full burst is allowed and the next request is denied."""
+        results = [limiter.check_rate_limit(KEY, 3, 60)[0] for _ in range(4)]
+        assert results == [True, True, True, False]
+
+        allowed, info = limiter.check_rate_limit(KEY, 3, 60)
+        assert allowed is False
+        assert info['retry_after'] == 20
+
+    def test_no_double_burst_at_window_edge(self, limiter, clock):
+        """Test tokens come back one interval at a time, not all at once."""
+        for _ in range(3):
+            limiter.check_rate_limit(KEY, 3, 60)
+
+        clock[0] += 20
+        assert limiter.check_rate_limit(KEY, 3, 60)[0] is True
+        assert limiter.check_rate_limit(KEY, 3, 60)[0] is False
+
+    def test_minute_and_hour_together(self, limiter, clock):
+        """Test both windows are checked in one call and only counted when allowed."""
+        limits = ((2, 60), (3, 3600))
+
+        allowed, info = limiter.check_limits(KEY, limits)
+        assert allowed is True
+        assert info['windows'] == {60: 1, 3600: 2}
+
+        limiter.check_limits(KEY, limits)
+        allowed, info = limiter.check_limits(KEY, limits)
+        assert allowed is False
+        assert info['window'] == 60
+
+        # Denied request did not use hour budget
+        clock[0] += 60
+        assert limiter.check_limits(KEY, limits)[0] is True
+        allowed, info = limiter.check_limits(KEY, limits)
+        assert allowed is False
+        assert info['window'] == 3600
+
+    def test_status(self, limiter, clock):
+        """Test status reports remaining requests per window."""
+        limiter.check_limits(KEY, ((2, 60), (10, 3600)))
+
+        status = limiter.get_status(KEY)
+        assert status['is_active'] is True
+        assert status['windows'][60]['remaining'] == 1
+        assert status['windows'][3600]['remaining'] == 9
+
+
+class TestExpiry:
+    """Test incremental key expiry."""
+
+    def test_expired_keys_dropped(self, limiter, clock):
+        """Test idle keys are removed by later checks without a full scan."""
+        for i in range(50):
+            limiter.check_rate_limit(f'ip{i}', 5, 60)
+        assert len(limiter) == 50
+
+        clock[0] += 61
+        for i in range(50):
+            limiter.check_rate_limit(f'new{i}', 5, 60)
+
+        assert len(limiter) == 50
+        assert limiter.get_status('ip0')['is_active'] is False
+
+    def test_long_window_keys_do_not_block_expiry(self, limiter, clock):
+        """Test keys with an hour window do not hold back expiry of minute-window keys."""
+        for i in range(10):
+            limiter.check_rate_limit(f'hourly{i}', 5, 3600)
+        for i in range(50):
+            limiter.check_rate_limit(f'ip{i}', 5, 60)
+
+        clock[0] += 61
+        for i in range(50):
+            limiter.check_rate_limit(f'new{i}', 5, 60)
+
+        assert len(limiter) == 60
+        assert limiter.get_status('hourly0')['is_active'] is True
+
+
+class TestClientStatus:
+    """Test the per-client status report."""
+
+    def test_windows_share_one_schema(self, app, limiter, clock, monkeypatch):
+        """Test used and unused windows are reported with the same keys."""
+        monkeypatch.setattr(limiter_module.rate_limiter, 'backend', limiter)
+        limiter.check_limits(KEY, ((2, 60),))
+
+        with app.test_request_context(environ_base={'REMOTE_ADDR': '127.0.0.1'}):
+            status = limiter_module.get_rate_limit_status()
+
+        minute = status['endpoints']['player.player_stats']['minute']
+        hour = status['endpoints']['player.player_stats']['hour']
+        assert minute.keys() == hour.keys()
+        assert minute['is_active'] is True
+        assert minute['remaining'] == 1
+        assert hour == {'is_active': False, 'limit': None, 'remaining': None, 'seconds_until_full': 0}
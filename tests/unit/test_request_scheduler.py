@@ -0,0 +1,127 @@
+# tests/unit/test_request_scheduler.py
+"""
+Unit tests for the Riot request priority scheduler.
+"""
+
+import sys
+import threading
+import time
+from types import SimpleNamespace
+from typing import Callable
+
+import pytest
+
+from app.services.api.rate_governor import RateGovernor
+from app.services.api.request_scheduler import (
+    Priority,
+    RequestScheduler,
+    current_priority,
+    request_priority
+)
+
+HOST = 'europe.api.riotgames.com'
+MATCH = 'match-v5.match'
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """One controllable monotonic clock for the scheduler and its governor."""
+    now = [1000.0]
+    fake_time = SimpleNamespace(monotonic=lambda: now[0])
+    for module in ('app.services.api.rate_governor', 'app.services.api.request_scheduler'):
+        monkeypatch.setattr(sys.modules[module], 'time', fake_time)
+    return now
+
+
+def wait_until(condition: Callable[[], bool], timeout: float = 2.0):
+    """Poll until condition holds (threads here wait on real time, the clock does not move)."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+def make_scheduler(app_limits: str, max_wait: float = 0.0) -> RequestScheduler:
+    governor = RateGovernor(app_limits=app_limits, margin=0.0, max_wait=max_wait)
+    return RequestScheduler(governor, background_headroom=0.5)
+
+
+class TestPriorityContext:
+    """Test priority resolution."""
+
+    def test_default_outside_request(self):
+        """Test work outside a request is background."""
+        assert current_priority() == Priority.BACKGROUND
+
+    def test_default_inside_request(self, app):
+        """Test page loads are interactive."""
+        with app.test_request_context('/'):
+            assert current_priority() == Priority.INTERACTIVE
+
+    def test_override(self, app):
+        """Test explicit priority wins and is restored."""
+        with app.test_request_context('/'):
+            with request_priority(Priority.NORMAL):
+                assert current_priority() == Priority.NORMAL
+            assert current_priority() == Priority.INTERACTIVE
+
+
+class TestBackgroundHeadroom:
+    """Test background work leaves budget for page loads."""
+
+    def test_background_stops_early(self):
+        """Test background calls only use part of the window."""
+        scheduler = make_scheduler('4:10')
+
+        granted = [scheduler.acquire(HOST, MATCH, Priority.BACKGROUND) for _ in range(3)]
+        assert granted == [True, True, False]
+
+        assert scheduler.acquire(HOST, MATCH, Priority.INTERACTIVE) is True
+        assert scheduler.acquire(HOST, MATCH, Priority.INTERACTIVE) is True
+        assert scheduler.acquire(HOST, MATCH, Priority.INTERACTIVE) is False
+
+        classes = scheduler.get_stats()['classes']
+        assert classes['background']['granted'] == 2
+        assert classes['background']['rejected'] == 1
+        assert classes['interactive']['granted'] == 2
+
+
+class TestPriorityOrder:
+    """Test queued callers are admitted by priority."""
+
+    def test_interactive_jumps_queue(self, clock):
+        """Test an interactive call queued later is admitted first."""
+        scheduler = make_scheduler('1:1', max_wait=3.0)
+        scheduler.background_headroom = 0.0
+        assert scheduler.acquire(HOST, MATCH, Priority.INTERACTIVE)
+
+        order = []
+
+        def call(priority):
+            if scheduler.acquire(HOST, MATCH, priority):
+                order.append(priority)
+
+        def queue_depth(name):
+            return scheduler.get_stats()['classes'][name]['queue_depth']
+
+        background = threading.Thread(target=call, args=(Priority.BACKGROUND,))
+        background.start()
+        wait_until(lambda: queue_depth('background') == 1)
+        interactive = threading.Thread(target=call, args=(Priority.INTERACTIVE,))
+        interactive.start()
+        wait_until(lambda: queue_depth('interactive') == 1)
+
+        # Each window reset admits one caller, most urgent first
+        clock[0] += 1
+        interactive.join(2)
+        assert order == [Priority.INTERACTIVE]
+        assert queue_depth('background') == 1
+
+        clock[0] += 1
+        background.join(2)
+        assert order == [Priority.INTERACTIVE, Priority.BACKGROUND]
+
+        classes = scheduler.get_stats()['classes']
+        assert classes['background']['queue_depth'] == 0
+        assert classes['interactive']['max_wait_ms'] == 1000
+        assert classes['background']['max_wait_ms'] == 2000
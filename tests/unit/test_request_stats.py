@@ -0,0 +1,127 @@
+# tests/unit/test_request_stats.py
+"""
+Unit tests for per-request accounting and the Riot call cap.
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.cache import SingleFlight
+from app.services.riot_api import CallBudgetExceeded, get_match_ids, make_api_request
+from app.utils.request_stats import begin_request, end_request, timed
+
+URL = 'https://europe.api.riotgames.com/lol/match/v5/matches/EUW1_1'
+
+
+@pytest.fixture
+def ok_response():
+    response = MagicMock(status_code=200, headers={}, content=b'{}')
+    response.json.return_value = {}
+    return response
+
+
+class TestCallCap:
+    """Test the per-request Riot call cap."""
+
+    def test_refuses_past_cap_without_network(self, app_context, ok_response):
+        """Test calls past the cap fail fast and never reach the session."""
+        stats = begin_request(riot_call_limit=2)
+        try:
+            with patch('app.services.riot_api.session_pool.get', return_value=ok_response) as get:
+                make_api_request(URL)
+                make_api_request(URL)
+                with pytest.raises(CallBudgetExceeded):
+                    make_api_request(URL)
+        finally:
+            end_request()
+
+        assert get.call_count == 2
+        assert stats['riot_calls'] == 2
+        assert stats['riot_calls_refused'] == 1
+
+    def test_no_cap_by_default(self, app_context, ok_response):
+        """Test requests without a cap are only counted."""
+        stats = begin_request()
+        try:
+            with patch('app.services.riot_api.session_pool.get', return_value=ok_response):
+                for _ in range(5):
+                    make_api_request(URL)
+        finally:
+            end_request()
+
+        assert stats['riot_calls'] == 5
+        assert stats.as_dict()['riot_ms'] >= 0
+
+    def test_capped_result_not_cached(self, app, app_context, ok_response):
+        """Test a capped request does not leave an empty result for the next one."""
+        ok_response.json.return_value = ['EUW1_1', 'EUW1_2']
+
+        with patch.dict(app.config, {'RIOT_API_KEY': 'test-key'}), \
+                patch('app.services.riot_api.session_pool.get', return_value=ok_response) as get:
+            begin_request(riot_call_limit=1)
+            try:
+                make_api_request(URL)
+                with pytest.raises(CallBudgetExceeded):
+                    get_match_ids('puuid-capped', 'EUW')
+            finally:
+                end_request()
+
+            begin_request()
+            try:
+                assert get_match_ids('puuid-capped', 'EUW') == ['EUW1_1', 'EUW1_2']
+            finally:
+                end_request()
+
+        # One call spent before the cap, one by the uncapped request
+        assert get.call_count == 2
+
+    def test_single_flight_waiters_not_given_leaders_cap(self):
+        """Test waiters recompute when the leader only failed on its own cap."""
+        group = SingleFlight()
+        leader_started = threading.Event()
+        release_leader = threading.Event()
+        results = []
+
+        def capped():
+            leader_started.set()
+            release_leader.wait(5)
+            raise CallBudgetExceeded("cap")
+
+        def leader():
+            with pytest.raises(CallBudgetExceeded):
+                group.do('key', capped)
+
+        leader_thread = threading.Thread(target=leader)
+        leader_thread.start()
+        leader_started.wait(5)
+
+        waiter = threading.Thread(target=lambda: results.append(group.do('key', lambda: 'fresh')))
+        waiter.start()
+        while group.coalesced == 0:
+            threading.Event().wait(0.001)
+        release_leader.set()
+
+        leader_thread.join(5)
+        waiter.join(5)
+
+        assert results == ['fresh']
+
+
+class TestServerTiming:
+    """Test the breakdown returned to clients."""
+
+    def test_timers_and_header(self, client):
+        """Test rendered pages report template time and call counts."""
+        response = client.get('/')
+        header = response.headers['Server-Timing']
+
+        assert 'render;dur=' in header
+        assert 'riot-calls;desc="0"' in header
+        assert header.endswith(tuple('0123456789'))
+
+    def test_timed_outside_request_is_noop(self):
+        """Test timers can be used outside a request."""
+        with timed('sleep'):
+            pass
@@ -0,0 +1,111 @@
+# tests/unit/test_request_trace.py
+"""
+Unit tests for sampled Riot request tracing.
+"""
+
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.api.request_trace import REDACTED, RequestTracer, request_tracer
+from app.services.riot_api import make_api_request
+
+URL = 'https://europe.api.riotgames.com/lol/match/v5/matches/EUW1_1'
+API_KEY = 'RGAPI-secret-test-key'
+
+
+def make_response(status: int = 200) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status
+    response.content = b'{"metadata": {}}'
+    response.json.return_value = {'metadata': {}}
+    response.headers = {
+        'X-App-Rate-Limit': '20:1,100:120',
+        'X-App-Rate-Limit-Count': '1:1,1:120',
+        'Content-Type': 'application/json'
+    }
+    return response
+
+
+@pytest.fixture
+def records():
+    """Enable full sampling and collect trace records."""
+    collected = []
+    request_tracer.enabled = True
+    request_tracer.sample_rate = 1.0
+    request_tracer.add_hook(collected.append)
+
+    yield collected
+
+    request_tracer.remove_hook(collected.append)
+    request_tracer.enabled = False
+
+
+class TestRequestTracer:
+    """Test sampling and record contents."""
+
+    def test_disabled_by_default(self):
+        """Test a default tracer records nothing."""
+        tracer = RequestTracer()
+
+        assert tracer.begin(URL, 'match-v5.match', {'X-Riot-Token': API_KEY}) is None
+
+    def test_sample_rate(self):
+        """Test roughly sample_rate of calls are traced."""
+        tracer = RequestTracer(enabled=True, sample_rate=0.1)
+        tracer._random.seed(1)
+
+        sampled = sum(tracer.begin(URL, 'match-v5.match') is not None for _ in range(2000))
+
+        assert 120 < sampled < 280
+
+    def test_record(self, app_context, records, caplog):
+        """Test a traced call carries timing and rate limit headers but no key."""
+        with patch('app.services.riot_api.session_pool.get', return_value=make_response()), \
+                caplog.at_level(logging.DEBUG):
+            make_api_request(URL, headers={'X-Riot-Token': API_KEY})
+
+        assert len(records) == 1
+        record = records[0]
+        assert record['method'] == 'match-v5.match'
+        assert record['status'] == 200
+        assert record['duration_ms'] >= 0
+        assert record['rate_limit'] == {
+            'X-App-Rate-Limit': '20:1,100:120',
+            'X-App-Rate-Limit-Count': '1:1,1:120'
+        }
+        assert record['request_headers'] == {'X-Riot-Token': REDACTED}
+
+        assert API_KEY not in caplog.text
+
+    def test_error_recorded(self, app_context, records):
+        """Test failed calls are traced with the error."""
+        import requests
+
+        with patch('app.services.riot_api.session_pool.get', side_effect=requests.exceptions.Timeout):
+            with pytest.raises(Exception):
+                make_api_request(URL, headers={'X-Riot-Token': API_KEY})
+
+        assert records[0]['error'] == 'timeout'
+        assert 'status' not in records[0]
+
+    def test_logged_under_warning_log_level(self):
+        """Test enabling tracing keeps trace records at a WARNING root level."""
+        from app import create_app
+        from config.base import TestingConfig
+
+        trace_logger = logging.getLogger('riot.trace')
+        level = trace_logger.level
+        try:
+            with patch.object(TestingConfig, 'LOG_LEVEL', 'WARNING'), \
+                    patch.object(TestingConfig, 'RIOT_TRACE_ENABLED', True):
+                create_app('testing')
+
+            assert logging.getLogger().level == logging.WARNING
+            assert trace_logger.isEnabledFor(logging.INFO)
+            assert all(handler.level <= logging.INFO for handler in logging.getLogger().handlers
+                       if handler.level < logging.ERROR)
+        finally:
+            trace_logger.setLevel(level)
+            request_tracer.enabled = False
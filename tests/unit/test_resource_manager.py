@@ -0,0 +1,133 @@
+# tests/unit/test_resource_manager.py
+"""
+Unit tests for ResourceManager lookups and game data snapshots.
+"""
+
+import contextvars
+import dataclasses
+import gc
+import json
+
+import pytest
+
+from app.services.resource_manager import ResourceManager
+
+
+def write_resources(data_dir, champion_name='Aatrox'):
+    (data_dir / 'champions.json').write_text(json.dumps({'data': {
+        champion_name: {'id': champion_name, 'key': '266', 'name': champion_name},
+        'Ahri': {'id': 'Ahri', 'key': '103', 'name': 'Ahri'}
+    }}))
+    (data_dir / 'summoner_spells.json').write_text(json.dumps({'data': {
+        'SummonerFlash': {'id': 'SummonerFlash', 'key': '4', 'name': 'Flash'}
+    }}))
+    (data_dir / 'runes.json').write_text(json.dumps([
+        {'id': 8000, 'name': 'Precision', 'slots': [
+            {'runes': [{'id': 8010, 'name': 'Conqueror'}]}
+        ]}
+    ]))
+
+
+@pytest.fixture
+def manager(tmp_path):
+    write_resources(tmp_path)
+    return ResourceManager(str(tmp_path))
+
+
+class TestLookups:
+    """Test indexed lookups."""
+
+    def test_by_id(self, manager):
+        """Test champions, spells, rune trees and runes resolve by numeric ID."""
+        assert manager.get_champion_name(266) == 'Aatrox'
+        assert manager.get_summoner_spell_name(4) == 'Flash'
+        assert manager.get_rune_name(8000) == 'Precision'
+        assert manager.get_rune_name(8010) == 'Conqueror'
+
+    def test_unknown_ids(self, manager):
+        """Test unknown IDs fall back as before."""
+        assert manager.get_champion_by_id(1) is None
+        assert manager.get_champion_name(1) == 'Champion1'
+        assert manager.get_rune_by_id(1) is None
+
+    def test_reload_rebuilds_indexes(self, manager, tmp_path):
+        """Test reload_all swaps data and indexes together."""
+        assert manager.get_champion_name(266) == 'Aatrox'
+
+        write_resources(tmp_path, champion_name='Renamed')
+        manager.reload_all()
+
+        assert manager.get_champion_name(266) == 'Renamed'
+        assert manager.load_champions()['data']['Renamed']['key'] == '266'
+
+
+class TestSnapshots:
+    """Test snapshot publication and pinning."""
+
+    def test_pinned_request_keeps_its_snapshot(self, manager, tmp_path):
+        """Test a reload during a request is only seen by later requests."""
+        ctx = contextvars.copy_context()
+        ctx.run(manager.pin)
+
+        write_resources(tmp_path, champion_name='Renamed')
+        manager.reload_all('99.1.1')
+
+        assert ctx.run(manager.get_champion_name, 266) == 'Aatrox'
+        assert manager.get_champion_name(266) == 'Renamed'
+        assert manager.get_data_version() == '99.1.1'
+
+    def test_old_snapshot_freed_after_unpin(self, manager):
+        """Test a replaced snapshot is released once no request pins it."""
+        ctx = contextvars.copy_context()
+        ctx.run(manager.pin)
+        manager.reload_all()
+
+        assert manager.get_stats()['live_snapshots'] == 2
+
+        ctx.run(manager.unpin)
+        gc.collect()
+
+        assert manager.get_stats()['live_snapshots'] == 1
+
+    def test_snapshot_is_immutable(self, manager):
+        """Test snapshot fields cannot be rebound."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            manager.snapshot.version = 'x'
+
+
+class TestCompiledGameData:
+    """Test snapshots mapped from the compiled game data file."""
+
+    def test_lookups_match_json(self, manager, tmp_path):
+        """Test a compiled snapshot answers lookups like the JSON one."""
+        manager.compile_game_data('15.1.1')
+        compiled = ResourceManager(str(tmp_path))
+
+        assert compiled.snapshot.source == 'game_data.bin'
+        assert compiled.get_champion_name(266) == 'Aatrox'
+        assert compiled.get_summoner_spell_name(4) == 'Flash'
+        assert compiled.get_rune_name(8010) == 'Conqueror'
+        assert compiled.get_champion_by_id(1) is None
+        assert compiled.get_champion_by_id('266') is None
+        assert compiled.get_champion_by_id(266) is compiled.get_champion_by_id(266)
+        assert compiled.load_champions() == manager.load_champions()
+        assert sorted(compiled.snapshot.champions_by_id) == [103, 266]
+
+    def test_stale_file_ignored(self, manager, tmp_path):
+        """Test JSON files changed after compiling are loaded instead."""
+        manager.compile_game_data()
+        write_resources(tmp_path, champion_name='Renamed')
+
+        manager.reload_all()
+
+        assert manager.snapshot.source == 'json'
+        assert manager.get_champion_name(266) == 'Renamed'
+
+    def test_corrupt_file_ignored(self, manager, tmp_path):
+        """Test an unreadable compiled file falls back to JSON."""
+        (tmp_path / 'game_data.bin').write_bytes(b'not game data')
+
+        manager.reload_all()
+
+        assert manager.snapshot.source == 'json'
+        assert manager.get_champion_name(266) == 'Aatrox'
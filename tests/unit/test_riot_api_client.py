@@ -0,0 +1,53 @@
+# tests/unit/test_riot_api_client.py
+"""
+Unit tests for the low-level Riot API client's retry handling.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.api.rate_governor import rate_governor
+from app.services.api.riot_api_client import RiotAPIClient
+
+URL = 'https://europe.api.riotgames.com/lol/match/v5/matches/EUW1_1'
+
+
+def make_response(status: int, headers: dict = None) -> MagicMock:
+    response = MagicMock(status_code=status, headers=headers or {}, content=b'{}', text='')
+    response.json.return_value = {'ok': True}
+    return response
+
+
+@pytest.fixture
+def client():
+    return RiotAPIClient('RGAPI-test-key')
+
+
+class TestRateLimitRetry:
+    """Test a 429 is waited out before the retry."""
+
+    def test_sleeps_when_governor_disabled(self, client):
+        """Test Retry-After is slept when no governor holds the retry back."""
+        responses = [make_response(429, {'Retry-After': '2'}), make_response(200)]
+
+        with patch.object(rate_governor, 'enabled', False), \
+                patch.object(client.session, 'get', side_effect=responses) as get, \
+                patch('app.services.api.riot_api_client.time.sleep') as sleep:
+            assert client._make_request(URL) == {'ok': True}
+
+        assert get.call_count == 2
+        sleep.assert_called_once_with(2.0)
+
+    def test_governor_throttles_instead_of_sleeping(self, client):
+        """Test an enabled governor is told about the 429 and the client does not sleep itself."""
+        responses = [make_response(429, {'Retry-After': '2', 'X-Rate-Limit-Type': 'method'}), make_response(200)]
+
+        with patch.object(rate_governor, 'enabled', True), \
+                patch.object(rate_governor, 'throttle') as throttle, \
+                patch.object(client.session, 'get', side_effect=responses), \
+                patch('app.services.api.riot_api_client.time.sleep') as sleep:
+            assert client._make_request(URL) == {'ok': True}
+
+        throttle.assert_called_once_with('europe.api.riotgames.com', 'match-v5.match', 2.0, 'method')
+        sleep.assert_not_called()
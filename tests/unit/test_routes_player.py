@@ -0,0 +1,127 @@
+# tests/unit/test_routes_player.py
+"""
+Unit tests for player routes.
+"""
+
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app.routes import player as player_routes
+from app.services import riot_api
+
+
+@pytest.fixture
+def player_history(mock_account_data, mock_match_data):
+    """Ten-match history for the mocked account, with processing counted."""
+    mock_match_data['info']['participants'][0]['puuid'] = mock_account_data['puuid']
+    match_ids = [f'EUW1_{i}' for i in range(10)]
+
+    account = MagicMock(return_value=mock_account_data)
+    ids = MagicMock(return_value=match_ids)
+    process = MagicMock(wraps=riot_api.process_match_for_player)
+
+    # Routes import these names directly, so patch both modules
+    with patch.object(riot_api, 'get_account_info', account), \
+            patch.object(player_routes, 'get_account_info', account), \
+            patch.object(riot_api, 'get_match_ids', ids), \
+            patch.object(player_routes, 'get_match_ids', ids), \
+            patch.object(riot_api, 'process_match_for_player', process), \
+            patch.object(player_routes, 'process_match_for_player', process), \
+            patch.object(riot_api, 'get_match_details', return_value=mock_match_data) as details:
+        yield {'details': details, 'process': process}
+
+
+class TestLoadBatchRoute:
+    """Test progressive batch loading."""
+
+    def _load_page(self, client, batch_size=2, total=10):
+        """Request batches the way progressive-loader.js does."""
+        responses = []
+        offset = 0
+        while offset < total:
+            response = client.post('/player_stats/load_batch', json={
+                'SUMMONER_NAME': 'TestPlayer',
+                'SUMMONER_TAG': 'EUW1',
+                'server': 'EUW',
+                'offset': offset,
+                'batch_size': batch_size
+            })
+            data = response.get_json()
+            responses.append(data)
+            if not data.get('has_more'):
+                break
+            offset = data['offset']
+        return responses
+
+    def test_page_view_processes_each_match_once(self, client, player_history):
+        """Test a full progressive page view processes 10 matches, not 10 per batch."""
+        responses = self._load_page(client)
+
+        assert len(responses) == 5
+        assert sum(len(r['matches']) for r in responses) == 10
+        assert player_history['process'].call_count == 10
+        assert player_history['details'].call_count == 10
+
+    def test_batch_offsets_and_has_more(self, client, player_history):
+        """Test batch cursor fields."""
+        responses = self._load_page(client)
+
+        assert [r['offset'] for r in responses] == [2, 4, 6, 8, 10]
+        assert [r['has_more'] for r in responses] == [True, True, True, True, False]
+
+    def test_missing_parameters(self, client):
+        """Test batch request without player data."""
+        response = client.post('/player_stats/load_batch', json={})
+
+        assert response.status_code == 400
+
+
+class TestStreamRoute:
+    """Test streaming match cards."""
+
+    def test_ndjson_stream(self, client, player_history):
+        """Test one NDJSON event per card followed by a summary."""
+        response = client.get('/player_stats/stream?name=TestPlayer&tag=EUW1&server=EUW&count=10')
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        assert response.headers['X-Accel-Buffering'] == 'no'
+
+        events = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        cards = [e for e in events if e['type'] == 'match']
+
+        assert len(cards) == 10
+        assert sorted(e['index'] for e in cards) == list(range(10))
+        assert all('match-card' in e['html'] for e in cards)
+        assert events[-1] == {'type': 'done', 'loaded': 10, 'offset': 10, 'has_more': True}
+        assert player_history['process'].call_count == 10
+
+    def test_sse_stream(self, client, player_history):
+        """Test Server-Sent Events framing."""
+        response = client.get(
+            '/player_stats/stream?name=TestPlayer&tag=EUW1&server=EUW&count=10',
+            headers={'Accept': 'text/event-stream'}
+        )
+
+        body = response.get_data(as_text=True)
+
+        assert response.mimetype == 'text/event-stream'
+        assert body.count('event: match\n') == 10
+        assert body.endswith('\n\n')
+        assert 'event: done\ndata: ' in body
+
+    def test_player_not_found(self, client):
+        """Test error event when the account does not exist."""
+        with patch.object(player_routes, 'get_account_info', return_value=None):
+            response = client.get('/player_stats/stream?name=Nobody&tag=EUW1&server=EUW')
+
+        events = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+        assert events == [{'type': 'error', 'message': 'Player not found'}]
+
+    def test_missing_parameters(self, client):
+        """Test stream request without player data."""
+        response = client.get('/player_stats/stream')
+
+        assert response.status_code == 400